@@ -17,6 +17,10 @@ from src.core.infrastructure.database.schemas.activity import (
 )
 from src.core.infrastructure.database.schemas.base import BaseModel
 from src.core.infrastructure.database.schemas.buildings import Building
+from src.core.infrastructure.database.schemas.catalog import CatalogVersion
+from src.core.infrastructure.database.schemas.documents import (
+    OrganizationDocument,
+)
 from src.core.infrastructure.database.schemas.organizations import Organization
 from src.core.infrastructure.database.schemas.phones import PhoneNumber
 
@@ -51,6 +55,8 @@ def include_object(
         Activity.__tablename__,
         OrganizationActivity.__tablename__,
         PhoneNumber.__tablename__,
+        OrganizationDocument.__tablename__,
+        CatalogVersion.__tablename__,
     ):
         return False
     return True
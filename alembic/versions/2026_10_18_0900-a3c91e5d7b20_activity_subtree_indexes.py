@@ -0,0 +1,43 @@
+"""activity subtree indexes
+
+Revision ID: a3c91e5d7b20
+Revises: 5f63b3fc0613
+Create Date: 2026-10-18 09:00:12.418305
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3c91e5d7b20"
+down_revision: Union[str, None] = "5f63b3fc0613"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The subtree is resolved by a recursive CTE, depth is no longer capped.
+    op.drop_constraint("check_max_level", "activity", type_="check")
+    op.create_index(op.f("ix_activity_name"), "activity", ["name"])
+    op.create_index(op.f("ix_activity_parent_id"), "activity", ["parent_id"])
+    op.create_index(
+        op.f("ix_organization_activity_activity_id"),
+        "organization_activity",
+        ["activity_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_organization_activity_activity_id"),
+        table_name="organization_activity",
+    )
+    op.drop_index(op.f("ix_activity_parent_id"), table_name="activity")
+    op.drop_index(op.f("ix_activity_name"), table_name="activity")
+    op.create_check_constraint(
+        "check_max_level", "activity", sa.text("level <= 3")
+    )
@@ -0,0 +1,56 @@
+"""building location geography
+
+Revision ID: c7e2f4a9d615
+Revises: a3c91e5d7b20
+Create Date: 2026-10-18 09:30:41.902117
+
+"""
+
+from typing import Sequence, Union
+
+import geoalchemy2
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c7e2f4a9d615"
+down_revision: Union[str, None] = "a3c91e5d7b20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Radius search compares geography directly instead of reprojecting
+    # every building to 3857, so it is indexable and measured in meters.
+    op.add_column(
+        "building",
+        sa.Column(
+            "location_geog",
+            geoalchemy2.types.Geography(
+                geometry_type="POINT",
+                srid=4326,
+                spatial_index=False,
+                from_text="ST_GeogFromText",
+                name="geography",
+            ),
+            sa.Computed("location::geography", persisted=True),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "idx_building_location_geog",
+        "building",
+        ["location_geog"],
+        unique=False,
+        postgresql_using="gist",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_building_location_geog",
+        table_name="building",
+        postgresql_using="gist",
+    )
+    op.drop_column("building", "location_geog")
@@ -0,0 +1,39 @@
+"""organization name trigram index
+
+Revision ID: e41b8d2c9f37
+Revises: c7e2f4a9d615
+Create Date: 2026-10-18 10:00:27.551904
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e41b8d2c9f37"
+down_revision: Union[str, None] = "c7e2f4a9d615"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Must match schemas.organizations.search_key, or search won't use it.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_organization_name_trgm",
+        "organization",
+        [sa.text("replace(lower(name), 'ё', 'е') gin_trgm_ops")],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_organization_name_trgm",
+        table_name="organization",
+        postgresql_using="gin",
+    )
@@ -0,0 +1,142 @@
+"""organization document
+
+Revision ID: 9b4d7e2a1c58
+Revises: e41b8d2c9f37
+Create Date: 2026-10-18 11:00:12.480331
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b4d7e2a1c58"
+down_revision: Union[str, None] = "e41b8d2c9f37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Copied from the model at this revision, later changes of the document
+# need a migration of their own.
+REFRESH_DOCUMENTS = """
+CREATE OR REPLACE FUNCTION refresh_organization_documents(
+    ids integer[]
+) RETURNS void LANGUAGE sql AS $$
+INSERT INTO organization_document (organization_id, document)
+SELECT organization.id, CAST(json_build_object(
+    'id', organization.id,
+    'name', organization.name,
+    'building', json_build_object(
+        'id', building.id,
+        'address', building.address,
+        'location', json_build_object(
+            'longitude', ST_X(building.location),
+            'latitude', ST_Y(building.location)
+        )
+    ),
+    'phones', (
+        SELECT coalesce(
+            json_agg(
+                json_build_object('phone', phone_number.number)
+                ORDER BY phone_number.id
+            ),
+            '[]'::json
+        ) AS coalesce_1
+        FROM phone_number
+        WHERE phone_number.organization_id = organization.id
+    ),
+    'activity', (
+        SELECT coalesce(
+            json_agg(
+                json_build_object('name', activity.name)
+                ORDER BY activity.id
+            ),
+            '[]'::json
+        ) AS coalesce_2
+        FROM activity
+        JOIN organization_activity
+            ON organization_activity.activity_id = activity.id
+        WHERE organization_activity.organization_id = organization.id
+    )
+) AS TEXT) AS json_build_object_1
+FROM organization JOIN building ON organization.building_id = building.id
+WHERE organization.id = ANY (ids)
+ON CONFLICT (organization_id) DO UPDATE SET document = excluded.document
+$$
+"""
+
+DOCUMENT_TRIGGER = """
+CREATE OR REPLACE FUNCTION organization_document_trigger()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_TABLE_NAME = 'organization' THEN
+        PERFORM refresh_organization_documents(ARRAY[NEW.id]);
+    ELSIF TG_TABLE_NAME = 'building' THEN
+        PERFORM refresh_organization_documents(ARRAY(
+            SELECT id FROM organization WHERE building_id = NEW.id
+        ));
+    ELSIF TG_TABLE_NAME = 'activity' THEN
+        PERFORM refresh_organization_documents(ARRAY(
+            SELECT organization_id FROM organization_activity
+            WHERE activity_id = NEW.id
+        ));
+    ELSE
+        IF TG_OP <> 'INSERT' THEN
+            PERFORM refresh_organization_documents(
+                ARRAY[OLD.organization_id]
+            );
+        END IF;
+        IF TG_OP <> 'DELETE' THEN
+            PERFORM refresh_organization_documents(
+                ARRAY[NEW.organization_id]
+            );
+        END IF;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+TRIGGER_EVENTS = {
+    "organization": "INSERT OR UPDATE OF name, building_id",
+    "building": "UPDATE OF address, location",
+    "activity": "UPDATE OF name",
+    "phone_number": "INSERT OR UPDATE OR DELETE",
+    "organization_activity": "INSERT OR UPDATE OR DELETE",
+}
+
+
+def upgrade() -> None:
+    # Ready-to-serve OrganizationResponse JSON, kept current by triggers.
+    op.create_table(
+        "organization_document",
+        sa.Column("organization_id", sa.Integer(), nullable=False),
+        sa.Column("document", sa.Text(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["organization_id"], ["organization.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("organization_id"),
+    )
+    op.execute(REFRESH_DOCUMENTS)
+    op.execute(DOCUMENT_TRIGGER)
+    for table, events in TRIGGER_EVENTS.items():
+        op.execute(
+            f"CREATE TRIGGER {table}_document AFTER {events} ON {table} "
+            "FOR EACH ROW EXECUTE FUNCTION organization_document_trigger()"
+        )
+    op.execute(
+        "SELECT refresh_organization_documents(array_agg(id)) "
+        "FROM organization"
+    )
+
+
+def downgrade() -> None:
+    for table in TRIGGER_EVENTS:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_document ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS organization_document_trigger()")
+    op.execute(
+        "DROP FUNCTION IF EXISTS refresh_organization_documents(integer[])"
+    )
+    op.drop_table("organization_document")
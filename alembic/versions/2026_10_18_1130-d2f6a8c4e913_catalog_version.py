@@ -0,0 +1,78 @@
+"""catalog version
+
+Revision ID: d2f6a8c4e913
+Revises: 9b4d7e2a1c58
+Create Date: 2026-10-18 11:30:48.127605
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d2f6a8c4e913"
+down_revision: Union[str, None] = "9b4d7e2a1c58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Copied from the model at this revision.
+BUMP_VERSION = """
+CREATE OR REPLACE FUNCTION bump_catalog_version()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+    RETURN NULL;
+END
+$$
+"""
+
+CATALOG_TABLES = (
+    "organization",
+    "building",
+    "activity",
+    "phone_number",
+    "organization_activity",
+)
+
+
+def upgrade() -> None:
+    # Single row bumped once per statement writing the catalog, ETags
+    # of responses are derived from it.
+    #
+    # Every writing transaction updates this row, so it holds the row
+    # lock until it commits: writers of the catalog are serialized,
+    # however unrelated their rows. That is accepted for a catalog
+    # written rarely and in short transactions. A sequence would not
+    # serialize writers, but nextval() is not transactional: readers
+    # would see the new version before the data it stands for commits
+    # and cache the old data under it. The lock is taken by the first
+    # writing statement, so long writing transactions, e.g. bulk
+    # imports, block other writers the longest and should be split.
+    op.create_table(
+        "catalog_version",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.CheckConstraint("id = 1", name="catalog_version_one"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.execute(
+        "INSERT INTO catalog_version (id, version) VALUES (1, 0) "
+        "ON CONFLICT (id) DO NOTHING"
+    )
+    op.execute(BUMP_VERSION)
+    for table in CATALOG_TABLES:
+        op.execute(
+            f"CREATE TRIGGER {table}_version "
+            f"AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION bump_catalog_version()"
+        )
+
+
+def downgrade() -> None:
+    for table in CATALOG_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_version ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS bump_catalog_version()")
+    op.drop_table("catalog_version")
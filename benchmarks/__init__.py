@@ -0,0 +1 @@
+"""Benchmarks against a populated database."""
@@ -0,0 +1,144 @@
+"""Benchmark of fuzzy organization name search.
+
+Optionally seeds synthetic organizations first, inside a transaction
+that is rolled back unless ``--keep`` is given::
+
+    python -m benchmarks.name_search --seed 1000000 --iterations 500
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from src.core.configs.env import settings
+from src.core.infrastructure.database import db
+from src.core.infrastructure.database.schemas.organizations import Organization
+
+TARGET_MS = 10.0
+
+SEED_SQL = text("""
+    INSERT INTO organization (name, building_id)
+    SELECT
+        (array['ООО', 'АО', 'ИП', 'ПАО', 'ГК'])[1 + i % 5] || ' '
+        || initcap(md5(i::text)::varchar(6)) || ' '
+        || (array[
+               'Ёлка', 'Рога и копыта',
+               'Стройсервис', 'Мясокомбинат',
+               'Молочный двор', 'Автозапчасти',
+               'Почта', 'Пекарня'
+           ])[1 + i % 8] || ' ' || i,
+        (SELECT min(id) FROM building)
+    FROM generate_series(1, :count) AS i
+    """)
+
+
+def typo(word: str) -> str:
+    """Return the word with one character dropped.
+
+    :param word: Word.
+    :return: Word with a typo.
+    """
+    if len(word) < 5:
+        return word
+    position = random.randrange(1, len(word) - 1)
+    return word[:position] + word[position:][1:]
+
+
+async def sample_queries(conn: AsyncConnection, count: int) -> list[str]:
+    """Build search texts from random existing names.
+
+    Mixes exact words, changed case, ``е`` instead of ``ё`` and typos.
+
+    :param conn: Database connection.
+    :param count: Number of queries.
+    :return: Search texts.
+    """
+    names = (
+        await conn.execute(
+            select(Organization.name).order_by(func.random()).limit(count)
+        )
+    ).scalars()
+    queries = []
+    for name in names:
+        word = max(name.split(), key=len)
+        queries.append(
+            random.choice(
+                (word, word.upper(), word.replace("ё", "е"), typo(word))
+            )
+        )
+    return queries
+
+
+async def run(iterations: int, seed: int, keep: bool, limit: int) -> None:
+    """Seed, time searches and print latency against the target.
+
+    :param iterations: Number of queries.
+    :param seed: Number of synthetic organizations to insert.
+    :param keep: Commit the seeded organizations.
+    :param limit: Max organizations per search.
+    :return: None
+    """
+    engine = create_async_engine(settings.db.get_url_database)
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        if seed:
+            started = time.perf_counter()
+            await conn.execute(SEED_SQL, {"count": seed})
+            await conn.execute(text("ANALYZE organization"))
+            print(f"seeded {seed} in {time.perf_counter() - started:.1f} s")
+        total = await conn.scalar(select(func.count(Organization.id)))
+        queries = await sample_queries(conn, iterations)
+
+        timings: list[float] = []
+        found = 0
+        for query in queries:
+            stmt = db.org.search_statement(query, limit)
+            started = time.perf_counter()
+            found += len((await conn.execute(stmt)).all())
+            timings.append((time.perf_counter() - started) * 1000)
+
+        sql = db.org.search_statement(queries[0], limit).compile(
+            dialect=conn.dialect, compile_kwargs={"literal_binds": True}
+        )
+        plan = await conn.execute(text(f"EXPLAIN ANALYZE {sql}"))
+        timings.sort()
+        p99 = timings[int(len(timings) * 0.99)]
+        print(f"organizations: {total}, queries: {len(queries)}")
+        print("plan:\n  " + "\n  ".join(plan.scalars()))
+        print(
+            f"mean {statistics.mean(timings):.2f} ms, "
+            f"p50 {timings[len(timings) // 2]:.2f} ms, "
+            f"p95 {timings[int(len(timings) * 0.95)]:.2f} ms, "
+            f"p99 {p99:.2f} ms, "
+            f"rows per query {found / len(queries):.1f}"
+        )
+        verdict = "ok" if p99 < TARGET_MS else "FAIL"
+        print(f"target p99 < {TARGET_MS} ms: {verdict}")
+        if keep:
+            await transaction.commit()
+        else:
+            await transaction.rollback()
+    await engine.dispose()
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark.
+
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--keep", action="store_true")
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.iterations, args.seed, args.keep, args.limit))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Benchmark of radius search: Web Mercator reprojection vs geography.
+
+Run against a populated database::
+
+    python -m benchmarks.radius_search --iterations 200 --radius 1000
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import Callable
+
+from geoalchemy2.functions import ST_DWithin, ST_GeomFromText, ST_Transform
+from sqlalchemy import ColumnElement, Select, func, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from src.core.configs.env import settings
+from src.core.infrastructure.database import db
+from src.core.infrastructure.database.schemas.buildings import Building
+
+Predicate = Callable[[tuple[float, float], float], ColumnElement[bool]]
+
+
+def mercator_radius(
+    point: tuple[float, float], radius: float
+) -> ColumnElement[bool]:
+    """Build the previous predicate, reprojecting every row to 3857.
+
+    :param point: Point (longitude, latitude).
+    :param radius: Radius in Web Mercator meters.
+    :return: SQL predicate.
+    """
+    point_wkt = f"SRID=4326;POINT({point[0]} {point[1]})"
+    return ST_DWithin(
+        ST_Transform(Building.location, 3857),
+        ST_Transform(ST_GeomFromText(point_wkt), 3857),
+        radius,
+    )
+
+
+PREDICATES: dict[str, Predicate] = {
+    "mercator": mercator_radius,
+    "geography": db.location.in_radius,
+}
+
+
+async def random_points(
+    conn: AsyncConnection, count: int
+) -> list[tuple[float, float]]:
+    """Pick random points inside the extent of all buildings.
+
+    :param conn: Database connection.
+    :param count: Number of points.
+    :return: Points (longitude, latitude).
+    """
+    extent = func.ST_Extent(Building.location)
+    row = (
+        await conn.execute(
+            select(
+                func.ST_XMin(extent),
+                func.ST_XMax(extent),
+                func.ST_YMin(extent),
+                func.ST_YMax(extent),
+            )
+        )
+    ).one()
+    min_lon, max_lon, min_lat, max_lat = row
+    return [
+        (random.uniform(min_lon, max_lon), random.uniform(min_lat, max_lat))
+        for _ in range(count)
+    ]
+
+
+async def explain(conn: AsyncConnection, stmt: Select[tuple[int]]) -> str:
+    """Return the query plan on one line.
+
+    :param conn: Database connection.
+    :param stmt: Benchmarked select.
+    :return: Plan lines joined by ``|``.
+    """
+    sql = stmt.compile(
+        dialect=conn.dialect, compile_kwargs={"literal_binds": True}
+    )
+    rows = await conn.execute(text(f"EXPLAIN {sql}"))
+    return " | ".join(line.strip() for line in rows.scalars())
+
+
+async def run(iterations: int, radius: float) -> None:
+    """Time both predicates on the same points and compare results.
+
+    :param iterations: Number of queries per predicate.
+    :param radius: Search radius in meters.
+    :return: None
+    """
+    engine = create_async_engine(settings.db.get_url_database)
+    async with engine.connect() as conn:
+        points = await random_points(conn, iterations)
+        results: dict[str, list[set[int]]] = {}
+        for name, predicate in PREDICATES.items():
+            plan = await explain(
+                conn, select(Building.id).where(predicate(points[0], radius))
+            )
+            timings: list[float] = []
+            results[name] = []
+            for point in points:
+                stmt = select(Building.id).where(predicate(point, radius))
+                started = time.perf_counter()
+                ids = (await conn.execute(stmt)).scalars().all()
+                timings.append((time.perf_counter() - started) * 1000)
+                results[name].append(set(ids))
+            timings.sort()
+            print(f"{name}:")
+            print(f"  plan: {plan}")
+            print(
+                f"  mean {statistics.mean(timings):.2f} ms, "
+                f"p50 {timings[len(timings) // 2]:.2f} ms, "
+                f"p95 {timings[int(len(timings) * 0.95)]:.2f} ms"
+            )
+        differing = sum(
+            old != new
+            for old, new in zip(results["mercator"], results["geography"])
+        )
+        print(f"queries with different results: {differing}/{iterations}")
+    await engine.dispose()
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark.
+
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--radius", type=float, default=1000.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.iterations, args.radius))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Benchmark of per-request session setup, without database roundtrips.
+
+Compares a session of the shared sessionmaker with the previous setup,
+a new ``async_scoped_session`` per request, and with a new engine per
+request::
+
+    python -m benchmarks.session_setup --iterations 10000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from asyncio import current_task
+from typing import Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_scoped_session,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from src.core.configs.env import settings
+
+Setup = Callable[[], Awaitable[None]]
+
+
+async def new_engine() -> None:
+    """Open and close a session of a new engine.
+
+    :return: None
+    """
+    engine = create_async_engine(settings.db.get_url_database)
+    async with async_sessionmaker(engine, class_=AsyncSession)():
+        pass
+    await engine.dispose()
+
+
+def scoped_session(factory: async_sessionmaker[AsyncSession]) -> Setup:
+    """Build setup opening a new ``async_scoped_session`` per request.
+
+    :param factory: Sessionmaker of the shared engine.
+    :return: Setup.
+    """
+
+    async def setup() -> None:
+        scoped = async_scoped_session(factory, scopefunc=current_task)
+        async with scoped():
+            pass
+        await scoped.remove()
+
+    return setup
+
+
+def shared_factory(factory: async_sessionmaker[AsyncSession]) -> Setup:
+    """Build setup opening a session of the shared sessionmaker.
+
+    :param factory: Sessionmaker of the shared engine.
+    :return: Setup.
+    """
+
+    async def setup() -> None:
+        async with factory():
+            pass
+
+    return setup
+
+
+async def measure(setup: Setup, iterations: int) -> list[float]:
+    """Time the setup, each call in its own task like a request.
+
+    :param setup: Setup.
+    :param iterations: Number of calls.
+    :return: Sorted timings in microseconds.
+    """
+    timings: list[float] = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await asyncio.create_task(setup())
+        timings.append((time.perf_counter() - started) * 1_000_000)
+    timings.sort()
+    return timings
+
+
+async def run(iterations: int) -> None:
+    """Time each setup and print its latency.
+
+    :param iterations: Number of requests per setup.
+    :return: None
+    """
+    engine = create_async_engine(settings.db.get_url_database)
+    factory = async_sessionmaker(engine, class_=AsyncSession)
+    setups = {
+        "engine per request": new_engine,
+        "scoped session per request": scoped_session(factory),
+        "shared sessionmaker": shared_factory(factory),
+    }
+    for name, setup in setups.items():
+        # Engine creation is much slower, fewer calls are enough.
+        count = iterations // 10 if setup is new_engine else iterations
+        timings = await measure(setup, max(count, 1))
+        print(
+            f"{name}: mean {statistics.mean(timings):.1f} us, "
+            f"p50 {timings[len(timings) // 2]:.1f} us, "
+            f"p99 {timings[int(len(timings) * 0.99)]:.1f} us"
+        )
+    await engine.dispose()
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark.
+
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=10000)
+    args = parser.parse_args()
+    asyncio.run(run(args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,12 @@
 """Конфигурация Gunicorn."""
 
+from typing import Any
+
 from src.core.configs.env import settings
+from src.core.infrastructure.cache import (
+    SharedResponseCache,
+    configured_slot_bytes,
+)
 
 # Количество рабочих процессов Gunicorn
 workers = settings.gunicorn.GUNICORN_WORKERS
@@ -23,3 +29,19 @@ accesslog = (
     settings.gunicorn.GUNICORN_ACCESSLOG
 )  # Логирование доступа в stdout
 errorlog = settings.gunicorn.GUNICORN_ERRORLOG  # Логирование ошибок в stdout
+
+
+def on_starting(server: Any) -> None:
+    """Создать файл общего кэша ответов до запуска воркеров.
+
+    Ответы прошлого запуска отбрасываются.
+
+    :param server: Gunicorn arbiter.
+    :return: None
+    """
+    if settings.db.SHARED_CACHE_ENABLED:
+        SharedResponseCache.create(
+            path=settings.db.SHARED_CACHE_PATH,
+            slots=settings.db.SHARED_CACHE_SLOTS,
+            slot_bytes=configured_slot_bytes(),
+        ).close()
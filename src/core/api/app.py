@@ -10,9 +10,16 @@ from fastapi import FastAPI, Request
 from starlette.middleware.cors import CORSMiddleware
 from starlette.responses import Response as StarletteResponse
 
+from src.core.api.v1.routes.batch.route import router as batch
+from src.core.api.v1.routes.metrics.route import router as metrics
+from src.core.api.v1.routes.middlewars.admission import (
+    ADMISSION,
+    AdmissionMiddleware,
+)
 from src.core.api.v1.routes.middlewars.log import logs_middleware
 from src.core.api.v1.routes.organization.route import router as org
 from src.core.configs.env import settings
+from src.core.infrastructure.background import PeriodicTask
 from src.core.infrastructure.database import db
 from src.core.infrastructure.tracer.trace_app import setup_jaeger
 from src.core.infrastructure.tracer.trace_db import setup_jaeger_of_database
@@ -20,11 +27,77 @@ from src.core.infrastructure.tracer.trace_db import setup_jaeger_of_database
 LOGGER = logging.getLogger(settings.webconf.LOG_OUT_COMMON)
 
 
+async def background_tasks() -> list[PeriodicTask]:
+    """Run enabled refreshes once and return their periodic tasks.
+
+    Refreshes build in-process indexes, poll the catalog version and
+    measure replica lag. A failed first run is logged, queries fall
+    back to the database or the primary until a refresh succeeds.
+
+    :return: Tasks to start.
+    """
+    tasks: list[PeriodicTask] = []
+    refreshes = (
+        (
+            "spatial_index",
+            db.location.spatial_index is not None,
+            db.refresh_spatial_index,
+            settings.db.SPATIAL_INDEX_REFRESH_SECONDS,
+        ),
+        (
+            "autocomplete",
+            db.org.autocomplete is not None,
+            db.refresh_autocomplete,
+            settings.db.AUTOCOMPLETE_REFRESH_SECONDS,
+        ),
+        (
+            "pool_health",
+            True,
+            db.check_pool_health,
+            settings.db.POOL_HEALTH_CHECK_SECONDS,
+        ),
+        (
+            "catalog_version",
+            settings.db.CATALOG_VERSION_ENABLED,
+            db.refresh_catalog_version,
+            settings.db.CATALOG_VERSION_CHECK_SECONDS,
+        ),
+        (
+            "replica_lag",
+            bool(settings.db.get_url_replicas),
+            db.refresh_replica_lag,
+            settings.db.REPLICA_LAG_CHECK_SECONDS,
+        ),
+    )
+    for name, enabled, refresh, interval in refreshes:
+        if not enabled:
+            continue
+        try:
+            await refresh()
+        except Exception as e:
+            LOGGER.error("%s is not built: %s", name, e)
+        tasks.append(PeriodicTask(name=name, func=refresh, interval=interval))
+    return tasks
+
+
 @asynccontextmanager
 async def lifespan(_: FastAPI) -> AsyncIterator[None]:
-    """Connect and close DB."""
+    """Connect and close DB, warm up its pools, run background tasks."""
     await setup_jaeger_of_database()
+    try:
+        await db.warm_up()
+    except Exception as e:
+        LOGGER.error("DB pools are not warmed up: %s", e)
+    tasks = await background_tasks()
+    for task in tasks:
+        task.start()
+    if db.revalidator is not None:
+        db.revalidator.start()
     yield
+    if db.revalidator is not None:
+        await db.revalidator.stop()
+    for task in tasks:
+        await task.stop()
     await db.disconnect_db()
     LOGGER.debug("DB disconnected")
 
@@ -41,14 +114,22 @@ def create_app() -> FastAPI:
 
     setup_jaeger(app=app_)
 
+    # Inside CORS, so clients can read 503 responses of shed requests.
+    if settings.webconf.ADMISSION_ENABLED:
+        app_.add_middleware(
+            middleware_class=AdmissionMiddleware,  # noqa
+            control=ADMISSION,
+        )
     app_.add_middleware(
         middleware_class=CORSMiddleware,  # noqa
         allow_origins=settings.webconf.allowed_origins(),
         allow_credentials=True,
-        allow_methods=[http.HTTPMethod.GET],
+        allow_methods=[http.HTTPMethod.GET, http.HTTPMethod.POST],
         allow_headers=["Content-Type", "X-API-Key"],
     )
     app_.include_router(router=org, prefix="/v1")
+    app_.include_router(router=batch, prefix="/v1")
+    app_.include_router(router=metrics, prefix="/v1")
 
     @app_.middleware("http")
     async def wrap_api_key_middleware(
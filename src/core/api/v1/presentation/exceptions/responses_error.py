@@ -28,3 +28,15 @@ class ResponseError:
             "content": DetailError.CONTENT,
         },
     }
+
+    # Routes with a ``Deadline``.
+    DEADLINE_RESPONSES: dict[int | str, dict[str, Any]] = {
+        status.HTTP_503_SERVICE_UNAVAILABLE: {
+            "description": "Overloaded, retry after Retry-After seconds",
+            "content": DetailError.CONTENT,
+        },
+        status.HTTP_504_GATEWAY_TIMEOUT: {
+            "description": "Deadline exceeded",
+            "content": DetailError.CONTENT,
+        },
+    }
@@ -0,0 +1,47 @@
+"""Request body of batched sub-requests."""
+
+from typing import Any, List, Literal, Optional
+
+from pydantic import BaseModel, Field, field_validator
+
+from src.core.configs.env import settings
+
+QueryValue = str | int | float | bool | List[str | int | float | bool]
+
+
+class BatchItemRequest(BaseModel):
+    """One sub-request to an organization route."""
+
+    method: Literal["GET", "POST"] = "GET"
+    path: str = Field(
+        ...,
+        description="Route path without `/v1`, e.g. `/org/location`",
+        examples=["/org/location"],
+    )
+    query: dict[str, QueryValue] = Field(
+        default_factory=dict, description="Query params"
+    )
+    body: Optional[Any] = Field(default=None, description="JSON body")
+
+    @field_validator("path")
+    @classmethod
+    def check_path(cls, path: str) -> str:
+        """Allow organization routes only, so batches don't nest.
+
+        :param path: Route path.
+        :return: Route path.
+        :raises ValueError: Path is not an organization route.
+        """
+        if not path.startswith("/org/"):
+            raise ValueError("path must start with /org/")
+        return path
+
+
+class BatchRequest(BaseModel):
+    """Sub-requests executed concurrently."""
+
+    requests: List[BatchItemRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.webconf.BATCH_REQUESTS_MAX,
+    )
@@ -8,6 +8,7 @@ from src.core.api.v1.routes.utils.dto.location import (
     LocationRadiusDTO,
     LocationRectangleDTO,
 )
+from src.core.configs.env import settings
 
 
 class LocationRadiusRequest:
@@ -186,3 +187,71 @@ class LocationRectangleRequest:
             lat_min=self.lat_min,
             lat_max=self.lat_max,
         )
+
+
+class NearestRequest:
+    """Nearest organizations query params."""
+
+    def __init__(
+        self,
+        lon: Annotated[
+            float,
+            Query(
+                ...,
+                description="Longitude of the target",
+                alias="lon",
+                ge=-180,
+                le=180,
+            ),
+        ],
+        lat: Annotated[
+            float,
+            Query(
+                ...,
+                description="Latitude of the target",
+                alias="lat",
+                ge=-90,
+                le=90,
+            ),
+        ],
+        k: Annotated[
+            int,
+            Query(
+                description="Max organizations, closest first",
+                alias="k",
+                ge=1,
+                le=settings.webconf.PAGE_LIMIT_MAX,
+            ),
+        ] = 10,
+        max_distance: Annotated[
+            float | None,
+            Query(
+                description="Max distance in meters",
+                alias="max_distance",
+                gt=0,
+            ),
+        ] = None,
+    ) -> None:
+        """Nearest organizations query params.
+
+        :param lon: Longitude of the target
+        :param lat: Latitude of the target
+        :param k: Max organizations
+        :param max_distance: Max distance in meters
+        :type lon: float
+        :type lat: float
+        :type k: int
+        :type max_distance: float | None
+        :return None
+        """
+        self.lon = lon
+        self.lat = lat
+        self.k = k
+        self.max_distance = max_distance
+
+    def to_tuple_location(self) -> tuple[float, float]:
+        """Return the target point.
+
+        :return: Point (longitude, latitude).
+        """
+        return self.lon, self.lat
@@ -1,8 +1,11 @@
 """Request requirements of organizations."""
 
-from typing import Annotated
+from typing import Annotated, List
 
 from fastapi import Path, Query
+from pydantic import BaseModel, Field, model_validator
+
+from src.core.configs.env import settings
 
 
 class OrganizationByNameRequest:
@@ -48,3 +51,116 @@ class OrganizationByIDRequest:
         :return None
         """
         self.id = id_org
+
+
+class OrganizationSearchRequest:
+    """Request requirements of organization search."""
+
+    def __init__(
+        self,
+        q: Annotated[
+            str,
+            Query(
+                ...,
+                description="Part of organization name, any case",
+                alias="q",
+                min_length=3,
+                max_length=200,
+            ),
+        ],
+        limit: Annotated[
+            int,
+            Query(
+                description="Max organizations, most similar first",
+                alias="limit",
+                ge=1,
+                le=settings.webconf.PAGE_LIMIT_MAX,
+            ),
+        ] = 20,
+    ) -> None:
+        """Query requirements of organization search.
+
+        :param q: Part of organization name.
+        :param limit: Max organizations.
+        :type q: str
+        :type limit: int
+        :return None
+        """
+        self.q = q
+        self.limit = limit
+
+
+class AutocompleteRequest:
+    """Request requirements of name autocomplete."""
+
+    def __init__(
+        self,
+        prefix: Annotated[
+            str,
+            Query(
+                ...,
+                description="Typed start of any word of the name",
+                alias="prefix",
+                min_length=1,
+                max_length=200,
+            ),
+        ],
+        limit: Annotated[
+            int,
+            Query(
+                description="Max suggestions",
+                alias="limit",
+                ge=1,
+                le=50,
+            ),
+        ] = 10,
+        expand: Annotated[
+            int,
+            Query(
+                description="Top suggestions returned as full organizations",
+                alias="expand",
+                ge=0,
+                le=10,
+            ),
+        ] = 0,
+    ) -> None:
+        """Query requirements of name autocomplete.
+
+        :param prefix: Typed prefix.
+        :param limit: Max suggestions.
+        :param expand: Top suggestions returned as full organizations.
+        :type prefix: str
+        :type limit: int
+        :type expand: int
+        :return None
+        """
+        self.prefix = prefix
+        self.limit = limit
+        self.expand = expand
+
+
+class OrganizationBatchRequest(BaseModel):
+    """Request body of organizations by IDs and names."""
+
+    ids: List[int] = Field(
+        default_factory=list, description="Organization IDs"
+    )
+    names: List[str] = Field(
+        default_factory=list, description="Exact organization names"
+    )
+
+    @model_validator(mode="after")
+    def check_size(self) -> "OrganizationBatchRequest":
+        """Check that the batch is not empty and not too large.
+
+        :return: OrganizationBatchRequest
+        :raises ValueError: Batch size is out of range.
+        """
+        size = len(self.ids) + len(self.names)
+        if not size:
+            raise ValueError("ids or names are required")
+        if size > settings.webconf.BATCH_LIMIT_MAX:
+            raise ValueError(
+                f"at most {settings.webconf.BATCH_LIMIT_MAX} ids and names"
+            )
+        return self
@@ -0,0 +1,51 @@
+"""Query params of collection pages."""
+
+from typing import Annotated
+
+from fastapi import Query
+
+from src.core.api.v1.routes.utils.cursor import (
+    InvalidCursorError,
+    decode_cursor,
+)
+from src.core.api.v1.routes.utils.resp_error import error_422_invalid_cursor
+from src.core.configs.env import settings
+
+
+class PageRequest:
+    """Keyset pagination params."""
+
+    def __init__(
+        self,
+        limit: Annotated[
+            int,
+            Query(
+                description="Max organizations on the page",
+                alias="limit",
+                ge=1,
+                le=settings.webconf.PAGE_LIMIT_MAX,
+            ),
+        ] = settings.webconf.PAGE_LIMIT_DEFAULT,
+        cursor: Annotated[
+            str | None,
+            Query(
+                description="Opaque `next_cursor` of the previous page",
+                alias="cursor",
+            ),
+        ] = None,
+    ) -> None:
+        """Keyset pagination params.
+
+        :param limit: Max organizations on the page.
+        :param cursor: Cursor of the previous page.
+        :type limit: int
+        :type cursor: str | None
+        :return None
+        :raises HTTPException: Cursor is invalid.
+        """
+        self.limit = limit
+        self.cursor = cursor
+        try:
+            self.after_id = decode_cursor(cursor) if cursor else 0
+        except InvalidCursorError:
+            raise error_422_invalid_cursor()
@@ -0,0 +1,37 @@
+"""Headers of streaming responses."""
+
+from typing import Annotated
+
+from fastapi import Header
+
+from src.core.api.v1.routes.utils.resp_ndjson import NDJSON_MEDIA_TYPE
+
+
+class StreamRequest:
+    """Streaming mode selected by the ``Accept`` header."""
+
+    def __init__(
+        self,
+        accept: Annotated[
+            str | None,
+            Header(
+                description=f"`{NDJSON_MEDIA_TYPE}` streams all "
+                "organizations, one per line, ignoring `limit`",
+                alias="accept",
+            ),
+        ] = None,
+    ) -> None:
+        """Streaming mode selected by the ``Accept`` header.
+
+        :param accept: Accept header.
+        :type accept: str | None
+        :return None
+        """
+        self.accept = accept
+
+    def __bool__(self) -> bool:
+        """Return whether NDJSON stream is requested.
+
+        :return: bool
+        """
+        return self.accept is not None and NDJSON_MEDIA_TYPE in self.accept
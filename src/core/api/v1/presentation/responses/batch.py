@@ -0,0 +1,43 @@
+"""Response of batched sub-requests."""
+
+from typing import Any, List
+
+import pydantic
+from pydantic import BaseModel, Field
+
+
+class BatchItemResponse(BaseModel):
+    """Result of one sub-request."""
+
+    status: int = Field(..., description="HTTP status of the sub-request")
+    body: Any = Field(..., description="JSON body of the sub-request")
+
+
+class BatchResponse(BaseModel):
+    """Results in the order of sub-requests."""
+
+    responses: List[BatchItemResponse]
+
+    model_config = pydantic.ConfigDict(
+        title="Batch Response",
+        json_schema_extra={
+            "example": {
+                "responses": [
+                    {
+                        "status": 200,
+                        "body": {"organizations": [], "next_cursor": None},
+                    },
+                    {
+                        "status": 504,
+                        "body": {
+                            "detail": {
+                                "result": False,
+                                "error_type": "Timeout",
+                                "error_message": "Batch deadline exceeded.",
+                            }
+                        },
+                    },
+                ]
+            }
+        },
+    )
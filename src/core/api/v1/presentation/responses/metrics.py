@@ -0,0 +1,250 @@
+"""Metrics of the API worker."""
+
+from typing import Dict, Optional
+
+import pydantic
+from pydantic import BaseModel, Field
+
+
+class StatementCacheCounts(BaseModel):
+    """Compiled cache outcomes of one statement."""
+
+    hit: int = Field(..., description="Compiled form reused")
+    miss: int = Field(..., description="Statement compiled")
+    uncached: int = Field(..., description="Executed outside the cache")
+
+
+class StatementCacheResponse(BaseModel):
+    """Statement cache counters of the worker that answered."""
+
+    statements: Dict[str, StatementCacheCounts]
+
+    model_config = pydantic.ConfigDict(
+        title="Statement Cache Response",
+        json_schema_extra={
+            "example": {
+                "statements": {
+                    "documents_in_radius": {
+                        "hit": 1523,
+                        "miss": 1,
+                        "uncached": 0,
+                    },
+                }
+            }
+        },
+    )
+
+
+class ResponseCacheCounts(BaseModel):
+    """Response cache outcomes of one method."""
+
+    hit: int = Field(..., description="Served from the cache")
+    stale: int = Field(..., description="Served stale, reloaded meanwhile")
+    miss: int = Field(..., description="Loaded from the database")
+    expired: int = Field(..., description="Dropped on read after its TTL")
+    eviction: int = Field(..., description="Dropped to stay within limits")
+
+
+class SharedCacheCounts(BaseModel):
+    """Outcomes of the cache shared by the workers of the node."""
+
+    hit: int = Field(..., description="Served from the shared cache")
+    miss: int = Field(..., description="Missing, expired or being written")
+    write: int = Field(..., description="Responses written")
+    busy: int = Field(..., description="Writes skipped, slot being written")
+    oversize: int = Field(..., description="Responses larger than a slot")
+
+
+class RevalidationCounts(BaseModel):
+    """Background reloads of stale responses."""
+
+    pending: int = Field(..., description="Reloads queued")
+    queued: int = Field(..., description="Reloads requested")
+    dropped: int = Field(..., description="Reloads skipped, queue full")
+    refreshed: int = Field(..., description="Reloads done")
+    failed: int = Field(..., description="Reloads failed")
+
+
+class ResponseCacheResponse(BaseModel):
+    """Response cache size and counters of the worker that answered."""
+
+    enabled: bool
+    entries: int = Field(..., description="Cached responses")
+    bytes: int = Field(..., description="Size of cached responses")
+    methods: Dict[str, ResponseCacheCounts]
+    shared: Optional[SharedCacheCounts] = Field(
+        default=None, description="Counters of the shared cache, if enabled"
+    )
+    revalidation: Optional[RevalidationCounts] = Field(
+        default=None,
+        description="Counters of stale reloads, if soft TTLs are set",
+    )
+
+    model_config = pydantic.ConfigDict(
+        title="Response Cache Response",
+        json_schema_extra={
+            "example": {
+                "enabled": True,
+                "entries": 812,
+                "bytes": 1048576,
+                "methods": {
+                    "org_by_id": {
+                        "hit": 9120,
+                        "stale": 85,
+                        "miss": 640,
+                        "expired": 28,
+                        "eviction": 0,
+                    },
+                },
+                "shared": {
+                    "hit": 412,
+                    "miss": 228,
+                    "write": 228,
+                    "busy": 0,
+                    "oversize": 3,
+                },
+                "revalidation": {
+                    "pending": 0,
+                    "queued": 85,
+                    "dropped": 0,
+                    "refreshed": 84,
+                    "failed": 1,
+                },
+            }
+        },
+    )
+
+
+class KeyFilterCounts(BaseModel):
+    """Outcomes of the filter of existing organization IDs and names."""
+
+    version: Optional[int] = Field(
+        ..., description="Catalog version the filter was built at"
+    )
+    rejected: int = Field(..., description="Lookups answered not found")
+    passed: int = Field(..., description="Lookups sent to the database")
+
+
+class NegativeCacheResponse(BaseModel):
+    """Not found counters of the worker that answered."""
+
+    enabled: bool
+    entries: int = Field(..., description="Cached not found responses")
+    hit: int = Field(..., description="Answered not found from the cache")
+    miss: int = Field(..., description="Looked up in the database")
+    added: int = Field(..., description="Not found responses cached")
+    key_filter: Optional[KeyFilterCounts] = Field(
+        default=None, description="Counters of the key filter, if enabled"
+    )
+
+    model_config = pydantic.ConfigDict(
+        title="Negative Cache Response",
+        json_schema_extra={
+            "example": {
+                "enabled": True,
+                "entries": 214,
+                "hit": 5120,
+                "miss": 730,
+                "added": 260,
+                "key_filter": {
+                    "version": 42,
+                    "rejected": 18230,
+                    "passed": 9410,
+                },
+            }
+        },
+    )
+
+
+class SingleFlightCounts(BaseModel):
+    """Coalescing outcomes of one method."""
+
+    executed: int = Field(..., description="Loads run by the caller")
+    coalesced: int = Field(..., description="Calls sharing a running load")
+
+
+class SingleFlightResponse(BaseModel):
+    """Load coalescing counters of the worker that answered."""
+
+    enabled: bool
+    in_flight: int = Field(..., description="Loads running now")
+    methods: Dict[str, SingleFlightCounts]
+
+    model_config = pydantic.ConfigDict(
+        title="Single Flight Response",
+        json_schema_extra={
+            "example": {
+                "enabled": True,
+                "in_flight": 2,
+                "methods": {
+                    "org_by_activity_tree": {
+                        "executed": 310,
+                        "coalesced": 4820,
+                    },
+                },
+            }
+        },
+    )
+
+
+class PoolPressureCounts(BaseModel):
+    """Connection pool of the worker."""
+
+    capacity: int = Field(..., description="Max connections")
+    checked_out: int = Field(..., description="Connections in use")
+    hold_seconds: float = Field(
+        ..., description="Moving average of seconds a connection is held"
+    )
+
+
+class RouteAdmissionCounts(BaseModel):
+    """Admission outcomes of one route."""
+
+    limit: int = Field(..., description="Max requests in flight")
+    budget: float = Field(..., description="Deadline of the route, seconds")
+    in_flight: int = Field(..., description="Requests being served")
+    admitted: int = Field(..., description="Requests admitted")
+    shed_concurrency: int = Field(..., description="Shed, limit reached")
+    shed_pool: int = Field(..., description="Shed, pool wait too long")
+
+
+class AdmissionResponse(BaseModel):
+    """Admission control state of the worker that answered."""
+
+    enabled: bool
+    in_flight: int = Field(..., description="Admitted requests in flight")
+    estimated_wait: float = Field(
+        ..., description="Estimated seconds to get a connection"
+    )
+    pools: Dict[str, PoolPressureCounts] = Field(
+        ..., description="Connection pools by host and port"
+    )
+    routes: Dict[str, RouteAdmissionCounts]
+
+    model_config = pydantic.ConfigDict(
+        title="Admission Response",
+        json_schema_extra={
+            "example": {
+                "enabled": True,
+                "in_flight": 42,
+                "estimated_wait": 0.0,
+                "pools": {
+                    "db:5432": {
+                        "capacity": 20,
+                        "checked_out": 12,
+                        "hold_seconds": 0.018,
+                    },
+                },
+                "routes": {
+                    "/v1/org/nearest": {
+                        "limit": 16,
+                        "budget": 3.0,
+                        "in_flight": 9,
+                        "admitted": 10230,
+                        "shed_concurrency": 57,
+                        "shed_pool": 3,
+                    },
+                },
+            }
+        },
+    )
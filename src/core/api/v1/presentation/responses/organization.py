@@ -1,6 +1,6 @@
 """Response Organization model."""
 
-from typing import List
+from typing import List, Optional
 
 import pydantic
 from pydantic import BaseModel, Field
@@ -76,44 +76,168 @@ class CollectionOrganizationResponse(BaseModel):
     """Collection organization response."""
 
     organizations: List[OrganizationResponse]
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor of the next page, null on the last page",
+    )
 
     model_config = pydantic.ConfigDict(
         from_attributes=True,
         title="Organizations Response",
         json_schema_extra={
-            "example": [
-                {
-                    "id": 24,
-                    "name": "ГК ПИК Публичное акционерное общество",
-                    "building": {
-                        "id": 1,
-                        "address": "Дудинка, Черкасский М., д. 39",
-                        "location": {
-                            "longitude": -150.676573,
-                            "latitude": -9.263891,
+            "example": {
+                "organizations": [
+                    {
+                        "id": 24,
+                        "name": "ГК ПИК Публичное акционерное общество",
+                        "building": {
+                            "id": 1,
+                            "address": "Дудинка, Черкасский М., д. 39",
+                            "location": {
+                                "longitude": -150.676573,
+                                "latitude": -9.263891,
+                            },
                         },
+                        "phones": [{"phone": "+7 (716) 065-56-96"}],
+                        "activity": [{"name": "Грузовые"}],
                     },
-                    "phones": [{"phone": "+7 (716) 065-56-96"}],
-                    "activity": [{"name": "Грузовые"}],
-                },
-                {
-                    "id": 29,
-                    "name": "Евросиб Акционерное общество",
-                    "building": {
-                        "id": 1,
-                        "address": "Дудинка, Черкасский М., д. 39",
-                        "location": {
-                            "longitude": -150.676573,
-                            "latitude": -9.263891,
+                    {
+                        "id": 29,
+                        "name": "Евросиб Акционерное общество",
+                        "building": {
+                            "id": 1,
+                            "address": "Дудинка, Черкасский М., д. 39",
+                            "location": {
+                                "longitude": -150.676573,
+                                "latitude": -9.263891,
+                            },
                         },
+                        "phones": [
+                            {"phone": "+7 (158) 064-37-24"},
+                            {"phone": "+7 (322) 482-65-45"},
+                            {"phone": "+7 (531) 441-12-73"},
+                        ],
+                        "activity": [{"name": "Еда"}],
                     },
-                    "phones": [
-                        {"phone": "+7 (158) 064-37-24"},
-                        {"phone": "+7 (322) 482-65-45"},
-                        {"phone": "+7 (531) 441-12-73"},
-                    ],
-                    "activity": [{"name": "Еда"}],
-                },
-            ]
+                ],
+                "next_cursor": "eyJpZCI6Mjl9",
+            }
+        },
+    )
+
+
+class NearestOrganizationResponse(BaseModel):
+    """Organization with distance to the target."""
+
+    distance: float = Field(..., description="Distance in meters")
+    organization: OrganizationResponse
+
+
+class CollectionNearestOrganizationResponse(BaseModel):
+    """Nearest organizations response."""
+
+    organizations: List[NearestOrganizationResponse]
+
+    model_config = pydantic.ConfigDict(
+        from_attributes=True,
+        title="Nearest Organizations Response",
+        json_schema_extra={
+            "example": {
+                "organizations": [
+                    {
+                        "distance": 152.38,
+                        "organization": {
+                            "id": 24,
+                            "name": "ГК ПИК Публичное акционерное общество",
+                            "building": {
+                                "id": 1,
+                                "address": "Дудинка, Черкасский М., д. 39",
+                                "location": {
+                                    "longitude": -150.676573,
+                                    "latitude": -9.263891,
+                                },
+                            },
+                            "phones": [{"phone": "+7 (716) 065-56-96"}],
+                            "activity": [{"name": "Грузовые"}],
+                        },
+                    },
+                ],
+            }
+        },
+    )
+
+
+class SuggestionResponse(BaseModel):
+    """Autocomplete suggestion."""
+
+    id: int
+    name: str
+
+
+class AutocompleteResponse(BaseModel):
+    """Autocomplete response."""
+
+    suggestions: List[SuggestionResponse]
+    organizations: List[OrganizationResponse] = Field(
+        default_factory=list,
+        description="Full data of the top `expand` suggestions",
+    )
+
+    model_config = pydantic.ConfigDict(
+        from_attributes=True,
+        title="Autocomplete Response",
+        json_schema_extra={
+            "example": {
+                "suggestions": [
+                    {
+                        "id": 24,
+                        "name": "ГК ПИК Публичное акционерное общество",
+                    },
+                    {"id": 31, "name": "ГК Самолёт"},
+                ],
+                "organizations": [],
+            }
+        },
+    )
+
+
+class BatchMissingResponse(BaseModel):
+    """Requested keys without organization."""
+
+    ids: List[int]
+    names: List[str]
+
+
+class BatchOrganizationResponse(BaseModel):
+    """Organizations by IDs and names."""
+
+    organizations: List[OrganizationResponse] = Field(
+        ..., description="Found organizations, IDs then names, as requested"
+    )
+    missing: BatchMissingResponse
+
+    model_config = pydantic.ConfigDict(
+        from_attributes=True,
+        title="Batch Organizations Response",
+        json_schema_extra={
+            "example": {
+                "organizations": [
+                    {
+                        "id": 24,
+                        "name": "ГК ПИК Публичное акционерное общество",
+                        "building": {
+                            "id": 1,
+                            "address": "Дудинка, Черкасский М., д. 39",
+                            "location": {
+                                "longitude": -150.676573,
+                                "latitude": -9.263891,
+                            },
+                        },
+                        "phones": [{"phone": "+7 (716) 065-56-96"}],
+                        "activity": [{"name": "Грузовые"}],
+                    },
+                ],
+                "missing": {"ids": [404], "names": ["Рога и копыта"]},
+            }
         },
     )
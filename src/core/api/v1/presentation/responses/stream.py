@@ -0,0 +1,24 @@
+"""Streaming response docs."""
+
+from typing import Any
+
+from starlette import status
+
+from src.core.api.v1.routes.utils.resp_ndjson import NDJSON_MEDIA_TYPE
+
+
+class StreamResponse:
+    """NDJSON stream of organizations."""
+
+    RESPONSES: dict[int | str, dict[str, Any]] = {
+        status.HTTP_200_OK: {
+            "content": {
+                NDJSON_MEDIA_TYPE: {
+                    "schema": {
+                        "type": "string",
+                        "description": "OrganizationResponse per line",
+                    }
+                }
+            },
+        },
+    }
@@ -0,0 +1,7 @@
+"""Batch endpoints."""
+
+from src.core.api.v1.routes.batch.endpoints.batch import batch
+
+__all__ = [
+    "batch",
+]
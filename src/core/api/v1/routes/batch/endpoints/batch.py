@@ -0,0 +1,46 @@
+"""Endpoint for batched sub-requests."""
+
+import logging
+
+from fastapi import Request
+from starlette.responses import Response
+
+from src.core.api.v1.presentation.requests.batch import BatchRequest
+from src.core.api.v1.routes.utils.subrequests import (
+    dispatch_all,
+    resp_sub_responses,
+)
+from src.core.configs.env import settings
+
+LOGGER = logging.getLogger(settings.webconf.LOG_OUT_COMMON)
+
+
+async def batch(req: BatchRequest, request: Request) -> Response:
+    """Выполнить несколько запросов к маршрутам организаций за один вызов.
+
+    Подзапросы выполняются параллельно, каждый в своей сессии, с общим
+    дедлайном ``BATCH_TIMEOUT_SECONDS``. Не успевшие подзапросы
+    отменяются и возвращаются со статусом 504.
+
+    :param req: Sub-requests.
+    :type req: BatchRequest
+    :param request: Batch request, its API key is forwarded.
+    :type request: Request
+    :return: Response
+    """
+    prefix = request.scope["path"].removesuffix("/batch")
+    responses = await dispatch_all(
+        app=request.app,
+        scope=request.scope,
+        prefix=prefix,
+        items=req.requests,
+        timeout=settings.webconf.BATCH_TIMEOUT_SECONDS,
+    )
+
+    LOGGER.info(
+        "Batch executed. Requests: %s, failed: %s",
+        len(responses),
+        sum(response.status >= 400 for response in responses),
+    )
+
+    return resp_sub_responses(responses)
@@ -0,0 +1,45 @@
+"""Batch routes."""
+
+import http
+from typing import Sequence
+
+from fastapi import APIRouter, Depends
+from fastapi.params import Depends as DependsParam
+from starlette import status
+
+from src.core.api.v1.presentation.exceptions.responses_error import (
+    ResponseError,
+)
+from src.core.api.v1.presentation.responses.batch import BatchResponse
+from src.core.api.v1.routes.batch.endpoints import batch
+from src.core.api.v1.routes.utils.dependencies.api_key import get_api_key
+from src.core.api.v1.routes.utils.dependencies.deadline import Deadline
+from src.core.configs.env import settings
+
+router = APIRouter(tags=["Batch"])
+
+common_depends: Sequence[DependsParam] = [
+    Depends(get_api_key),
+]
+
+# Sub-requests run under the batch deadline and skip admission, so the
+# batch is admitted once by its ``Deadline``. It is not a
+# ``DeadlineRoute``: sub-requests past the deadline get 504 each.
+batch_depends: Sequence[DependsParam] = [
+    *common_depends,
+    Depends(Deadline(settings.webconf.BATCH_TIMEOUT_SECONDS)),
+]
+
+
+router.add_api_route(
+    endpoint=batch,
+    methods=[http.HTTPMethod.POST],
+    status_code=status.HTTP_200_OK,
+    path="/batch",
+    response_model=BatchResponse,
+    responses=ResponseError.RESPONSES,
+    dependencies=batch_depends,
+    summary="Выполнить несколько запросов за один вызов",
+    description="Выполняет подзапросы к маршрутам /org/ параллельно "
+    "и возвращает статус и тело каждого в порядке запроса.",
+)
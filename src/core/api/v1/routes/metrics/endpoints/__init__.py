@@ -0,0 +1,23 @@
+"""Metrics endpoints."""
+
+from src.core.api.v1.routes.metrics.endpoints.admission import admission
+from src.core.api.v1.routes.metrics.endpoints.negative_cache import (
+    negative_cache,
+)
+from src.core.api.v1.routes.metrics.endpoints.response_cache import (
+    response_cache,
+)
+from src.core.api.v1.routes.metrics.endpoints.single_flight import (
+    single_flight,
+)
+from src.core.api.v1.routes.metrics.endpoints.statement_cache import (
+    statement_cache,
+)
+
+__all__ = [
+    "admission",
+    "negative_cache",
+    "response_cache",
+    "single_flight",
+    "statement_cache",
+]
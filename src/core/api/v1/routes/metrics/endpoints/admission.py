@@ -0,0 +1,17 @@
+"""Endpoint for admission control counters."""
+
+from src.core.api.v1.presentation.responses.metrics import AdmissionResponse
+from src.core.api.v1.routes.middlewars.admission import ADMISSION
+from src.core.configs.env import settings
+
+
+async def admission() -> AdmissionResponse:
+    """Нагрузка на пулы соединений и отказы в обслуживании.
+
+    Считаются по маршруту в процессе воркера, ответившего на запрос.
+
+    :return: AdmissionResponse
+    """
+    return AdmissionResponse.model_validate(
+        {"enabled": settings.webconf.ADMISSION_ENABLED, **ADMISSION.snapshot()}
+    )
@@ -0,0 +1,27 @@
+"""Endpoint for not found counters."""
+
+from src.core.api.v1.presentation.responses.metrics import (
+    NegativeCacheResponse,
+)
+from src.core.infrastructure.database import db
+
+
+async def negative_cache() -> NegativeCacheResponse:
+    """Счётчики ответов «не найдено» без запроса к базе.
+
+    Считаются в процессе воркера, ответившего на запрос.
+
+    :return: NegativeCacheResponse
+    """
+    counts = (
+        {"enabled": False, "entries": 0, "hit": 0, "miss": 0, "added": 0}
+        if db.negative is None
+        else {"enabled": True, **db.negative.snapshot()}
+    )
+    key_filter = db.org.key_filter
+    if key_filter is not None:
+        counts["key_filter"] = {
+            "version": key_filter.version,
+            **key_filter.snapshot(),
+        }
+    return NegativeCacheResponse.model_validate(counts)
@@ -0,0 +1,28 @@
+"""Endpoint for response cache counters."""
+
+from src.core.api.v1.presentation.responses.metrics import (
+    ResponseCacheResponse,
+)
+from src.core.infrastructure.database import db
+
+
+async def response_cache() -> ResponseCacheResponse:
+    """Размер и счётчики кэша ответов.
+
+    Считаются по методу в процессе воркера, ответившего на запрос.
+
+    :return: ResponseCacheResponse
+    """
+    if db.cache is None:
+        return ResponseCacheResponse(
+            enabled=False, entries=0, bytes=0, methods={}
+        )
+    return ResponseCacheResponse.model_validate(
+        {
+            "enabled": True,
+            **db.cache.snapshot(),
+            "revalidation": (
+                None if db.revalidator is None else db.revalidator.snapshot()
+            ),
+        }
+    )
@@ -0,0 +1,20 @@
+"""Endpoint for load coalescing counters."""
+
+from src.core.api.v1.presentation.responses.metrics import (
+    SingleFlightResponse,
+)
+from src.core.infrastructure.database import db
+
+
+async def single_flight() -> SingleFlightResponse:
+    """Счётчики объединения одинаковых одновременных запросов.
+
+    Считаются по методу в процессе воркера, ответившего на запрос.
+
+    :return: SingleFlightResponse
+    """
+    if db.flight is None:
+        return SingleFlightResponse(enabled=False, in_flight=0, methods={})
+    return SingleFlightResponse.model_validate(
+        {"enabled": True, **db.flight.snapshot()}
+    )
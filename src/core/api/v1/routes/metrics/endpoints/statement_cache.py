@@ -0,0 +1,21 @@
+"""Endpoint for statement cache counters."""
+
+from src.core.api.v1.presentation.responses.metrics import (
+    StatementCacheResponse,
+)
+from src.core.infrastructure.database.core.statement_cache import (
+    STATEMENT_CACHE_STATS,
+)
+
+
+async def statement_cache() -> StatementCacheResponse:
+    """Счётчики попаданий в кэш скомпилированных запросов.
+
+    Считаются по имени запроса в процессе воркера, ответившего на
+    запрос.
+
+    :return: StatementCacheResponse
+    """
+    return StatementCacheResponse.model_validate(
+        {"statements": STATEMENT_CACHE_STATS.snapshot()}
+    )
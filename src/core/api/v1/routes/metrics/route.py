@@ -0,0 +1,99 @@
+"""Metrics routes."""
+
+import http
+from typing import Sequence
+
+from fastapi import APIRouter, Depends
+from fastapi.params import Depends as DependsParam
+from starlette import status
+
+from src.core.api.v1.presentation.exceptions.responses_error import (
+    ResponseError,
+)
+from src.core.api.v1.presentation.responses.metrics import (
+    AdmissionResponse,
+    NegativeCacheResponse,
+    ResponseCacheResponse,
+    SingleFlightResponse,
+    StatementCacheResponse,
+)
+from src.core.api.v1.routes.metrics.endpoints import (
+    admission,
+    negative_cache,
+    response_cache,
+    single_flight,
+    statement_cache,
+)
+from src.core.api.v1.routes.utils.dependencies.api_key import get_api_key
+
+router = APIRouter(tags=["Metrics"])
+
+common_depends: Sequence[DependsParam] = [
+    Depends(get_api_key),
+]
+
+
+router.add_api_route(
+    endpoint=statement_cache,
+    methods=[http.HTTPMethod.GET],
+    status_code=status.HTTP_200_OK,
+    path="/metrics/statement-cache",
+    response_model=StatementCacheResponse,
+    responses=ResponseError.RESPONSES,
+    dependencies=common_depends,
+    summary="Счётчики кэша скомпилированных запросов",
+    description="Возвращает попадания и промахи кэша "
+    "по каждому именованному запросу.",
+)
+
+router.add_api_route(
+    endpoint=response_cache,
+    methods=[http.HTTPMethod.GET],
+    status_code=status.HTTP_200_OK,
+    path="/metrics/response-cache",
+    response_model=ResponseCacheResponse,
+    responses=ResponseError.RESPONSES,
+    dependencies=common_depends,
+    summary="Счётчики кэша ответов",
+    description="Возвращает размер кэша ответов, попадания, промахи "
+    "и вытеснения по каждому методу.",
+)
+
+router.add_api_route(
+    endpoint=negative_cache,
+    methods=[http.HTTPMethod.GET],
+    status_code=status.HTTP_200_OK,
+    path="/metrics/negative-cache",
+    response_model=NegativeCacheResponse,
+    responses=ResponseError.RESPONSES,
+    dependencies=common_depends,
+    summary="Счётчики ответов «не найдено»",
+    description="Возвращает попадания кэша ответов «не найдено» "
+    "и отказы фильтра существующих организаций.",
+)
+
+router.add_api_route(
+    endpoint=single_flight,
+    methods=[http.HTTPMethod.GET],
+    status_code=status.HTTP_200_OK,
+    path="/metrics/single-flight",
+    response_model=SingleFlightResponse,
+    responses=ResponseError.RESPONSES,
+    dependencies=common_depends,
+    summary="Счётчики объединения запросов",
+    description="Возвращает число загрузок и присоединившихся к ним "
+    "одинаковых запросов по каждому методу.",
+)
+
+router.add_api_route(
+    endpoint=admission,
+    methods=[http.HTTPMethod.GET],
+    status_code=status.HTTP_200_OK,
+    path="/metrics/admission",
+    response_model=AdmissionResponse,
+    responses=ResponseError.RESPONSES,
+    dependencies=common_depends,
+    summary="Счётчики контроля нагрузки",
+    description="Возвращает загрузку пулов соединений, оценку ожидания "
+    "соединения и отказы по каждому маршруту.",
+)
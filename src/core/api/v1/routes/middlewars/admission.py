@@ -0,0 +1,221 @@
+"""Admission control middleware.
+
+Requests to routes with a ``Deadline`` are admitted while the route is
+below its concurrency limit and the estimated wait for a database
+connection fits the deadline. Others are answered ``503`` at once with
+``Retry-After``: they would wait for the pool and miss the deadline
+anyway, holding the requests already admitted back.
+
+Sub-requests of a batch are not gated again, the batch request was.
+"""
+
+import json
+import logging
+import math
+from typing import Any, Dict, Mapping, Optional
+
+from fastapi.routing import APIRoute
+from starlette import status
+from starlette.routing import Match
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.core.api.v1.presentation.responses.error import ErrResponse
+from src.core.api.v1.routes.utils.dependencies.deadline import Deadline
+from src.core.api.v1.routes.utils.subrequests import SUBREQUEST
+from src.core.configs.env import settings
+from src.core.infrastructure.database.core.pool_pressure import (
+    POOL_PRESSURE,
+    PoolPressure,
+)
+
+LOGGER = logging.getLogger(settings.webconf.LOG_OUT_COMMON)
+
+
+def route_deadline(route: APIRoute) -> Optional[float]:
+    """Return the deadline the route sets.
+
+    :param route: Route.
+    :return: Seconds, ``None`` without a ``Deadline``.
+    """
+    for depends in route.dependencies:
+        if isinstance(depends.dependency, Deadline):
+            return depends.dependency.seconds
+    return None
+
+
+class RouteGate:
+    """Concurrency limit and latency budget of one route."""
+
+    def __init__(self, limit: int, budget: float) -> None:
+        """Initialize gate with no requests in flight.
+
+        :param limit: Max requests in flight.
+        :param budget: Max seconds a request may wait for a connection.
+        """
+        self.limit = limit
+        self.budget = budget
+        self.in_flight = 0
+        self.counts: Dict[str, int] = {
+            "admitted": 0,
+            "shed_concurrency": 0,
+            "shed_pool": 0,
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return limits, requests in flight and copy of the counters.
+
+        :return: Gate state.
+        """
+        return {
+            "limit": self.limit,
+            "budget": self.budget,
+            "in_flight": self.in_flight,
+            **self.counts,
+        }
+
+
+class AdmissionControl:
+    """Gates of routes with a deadline, sharing the pool pressure.
+
+    Counts are per process.
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, int],
+        default_limit: int,
+        pressure: PoolPressure,
+    ) -> None:
+        """Initialize with no gates, made on the first request.
+
+        :param limits: Max requests in flight, by route path.
+        :param default_limit: Max requests in flight of other routes.
+        :param pressure: Pool pressure of the worker.
+        """
+        self.limits = dict(limits)
+        self.default_limit = default_limit
+        self.pressure = pressure
+        self.in_flight = 0
+        self.gates: Dict[str, RouteGate] = {}
+
+    def gate_of(self, scope: Scope) -> Optional[RouteGate]:
+        """Return gate of the route the request goes to.
+
+        :param scope: Request scope.
+        :return: RouteGate, ``None`` for routes without a deadline.
+        """
+        for route in scope["app"].router.routes:
+            if not isinstance(route, APIRoute):
+                continue
+            match, _ = route.matches(scope)
+            if match != Match.FULL:
+                continue
+            gate = self.gates.get(route.path)
+            if gate is None:
+                budget = route_deadline(route)
+                if budget is None:
+                    return None
+                gate = RouteGate(
+                    self.limits.get(route.path, self.default_limit), budget
+                )
+                self.gates[route.path] = gate
+            return gate
+        return None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return requests in flight, pool pressure and gates.
+
+        :return: Admission state.
+        """
+        return {
+            "in_flight": self.in_flight,
+            "estimated_wait": self.pressure.estimated_wait(self.in_flight),
+            "pools": self.pressure.snapshot(),
+            "routes": {
+                path: gate.snapshot() for path, gate in self.gates.items()
+            },
+        }
+
+
+class AdmissionMiddleware:
+    """Shed requests the route or the pools cannot serve in time."""
+
+    def __init__(self, app: ASGIApp, control: AdmissionControl) -> None:
+        """Initialize middleware.
+
+        :param app: ASGI application.
+        :param control: Gates of routes.
+        """
+        self.app = app
+        self.control = control
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Admit the request or answer ``503``.
+
+        :param scope: Request scope.
+        :param receive: Receive channel.
+        :param send: Send channel.
+        :return: None
+        """
+        gate = (
+            self.control.gate_of(scope)
+            if scope["type"] == "http" and not scope.get(SUBREQUEST)
+            else None
+        )
+        if gate is None:
+            await self.app(scope, receive, send)
+            return
+        if gate.in_flight >= gate.limit:
+            gate.counts["shed_concurrency"] += 1
+            await self.shed(send, "Route concurrency limit reached.", 1.0)
+            return
+        wait = self.control.pressure.estimated_wait(self.control.in_flight)
+        if wait > gate.budget:
+            gate.counts["shed_pool"] += 1
+            await self.shed(send, "Database connection wait too long.", wait)
+            return
+        gate.counts["admitted"] += 1
+        gate.in_flight += 1
+        self.control.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            gate.in_flight -= 1
+            self.control.in_flight -= 1
+
+    @staticmethod
+    async def shed(send: Send, message: str, retry_after: float) -> None:
+        """Answer ``503`` with ``Retry-After``.
+
+        :param send: Send channel.
+        :param message: Error message.
+        :param retry_after: Seconds the client should wait.
+        :return: None
+        """
+        LOGGER.warning("Request shed: %s", message)
+        detail = ErrResponse(error_type="Overloaded", error_message=message)
+        body = json.dumps({"detail": detail.model_dump()}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status.HTTP_503_SERVICE_UNAVAILABLE,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (
+                        b"retry-after",
+                        str(max(math.ceil(retry_after), 1)).encode(),
+                    ),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+ADMISSION = AdmissionControl(
+    limits=settings.webconf.ADMISSION_ROUTE_LIMITS,
+    default_limit=settings.webconf.ADMISSION_DEFAULT_LIMIT,
+    pressure=POOL_PRESSURE,
+)
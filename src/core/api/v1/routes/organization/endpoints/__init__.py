@@ -6,22 +6,38 @@ from src.core.api.v1.routes.organization.endpoints.by_activity_root import (
 from src.core.api.v1.routes.organization.endpoints.by_activity_tree import (
     get_activity_with_children,
 )
+from src.core.api.v1.routes.organization.endpoints.by_autocomplete import (
+    autocomplete_orgs,
+)
+from src.core.api.v1.routes.organization.endpoints.by_batch import (
+    orgs_batch,
+)
 from src.core.api.v1.routes.organization.endpoints.by_building_id import (
     org_by_building,
 )
 from src.core.api.v1.routes.organization.endpoints.by_location import (
     get_orgs_by_location,
 )
+from src.core.api.v1.routes.organization.endpoints.by_nearest import (
+    get_orgs_nearest,
+)
 from src.core.api.v1.routes.organization.endpoints.by_org_id import org_by_id
 from src.core.api.v1.routes.organization.endpoints.by_org_name import (
     org_by_name,
 )
+from src.core.api.v1.routes.organization.endpoints.by_search import (
+    search_orgs,
+)
 
 __all__ = [
+    "autocomplete_orgs",
     "get_orgs_by_activity_root",
     "org_by_building",
     "get_orgs_by_location",
+    "get_orgs_nearest",
     "get_activity_with_children",
     "org_by_id",
     "org_by_name",
+    "orgs_batch",
+    "search_orgs",
 ]
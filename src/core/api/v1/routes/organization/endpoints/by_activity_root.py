@@ -4,14 +4,16 @@ import logging
 from typing import Annotated
 
 from fastapi import Depends
-from starlette import status
-from starlette.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import Response
 
 from src.core.api.v1.presentation.requests.activity import ActivityRequest
-from src.core.api.v1.routes.utils.resp_error import error_404_not_found
-from src.core.api.v1.routes.utils.resp_orgs_by_activity import (
-    resp_org_by_activity_data,
+from src.core.api.v1.presentation.requests.page import PageRequest
+from src.core.api.v1.routes.utils.dependencies.session import (
+    get_catalog_session,
 )
+from src.core.api.v1.routes.utils.resp_documents import resp_documents
+from src.core.api.v1.routes.utils.resp_error import error_404_not_found
 from src.core.configs.env import settings
 from src.core.infrastructure.database import db
 
@@ -19,28 +21,36 @@ LOGGER = logging.getLogger(settings.webconf.LOG_OUT_COMMON)
 
 
 async def get_orgs_by_activity_root(
-    req: Annotated[ActivityRequest, Depends(ActivityRequest)]
-) -> JSONResponse:
+    req: Annotated[ActivityRequest, Depends(ActivityRequest)],
+    page: Annotated[PageRequest, Depends(PageRequest)],
+    session: Annotated[AsyncSession, Depends(get_catalog_session)],
+) -> Response:
     """
     Искать организации которые относятся к указанному виду деятельности.
 
     :param req: The activity of the target organization
     :type req: ActivityRequest
-    :return: JSONResponse
+    :param page: Page of organizations.
+    :type page: PageRequest
+    :param session: SQLAlchemy session.
+    :type session: AsyncSession
+    :return: Response
     """
-    async with db as session:
-        root_activity = await db.activity.get_activity(
+    organizations = await db.activity.get_documents_by_activity(
+        activity_name=req.name,
+        session=session,
+        limit=page.limit,
+        after_id=page.after_id,
+    )
+
+    if not organizations.documents and not (
+        await db.activity.activity_exists(
             activity_name=req.name, session=session
         )
-
-    if root_activity is None:
-        LOGGER.info("organization not found. Activity: %s", req.name)
+    ):
+        LOGGER.info("activity not found. Activity: %s", req.name)
         raise error_404_not_found()
 
     LOGGER.info("Organization found in activity. Activity: %s", req.name)
 
-    return JSONResponse(
-        content=resp_org_by_activity_data(activity=root_activity),
-        status_code=status.HTTP_200_OK,
-        media_type="application/json",
-    )
+    return resp_documents(organizations)
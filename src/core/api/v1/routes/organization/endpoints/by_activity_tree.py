@@ -1,15 +1,20 @@
 """Endpoint for activity with children."""
 
 import logging
-from typing import Annotated
+from typing import Annotated, Optional
 
 from fastapi import Depends
-from starlette import status
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 
 from src.core.api.v1.presentation.requests.activity import ActivityRequest
+from src.core.api.v1.presentation.requests.page import PageRequest
+from src.core.api.v1.presentation.requests.stream import StreamRequest
+from src.core.api.v1.routes.utils.resp_documents import (
+    resp_body,
+    resp_documents,
+)
 from src.core.api.v1.routes.utils.resp_error import error_404_not_found
-from src.core.api.v1.routes.utils.resp_org_full_data import resp_org_full_data
+from src.core.api.v1.routes.utils.resp_ndjson import resp_ndjson
 from src.core.configs.env import settings
 from src.core.infrastructure.database import db
 
@@ -18,7 +23,9 @@ LOGGER = logging.getLogger(settings.webconf.LOG_OUT_COMMON)
 
 async def get_activity_with_children(
     req: Annotated[ActivityRequest, Depends(ActivityRequest)],
-) -> JSONResponse:
+    page: Annotated[PageRequest, Depends(PageRequest)],
+    stream: Annotated[StreamRequest, Depends(StreamRequest)],
+) -> Response:
     """
     Искать организации по виду деятельности.
 
@@ -30,35 +37,57 @@ async def get_activity_with_children(
 
     :param req:
     :type req: ActivityRequest
-    :return: JSONResponse
+    :param page: Page of organizations.
+    :type page: PageRequest
+    :param stream: NDJSON streaming mode.
+    :type stream: StreamRequest
+    :return: Response
     """
-    async with db as session:
-        activity = await db.activity.get_activity(
-            activity_name=req.name, session=session, with_children=True
+    if stream:
+        return await resp_ndjson(
+            lambda session: db.activity.stream_documents_by_activity(
+                activity_name=req.name,
+                session=session,
+                after_id=page.after_id,
+                with_children=True,
+            ),
+            exists=lambda session: db.activity.activity_exists(
+                activity_name=req.name, session=session
+            ),
         )
 
-        if activity is None:
-            LOGGER.info(
-                "organization not found. Activity: %s",
-                req.name,
+    async def load() -> Optional[bytes]:
+        async with db.catalog_session() as session:
+            organizations = await db.activity.get_documents_by_activity(
+                activity_name=req.name,
+                session=session,
+                limit=page.limit,
+                after_id=page.after_id,
+                with_children=True,
             )
+            # An activity without organizations has an empty page.
+            if not organizations.documents and not (
+                await db.activity.activity_exists(
+                    activity_name=req.name, session=session
+                )
+            ):
+                return None
+        return resp_documents(organizations).body
 
-            raise error_404_not_found()
+    body = await db.cached(
+        "org_by_activity_tree",
+        {"name": req.name, "limit": page.limit, "after_id": page.after_id},
+        load,
+    )
 
-        LOGGER.info("Organization found in activity. Activity: %s", req.name)
+    if body is None:
+        LOGGER.info(
+            "activity not found. Activity: %s",
+            req.name,
+        )
 
-        all_organizations = set(activity.organizations)
+        raise error_404_not_found()
 
-        for child in activity.children:
-            all_organizations.update(child.organizations)
-            for grandchild in child.children:
-                all_organizations.update(grandchild.organizations)
+    LOGGER.info("Organization found in activity. Activity: %s", req.name)
 
-        return JSONResponse(
-            content=[
-                resp_org_full_data(organization=organization)
-                for organization in all_organizations
-            ],
-            status_code=status.HTTP_200_OK,
-            media_type="application/json",
-        )
+    return resp_body(body)
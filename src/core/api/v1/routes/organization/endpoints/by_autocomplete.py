@@ -0,0 +1,55 @@
+"""Endpoint for organization name autocomplete."""
+
+import logging
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import Response
+
+from src.core.api.v1.presentation.requests.organization import (
+    AutocompleteRequest,
+)
+from src.core.api.v1.routes.utils.dependencies.session import (
+    get_session,
+)
+from src.core.api.v1.routes.utils.resp_documents import resp_autocomplete
+from src.core.configs.env import settings
+from src.core.infrastructure.database import db
+
+LOGGER = logging.getLogger(settings.webconf.LOG_OUT_COMMON)
+
+
+async def autocomplete_orgs(
+    req: Annotated[AutocompleteRequest, Depends(AutocompleteRequest)],
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> Response:
+    """Подсказки названий организаций по началу слова.
+
+    Отвечает из индекса в памяти воркера, база данных нужна только
+    для полных данных первых ``expand`` подсказок.
+
+    :param req: Prefix, limit and expand.
+    :type req: AutocompleteRequest
+    :param session: SQLAlchemy session.
+    :type session: AsyncSession
+    :return: Response
+    """
+    index = db.org.autocomplete
+    if index is not None and index.ready:
+        suggestions = index.suggest(req.prefix, req.limit)
+        if not req.expand:
+            return resp_autocomplete(suggestions, [])
+        documents = await db.org.get_documents_by_ids(
+            [id_ for id_, _ in suggestions[: req.expand]], session
+        )
+        return resp_autocomplete(suggestions, documents)
+
+    LOGGER.debug("Autocomplete index is not built, using database")
+    suggestions = await db.org.suggest_names(
+        prefix=req.prefix, session=session, limit=req.limit
+    )
+    documents = await db.org.get_documents_by_ids(
+        [id_ for id_, _ in suggestions[: req.expand]], session
+    )
+    return resp_autocomplete(suggestions, documents)
@@ -0,0 +1,62 @@
+"""Endpoint for organizations by IDs and names."""
+
+import logging
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import Response
+
+from src.core.api.v1.presentation.requests.organization import (
+    OrganizationBatchRequest,
+)
+from src.core.api.v1.routes.utils.dependencies.session import (
+    get_session,
+)
+from src.core.api.v1.routes.utils.resp_documents import resp_batch
+from src.core.api.v1.routes.utils.resp_error import error_503_database_error
+from src.core.configs.env import settings
+from src.core.infrastructure.database import db
+
+LOGGER = logging.getLogger(settings.webconf.LOG_OUT_COMMON)
+
+
+async def orgs_batch(
+    req: OrganizationBatchRequest,
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> Response:
+    """Получить организации по списку ID и названий за один запрос.
+
+    Порядок ответа совпадает с запросом: сначала ID, затем названия.
+    Ненайденные ключи перечислены в ``missing``.
+
+    :param req: IDs and names.
+    :type req: OrganizationBatchRequest
+    :param session: SQLAlchemy session.
+    :type session: AsyncSession
+    :return: Response
+    :raises HTTPException: The lookup failed, misses are unknown.
+    """
+    ids = list(dict.fromkeys(req.ids))
+    names = list(dict.fromkeys(req.names))
+
+    try:
+        by_id, by_name = await db.org.get_documents_by_keys(
+            ids=ids, names=names, session=session
+        )
+    except SQLAlchemyError:
+        raise error_503_database_error()
+
+    documents = [by_id[id_] for id_ in ids if id_ in by_id]
+    documents.extend(by_name[name] for name in names if name in by_name)
+    missing_ids = [id_ for id_ in ids if id_ not in by_id]
+    missing_names = [name for name in names if name not in by_name]
+
+    LOGGER.info(
+        "Organizations batch. Found: %s, missing: %s",
+        len(documents),
+        len(missing_ids) + len(missing_names),
+    )
+
+    return resp_batch(documents, missing_ids, missing_names)
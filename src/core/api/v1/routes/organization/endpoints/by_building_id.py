@@ -1,15 +1,18 @@
 """Endpoint for listing organizations by building."""
 
 import logging
-from typing import Annotated
+from typing import Annotated, Optional
 
 from fastapi.params import Depends
-from starlette import status
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 
 from src.core.api.v1.presentation.requests.biulding import BuildingIDRequest
+from src.core.api.v1.presentation.requests.page import PageRequest
+from src.core.api.v1.routes.utils.resp_documents import (
+    resp_body,
+    resp_documents,
+)
 from src.core.api.v1.routes.utils.resp_error import error_404_not_found
-from src.core.api.v1.routes.utils.resp_org_full_data import resp_org_full_data
 from src.core.configs.env import settings
 from src.core.infrastructure.database import db
 
@@ -17,19 +20,42 @@ LOGGER = logging.getLogger(settings.webconf.LOG_OUT_COMMON)
 
 
 async def org_by_building(
-    req: Annotated[BuildingIDRequest, Depends(BuildingIDRequest)]
-) -> JSONResponse:
+    req: Annotated[BuildingIDRequest, Depends(BuildingIDRequest)],
+    page: Annotated[PageRequest, Depends(PageRequest)],
+) -> Response:
     """Получить список всех организаций находящихся в конкретном здании.
 
     :param req:
     :type req: BuildingIDRequest
-    :return: JSONResponse
+    :param page: Page of organizations.
+    :type page: PageRequest
+    :return: Response
     """
-    async with db as session:
-        org = await db.org.get_by_building(building_id=req.id, session=session)
 
-    if org is None:
-        LOGGER.info("organization not found. ID: %s", req.id)
+    async def load() -> Optional[bytes]:
+        async with db.catalog_session() as session:
+            organizations = await db.org.get_documents_by_building(
+                building_id=req.id,
+                session=session,
+                limit=page.limit,
+                after_id=page.after_id,
+            )
+            if not organizations.documents and not (
+                await db.location.building_exists(
+                    building_id=req.id, session=session
+                )
+            ):
+                return None
+        return resp_documents(organizations).body
+
+    body = await db.cached(
+        "org_by_building",
+        {"id": req.id, "limit": page.limit, "after_id": page.after_id},
+        load,
+    )
+
+    if body is None:
+        LOGGER.info("building not found. ID: %s", req.id)
         raise error_404_not_found()
 
     LOGGER.info(
@@ -37,11 +63,4 @@ async def org_by_building(
         req.id,
     )
 
-    return JSONResponse(
-        content=[
-            resp_org_full_data(organization=organization)
-            for organization in org
-        ],
-        status_code=status.HTTP_200_OK,
-        media_type="application/json",
-    )
+    return resp_body(body)
@@ -4,15 +4,22 @@ import logging
 from typing import Annotated
 
 from fastapi import Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 
 from src.core.api.v1.presentation.requests.location import (
     LocationRadiusRequest,
     LocationRectangleRequest,
 )
+from src.core.api.v1.presentation.requests.page import PageRequest
+from src.core.api.v1.presentation.requests.stream import StreamRequest
+from src.core.api.v1.routes.utils.dependencies.session import (
+    get_session,
+)
+from src.core.api.v1.routes.utils.resp_documents import resp_documents
 from src.core.api.v1.routes.utils.resp_error import error_404_not_found
-from src.core.api.v1.routes.utils.resp_org_full_data import resp_org_full_data
+from src.core.api.v1.routes.utils.resp_ndjson import resp_ndjson
 from src.core.configs.env import settings
 from src.core.infrastructure.database import db
 
@@ -24,7 +31,10 @@ async def get_orgs_by_location(
     rectangle: Annotated[
         LocationRectangleRequest, Depends(LocationRectangleRequest)
     ],
-) -> JSONResponse:
+    page: Annotated[PageRequest, Depends(PageRequest)],
+    stream: Annotated[StreamRequest, Depends(StreamRequest)],
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> Response:
     """Вывод список организаций.
 
     Которые находятся в заданном радиусе/прямоугольной области
@@ -33,58 +43,83 @@ async def get_orgs_by_location(
     :type radius: LocationRadiusRequest
     :param rectangle:  Organizations by rectangle.
     :type rectangle: LocationRectangleRequest
-    :return: JSONResponse
+    :param page: Page of organizations.
+    :type page: PageRequest
+    :param stream: NDJSON streaming mode.
+    :type stream: StreamRequest
+    :param session: SQLAlchemy session.
+    :type session: AsyncSession
+    :return: Response
     """
     try:
         if bool(radius) == bool(rectangle):
             raise error_404_not_found()
 
-        async with db as session:
-
-            if rectangle:
-                validated_rec = rectangle.validate()
-
-                if not validated_rec:
-                    LOGGER.error(
-                        "bad request location by rectangle: %s",
-                        validated_rec,
-                    )
-                    raise error_404_not_found()
-
-                organizations = await db.location.get_objects_in_rectangle(
-                    bounds=validated_rec.to_tuple(),
-                    session=session,
-                )
-            else:
-                validated_rad = radius.validate()
-                if not validated_rad:
-                    LOGGER.error(
-                        "bad request location by radius: %s",
-                        validated_rad,
-                    )
-                    raise error_404_not_found()
-
-                organizations = await db.location.get_objects_in_radius(
-                    point=validated_rad.to_tuple_location(),
-                    radius=validated_rad.to_float_radius(),
-                    session=session,
+        if rectangle:
+            validated_rec = rectangle.validate()
+            if not validated_rec:
+                LOGGER.error(
+                    "bad request location by rectangle: %s",
+                    validated_rec,
                 )
+                raise error_404_not_found()
 
-            if not organizations:
-                LOGGER.info(
-                    "organization not found by location. Location: %s",
+            bounds = validated_rec.to_tuple()
+            location = bounds
+        else:
+            validated_rad = radius.validate()
+            if not validated_rad:
+                LOGGER.error(
+                    "bad request location by radius: %s",
                     validated_rad,
                 )
                 raise error_404_not_found()
 
-            return JSONResponse(
-                content=[
-                    resp_org_full_data(organization=organization)
-                    for organization in organizations
-                ],
-                status_code=status.HTTP_200_OK,
-                media_type="application/json",
+            point = validated_rad.to_tuple_location()
+            radius_m = validated_rad.to_float_radius()
+            location = (point, radius_m)
+
+        if stream:
+            return await resp_ndjson(
+                lambda session: (
+                    db.location.stream_documents_in_rectangle(
+                        bounds=bounds,
+                        session=session,
+                        after_id=page.after_id,
+                    )
+                    if rectangle
+                    else db.location.stream_documents_in_radius(
+                        point=point,
+                        radius=radius_m,
+                        session=session,
+                        after_id=page.after_id,
+                    )
+                )
+            )
+
+        if rectangle:
+            organizations = await db.location.get_documents_in_rectangle(
+                bounds=bounds,
+                session=session,
+                limit=page.limit,
+                after_id=page.after_id,
             )
+        else:
+            organizations = await db.location.get_documents_in_radius(
+                point=point,
+                radius=radius_m,
+                session=session,
+                limit=page.limit,
+                after_id=page.after_id,
+            )
+
+        LOGGER.info(
+            "Organizations found by location: %s. Location: %s",
+            len(organizations.documents),
+            location,
+        )
+
+        return resp_documents(organizations)
 
     except HTTPException as http_exception:
         LOGGER.error(http_exception)
@@ -0,0 +1,48 @@
+"""Endpoint for nearest organizations."""
+
+import logging
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import Response
+
+from src.core.api.v1.presentation.requests.location import NearestRequest
+from src.core.api.v1.routes.utils.dependencies.session import (
+    get_session,
+)
+from src.core.api.v1.routes.utils.resp_documents import resp_collection
+from src.core.api.v1.routes.utils.resp_error import error_404_not_found
+from src.core.configs.env import settings
+from src.core.infrastructure.database import db
+
+LOGGER = logging.getLogger(settings.webconf.LOG_OUT_COMMON)
+
+
+async def get_orgs_nearest(
+    req: Annotated[NearestRequest, Depends(NearestRequest)],
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> Response:
+    """Вывод K ближайших к точке организаций с расстоянием до них.
+
+    :param req: Target point, K and max distance.
+    :type req: NearestRequest
+    :param session: SQLAlchemy session.
+    :type session: AsyncSession
+    :return: Response
+    """
+    organizations = await db.location.get_documents_nearest(
+        point=req.to_tuple_location(),
+        k=req.k,
+        session=session,
+        max_distance=req.max_distance,
+    )
+
+    if not organizations:
+        LOGGER.info(
+            "nearest organizations not found. Point: %s",
+            req.to_tuple_location(),
+        )
+        raise error_404_not_found()
+
+    return resp_collection(organizations)
@@ -1,17 +1,16 @@
 """Endpoint for information about organization by ID."""
 
 import logging
-from typing import Annotated
+from typing import Annotated, Optional
 
 from fastapi import Depends
-from starlette import status
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 
 from src.core.api.v1.presentation.requests.organization import (
     OrganizationByIDRequest,
 )
+from src.core.api.v1.routes.utils.resp_documents import resp_body
 from src.core.api.v1.routes.utils.resp_error import error_404_not_found
-from src.core.api.v1.routes.utils.resp_org_full_data import resp_org_full_data
 from src.core.configs.env import settings
 from src.core.infrastructure.database import db
 
@@ -22,25 +21,32 @@ async def org_by_id(
     organization: Annotated[
         OrganizationByIDRequest, Depends(OrganizationByIDRequest)
     ],
-) -> JSONResponse:
+) -> Response:
     """
     Вывод информации об организации по её идентификатору.
 
     :param organization: The ID of the target organization
     :type organization: OrganizationByIDRequest
-    :return: JSONResponse
+    :return: Response
     """
-    async with db as session:
-        org = await db.org.get_by_id(id_obj=organization.id, session=session)
 
-    if org is None:
+    async def load() -> Optional[bytes]:
+        async with db.catalog_session() as session:
+            document = await db.org.get_document_by_id(
+                id_obj=organization.id, session=session
+            )
+        return None if document is None else document.encode()
+
+    body = (
+        await db.cached("org_by_id", {"id": organization.id}, load)
+        if db.may_exist(id_=organization.id)
+        else None
+    )
+
+    if body is None:
         LOGGER.info("organization not found. ID: %s", organization.id)
         raise error_404_not_found()
 
-    LOGGER.info("Organization found. ID: %s, Name: %s", org.id, org.name)
+    LOGGER.info("Organization found. ID: %s", organization.id)
 
-    return JSONResponse(
-        content=resp_org_full_data(organization=org),
-        status_code=status.HTTP_200_OK,
-        media_type="application/json",
-    )
+    return resp_body(body)
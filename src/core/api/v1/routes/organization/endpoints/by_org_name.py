@@ -1,17 +1,16 @@
 """Endpoint for getting organizations by name."""
 
 import logging
-from typing import Annotated
+from typing import Annotated, Optional
 
 from fastapi import Depends
-from starlette import status
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 
 from src.core.api.v1.presentation.requests.organization import (
     OrganizationByNameRequest,
 )
+from src.core.api.v1.routes.utils.resp_documents import resp_body
 from src.core.api.v1.routes.utils.resp_error import error_404_not_found
-from src.core.api.v1.routes.utils.resp_org_full_data import resp_org_full_data
 from src.core.configs.env import settings
 from src.core.infrastructure.database import db
 
@@ -22,24 +21,36 @@ async def org_by_name(
     organization: Annotated[
         OrganizationByNameRequest, Depends(OrganizationByNameRequest)
     ],
-) -> JSONResponse:
+) -> Response:
     """Поиск организации по названию.
 
     :param organization: The name of the organization.
     :type organization: OrganizationByNameRequest
-    :return: JSONResponse
+    :return: Response
     """
-    async with db as session:
-        org = await db.org.get_by_name(name=organization.name, session=session)
 
-    if org is None:
+    async def load() -> Optional[bytes]:
+        async with db.catalog_session() as session:
+            document = await db.org.get_document_by_name(
+                name=organization.name, session=session
+            )
+        return None if document is None else document.encode()
+
+    body = (
+        await db.cached(
+            "org_by_name",
+            {"name": organization.name},
+            load,
+            remember_missing=True,
+        )
+        if db.may_exist(name=organization.name)
+        else None
+    )
+
+    if body is None:
         LOGGER.info("""organization "%s" not found.""", organization.name)
         raise error_404_not_found()
 
-    LOGGER.info("Organization found. Name: %s, Name: %s", org.id, org.name)
+    LOGGER.info("Organization found. Name: %s", organization.name)
 
-    return JSONResponse(
-        content=resp_org_full_data(organization=org),
-        status_code=status.HTTP_200_OK,
-        media_type="application/json",
-    )
+    return resp_body(body)
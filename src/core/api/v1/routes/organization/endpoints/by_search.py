@@ -0,0 +1,48 @@
+"""Endpoint for organization search by name."""
+
+import logging
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import Response
+
+from src.core.api.v1.presentation.requests.organization import (
+    OrganizationSearchRequest,
+)
+from src.core.api.v1.routes.utils.dependencies.session import (
+    get_catalog_session,
+)
+from src.core.api.v1.routes.utils.resp_documents import resp_collection
+from src.core.api.v1.routes.utils.resp_error import error_404_not_found
+from src.core.configs.env import settings
+from src.core.infrastructure.database import db
+
+LOGGER = logging.getLogger(settings.webconf.LOG_OUT_COMMON)
+
+
+async def search_orgs(
+    req: Annotated[
+        OrganizationSearchRequest, Depends(OrganizationSearchRequest)
+    ],
+    session: Annotated[AsyncSession, Depends(get_catalog_session)],
+) -> Response:
+    """Нечёткий поиск организаций по части названия.
+
+    Без учёта регистра, «ё» и «е» не различаются.
+
+    :param req: Search text and limit.
+    :type req: OrganizationSearchRequest
+    :param session: SQLAlchemy session.
+    :type session: AsyncSession
+    :return: Response
+    """
+    organizations = await db.org.search_documents(
+        query=req.q, session=session, limit=req.limit
+    )
+
+    if not organizations:
+        LOGGER.info("""organizations like "%s" not found.""", req.q)
+        raise error_404_not_found()
+
+    return resp_collection(organizations)
@@ -11,25 +11,70 @@ from src.core.api.v1.presentation.exceptions.responses_error import (
     ResponseError,
 )
 from src.core.api.v1.presentation.responses.organization import (
+    AutocompleteResponse,
+    BatchOrganizationResponse,
+    CollectionNearestOrganizationResponse,
     CollectionOrganizationResponse,
     OrganizationResponse,
 )
+from src.core.api.v1.presentation.responses.stream import StreamResponse
 from src.core.api.v1.routes.organization.endpoints import (
+    autocomplete_orgs,
     get_activity_with_children,
     get_orgs_by_activity_root,
     get_orgs_by_location,
+    get_orgs_nearest,
     org_by_building,
     org_by_id,
     org_by_name,
+    orgs_batch,
+    search_orgs,
 )
 from src.core.api.v1.routes.utils.dependencies.api_key import get_api_key
+from src.core.api.v1.routes.utils.dependencies.conditional import (
+    ConditionalRoute,
+    NotModified,
+)
+from src.core.api.v1.routes.utils.dependencies.deadline import (
+    Deadline,
+    DeadlineRoute,
+)
+
+
+class OrganizationRoute(ConditionalRoute, DeadlineRoute):
+    """Route with ETag headers, run under its deadline.
 
-router = APIRouter(tags=["Organization"])
+    Routes set their ``Deadline``, queries still running then are
+    cancelled. Lookups by key are fast, spatial queries are the slowest
+    and hold connections the longest, so they are cut before they
+    starve the pool.
+    """
+
+
+router = APIRouter(tags=["Organization"], route_class=OrganizationRoute)
 
 common_depends: Sequence[DependsParam] = [
     Depends(get_api_key),
 ]
 
+# Cache-Control of routes answering 304 by ETag: a document may be
+# reused for a minute, collections are revalidated on every poll.
+# Routes served from in-process indexes refreshed on their own period
+# have no ETag, it would not follow the catalog version.
+document_depends: Sequence[DependsParam] = [
+    *common_depends,
+    Depends(NotModified("private, max-age=60")),
+]
+collection_depends: Sequence[DependsParam] = [
+    *common_depends,
+    Depends(NotModified("private, no-cache")),
+]
+
+responses = {
+    **ResponseError.RESPONSES,
+    **ResponseError.DEADLINE_RESPONSES,
+}
+
 
 router.add_api_route(
     endpoint=org_by_name,
@@ -37,21 +82,75 @@ router.add_api_route(
     status_code=status.HTTP_200_OK,
     path="/org/name",
     response_model=OrganizationResponse,
-    responses=ResponseError.RESPONSES,
-    dependencies=common_depends,
+    responses=responses,
+    dependencies=[
+        *document_depends,
+        Depends(Deadline(2.0)),
+    ],
     summary="Получить организации по названию",
     description="Возвращает список организаций, "
     "полностью соответствующих названию.",
 )
 
+router.add_api_route(
+    endpoint=search_orgs,
+    methods=[http.HTTPMethod.GET],
+    status_code=status.HTTP_200_OK,
+    path="/org/search",
+    response_model=CollectionOrganizationResponse,
+    responses=responses,
+    dependencies=[
+        *collection_depends,
+        Depends(Deadline(3.0)),
+    ],
+    summary="Найти организации по части названия",
+    description="Возвращает организации с похожими названиями, "
+    "самые похожие первыми. Регистр и «ё» не учитываются.",
+)
+
+router.add_api_route(
+    endpoint=autocomplete_orgs,
+    methods=[http.HTTPMethod.GET],
+    status_code=status.HTTP_200_OK,
+    path="/org/autocomplete",
+    response_model=AutocompleteResponse,
+    responses=responses,
+    dependencies=[
+        *common_depends,
+        Depends(Deadline(1.0)),
+    ],
+    summary="Подсказки названий организаций",
+    description="Возвращает организации, у которых слово названия "
+    "начинается с введённого текста.",
+)
+
+router.add_api_route(
+    endpoint=orgs_batch,
+    methods=[http.HTTPMethod.POST],
+    status_code=status.HTTP_200_OK,
+    path="/org/batch",
+    response_model=BatchOrganizationResponse,
+    responses=responses,
+    dependencies=[
+        *common_depends,
+        Depends(Deadline(5.0)),
+    ],
+    summary="Получить организации по списку ID и названий",
+    description="Возвращает организации в порядке запроса, "
+    "ненайденные ID и названия перечислены в missing.",
+)
+
 router.add_api_route(
     endpoint=org_by_building,
     methods=[http.HTTPMethod.GET],
     status_code=status.HTTP_200_OK,
     path="/org/building",
     response_model=CollectionOrganizationResponse,
-    responses=ResponseError.RESPONSES,
-    dependencies=common_depends,
+    responses=responses,
+    dependencies=[
+        *collection_depends,
+        Depends(Deadline(5.0)),
+    ],
     summary="Получить организации по ID зданию.",
     description="Возвращает список организаций, " "соответствующих ID зданию.",
 )
@@ -62,21 +161,43 @@ router.add_api_route(
     status_code=status.HTTP_200_OK,
     path="/org/location",
     response_model=CollectionOrganizationResponse,
-    responses=ResponseError.RESPONSES,
-    dependencies=common_depends,
+    responses={**responses, **StreamResponse.RESPONSES},
+    dependencies=[
+        *common_depends,
+        Depends(Deadline(3.0)),
+    ],
     summary="Получить организации по координатам.",
     description="Возвращает список организаций, "
     "соответствующих заданным координатам.",
 )
 
+router.add_api_route(
+    endpoint=get_orgs_nearest,
+    methods=[http.HTTPMethod.GET],
+    status_code=status.HTTP_200_OK,
+    path="/org/nearest",
+    response_model=CollectionNearestOrganizationResponse,
+    responses=responses,
+    dependencies=[
+        *common_depends,
+        Depends(Deadline(3.0)),
+    ],
+    summary="Получить ближайшие организации.",
+    description="Возвращает K ближайших к точке организаций "
+    "с расстоянием до них в метрах.",
+)
+
 router.add_api_route(
     endpoint=get_orgs_by_activity_root,
     methods=[http.HTTPMethod.GET],
     status_code=status.HTTP_200_OK,
     path="/org/{activity}/root",
     response_model=CollectionOrganizationResponse,
-    responses=ResponseError.RESPONSES,
-    dependencies=common_depends,
+    responses=responses,
+    dependencies=[
+        *collection_depends,
+        Depends(Deadline(5.0)),
+    ],
     summary="Получить организации по типу активности",
     description="Возвращает список организаций, "
     "соответствующих заданной активности.",
@@ -88,8 +209,11 @@ router.add_api_route(
     status_code=status.HTTP_200_OK,
     path="/org/{activity}/tree",
     response_model=CollectionOrganizationResponse,
-    responses=ResponseError.RESPONSES,
-    dependencies=common_depends,
+    responses={**responses, **StreamResponse.RESPONSES},
+    dependencies=[
+        *collection_depends,
+        Depends(Deadline(5.0)),
+    ],
     summary="Получить организации по основному "
     "типу и дочерних типов активностей",
     description="Возвращает список организаций, "
@@ -102,8 +226,11 @@ router.add_api_route(
     status_code=status.HTTP_200_OK,
     path="/org/{id}",
     response_model=OrganizationResponse,
-    responses=ResponseError.RESPONSES,
-    dependencies=common_depends,
+    responses=responses,
+    dependencies=[
+        *document_depends,
+        Depends(Deadline(2.0)),
+    ],
     summary="Получить организации по ID зданию.",
     description="Возвращает список организаций, " "соответствующих ID зданию.",
 )
@@ -0,0 +1,39 @@
+"""Opaque cursors of keyset pagination."""
+
+import base64
+import binascii
+import json
+
+
+class InvalidCursorError(ValueError):
+    """Cursor was not issued by this API."""
+
+    pass
+
+
+def encode_cursor(last_id: int) -> str:
+    """Encode the last organization ID of a page.
+
+    :param last_id: ID of the last organization on the page.
+    :return: URL-safe opaque cursor.
+    """
+    raw = json.dumps({"id": last_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    """Decode organization ID the next page starts after.
+
+    :param cursor: Cursor returned as ``next_cursor``.
+    :return: Organization ID.
+    :raises InvalidCursorError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        last_id = json.loads(raw)["id"]
+    except (binascii.Error, ValueError, TypeError, KeyError) as e:
+        raise InvalidCursorError(cursor) from e
+
+    if type(last_id) is not int or last_id < 0:
+        raise InvalidCursorError(cursor)
+    return last_id
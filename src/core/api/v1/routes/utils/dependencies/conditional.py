@@ -0,0 +1,132 @@
+"""Conditional GET driven by the catalog version.
+
+The ETag of a response is derived from the catalog version and the
+request, so it is known before the database is queried: a request with
+a matching ``If-None-Match`` is answered ``304 Not Modified`` without
+running the endpoint. ETags follow catalog changes once the version is
+polled, see ``CATALOG_VERSION_CHECK_SECONDS``.
+
+The data of a ``200`` response is read in a session checking, in the
+transaction of the data, that it is at least at the version of the
+ETag, see ``Connector.catalog_session``. Data newer than its ETag is
+only fetched again, data older would be kept by clients.
+
+Collections are served as JSON or NDJSON by ``Accept``, so the ETag
+covers the media type chosen and responses carry ``Vary: Accept``.
+"""
+
+import hashlib
+import json
+from typing import Any, Callable, Coroutine, Optional
+
+from fastapi import HTTPException, Request
+from fastapi.routing import APIRoute
+from starlette import status
+from starlette.responses import Response
+
+from src.core.api.v1.presentation.requests.stream import StreamRequest
+from src.core.api.v1.routes.utils.resp_ndjson import NDJSON_MEDIA_TYPE
+from src.core.infrastructure.database import db
+
+VARY = "Accept"
+
+
+def request_etag(version: int, request: Request) -> str:
+    """Build the ETag of the response to the request.
+
+    Query parameters are sorted, so their order does not matter. The
+    media type negotiated by ``Accept`` is included, JSON and NDJSON
+    bodies of the same request differ.
+
+    :param version: Catalog version.
+    :param request: Request.
+    :return: Strong ETag, quoted.
+    """
+    streamed = StreamRequest(request.headers.get("accept"))
+    canonical = json.dumps(
+        [
+            request.url.path,
+            sorted(request.query_params.multi_items()),
+            NDJSON_MEDIA_TYPE if streamed else "application/json",
+        ],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    digest = hashlib.blake2b(canonical.encode(), digest_size=12).hexdigest()
+    return f'"{version}-{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check ``If-None-Match`` against the ETag.
+
+    :param if_none_match: Header value, ETags separated by commas.
+    :param etag: ETag of the response.
+    :return: True when the client has the response.
+    """
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+class NotModified:
+    """Dependency answering ``304`` when the client has the response.
+
+    Added to the route after the API key check. Headers of ``200``
+    responses are set by ``ConditionalRoute``.
+    """
+
+    def __init__(self, cache_control: str) -> None:
+        """Initialize dependency.
+
+        :param cache_control: ``Cache-Control`` of the route.
+        """
+        self.cache_control = cache_control
+
+    async def __call__(self, request: Request) -> None:
+        """Compare ``If-None-Match`` with the ETag of the response.
+
+        :param request: Request.
+        :return: None
+        :raises HTTPException: 304 when the ETag matches.
+        """
+        version = db.catalog_version
+        if version is None:
+            return
+        etag = request_etag(version, request)
+        headers = {
+            "ETag": etag,
+            "Cache-Control": self.cache_control,
+            "Vary": VARY,
+        }
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+            )
+        request.state.cache_headers = headers
+
+
+class ConditionalRoute(APIRoute):
+    """Route setting ETag and Cache-Control found by ``NotModified``.
+
+    ``Vary`` is set on every response, with or without an ETag.
+    """
+
+    def get_route_handler(
+        self,
+    ) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        """Wrap the handler to add the headers to successful responses.
+
+        :return: Route handler.
+        """
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            response = await handler(request)
+            headers = getattr(request.state, "cache_headers", None)
+            if headers and response.status_code == status.HTTP_200_OK:
+                response.headers.update(headers)
+            response.headers["Vary"] = VARY
+            return response
+
+        return route_handler
@@ -0,0 +1,75 @@
+"""Per-route request deadlines.
+
+Routes of a router with ``DeadlineRoute`` set their deadline with the
+``Deadline`` dependency. Queries still running at the deadline are
+cancelled, on the server too, so abandoned requests give their pool
+connections back.
+"""
+
+import logging
+from typing import Any, Callable, Coroutine
+
+from fastapi import Request
+from fastapi.routing import APIRoute
+from starlette.responses import Response
+
+from src.core.api.v1.routes.utils.resp_error import (
+    error_503_no_connection,
+    error_504_deadline_exceeded,
+)
+from src.core.configs.env import settings
+from src.core.infrastructure.database.core.deadline import (
+    request_deadline,
+    set_deadline,
+)
+
+LOGGER = logging.getLogger(settings.webconf.LOG_OUT_COMMON)
+
+
+class Deadline:
+    """Dependency setting the deadline of the request."""
+
+    def __init__(self, seconds: float) -> None:
+        """Initialize dependency.
+
+        :param seconds: Seconds the route may take.
+        """
+        self.seconds = seconds
+
+    async def __call__(self) -> None:
+        """Set the deadline, counted from now.
+
+        :return: None
+        """
+        set_deadline(self.seconds)
+
+
+class DeadlineRoute(APIRoute):
+    """Route answering 503 or 504 once its ``Deadline`` expires.
+
+    504 when the deadline expired while the database was queried, 503
+    when no connection was got in time.
+    """
+
+    def get_route_handler(
+        self,
+    ) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        """Wrap the handler to run it under the request deadline.
+
+        :return: Route handler.
+        """
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            try:
+                async with request_deadline() as deadline:
+                    return await handler(request)
+            except TimeoutError:
+                if not deadline.timeout.expired():
+                    raise
+                LOGGER.warning("Deadline exceeded: %s", request.url.path)
+                if deadline.connected:
+                    raise error_504_deadline_exceeded()
+                raise error_503_no_connection()
+
+        return route_handler
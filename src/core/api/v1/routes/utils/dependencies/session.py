@@ -0,0 +1,31 @@
+"""Request database session."""
+
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.infrastructure.database import db
+
+
+async def get_session() -> AsyncIterator[AsyncSession]:
+    """Open the session of the request.
+
+    One session per request from the shared sessionmaker, closed once
+    the endpoint is done.
+
+    :return: AsyncSession
+    """
+    async with db.session() as session:
+        yield session
+
+
+async def get_catalog_session() -> AsyncIterator[AsyncSession]:
+    """Open the session of a request answered with an ETag.
+
+    Its reads are at least at the catalog version of the ETag, see
+    ``Connector.catalog_session``.
+
+    :return: AsyncSession
+    """
+    async with db.catalog_session() as session:
+        yield session
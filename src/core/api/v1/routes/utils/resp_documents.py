@@ -0,0 +1,104 @@
+"""Response util for organization JSON documents."""
+
+import json
+from typing import List
+
+from starlette import status
+from starlette.responses import Response
+
+from src.core.api.v1.routes.utils.cursor import encode_cursor
+from src.core.infrastructure.database.cruds.documents import DocumentPage
+
+
+def resp_body(body: bytes) -> Response:
+    """Return JSON response of an already serialized body.
+
+    :param body: Body, e.g. served from the response cache.
+    :return: Response with the body.
+    """
+    return Response(
+        content=body,
+        status_code=status.HTTP_200_OK,
+        media_type="application/json",
+    )
+
+
+def resp_documents(page: DocumentPage) -> Response:
+    """Return CollectionOrganizationResponse built from database documents.
+
+    :param page: Page of JSON documents of organizations.
+    :return: Response with the collection as body.
+    """
+    next_cursor = (
+        encode_cursor(page.last_id) if page.last_id is not None else None
+    )
+    return Response(
+        content=(
+            f'{{"organizations":[{",".join(page.documents)}],'
+            f'"next_cursor":{json.dumps(next_cursor)}}}'
+        ),
+        status_code=status.HTTP_200_OK,
+        media_type="application/json",
+    )
+
+
+def resp_collection(documents: List[str]) -> Response:
+    """Return unpaginated collection of database documents.
+
+    :param documents: JSON documents, in response order.
+    :return: Response with the collection as body.
+    """
+    return Response(
+        content=f'{{"organizations":[{",".join(documents)}]}}',
+        status_code=status.HTTP_200_OK,
+        media_type="application/json",
+    )
+
+
+def resp_autocomplete(
+    suggestions: List[tuple[int, str]], documents: List[str]
+) -> Response:
+    """Return AutocompleteResponse.
+
+    :param suggestions: Organization IDs and names.
+    :param documents: JSON documents of the top suggestions.
+    :return: Response with suggestions and documents as body.
+    """
+    suggested = json.dumps(
+        [{"id": id_, "name": name} for id_, name in suggestions],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return Response(
+        content=(
+            f'{{"suggestions":{suggested},'
+            f'"organizations":[{",".join(documents)}]}}'
+        ),
+        status_code=status.HTTP_200_OK,
+        media_type="application/json",
+    )
+
+
+def resp_batch(
+    documents: List[str], missing_ids: List[int], missing_names: List[str]
+) -> Response:
+    """Return BatchOrganizationResponse.
+
+    :param documents: JSON documents in request order.
+    :param missing_ids: Requested IDs without organization.
+    :param missing_names: Requested names without organization.
+    :return: Response with documents and misses as body.
+    """
+    missing = json.dumps(
+        {"ids": missing_ids, "names": missing_names},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return Response(
+        content=(
+            f'{{"organizations":[{",".join(documents)}],'
+            f'"missing":{missing}}}'
+        ),
+        status_code=status.HTTP_200_OK,
+        media_type="application/json",
+    )
@@ -1,4 +1,4 @@
-"""Error 404 response util."""
+"""Error response utils."""
 
 from fastapi import HTTPException
 from starlette import status
@@ -18,3 +18,61 @@ def error_404_not_found() -> HTTPException:
             error_message="Organization not found.",
         ).model_dump(),
     )
+
+
+def error_422_invalid_cursor() -> HTTPException:
+    """Return 422 Unprocessable Entity for a malformed page cursor.
+
+    :return HTTPException: HTTP Unprocessable Entity.
+    """
+    return HTTPException(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        detail=ErrResponse(
+            error_type="ValidationError",
+            error_message="Cursor is invalid.",
+        ).model_dump(),
+    )
+
+
+def error_503_database_error() -> HTTPException:
+    """Return 503 Service Unavailable for a failed database query.
+
+    :return HTTPException: HTTP Service Unavailable.
+    """
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=ErrResponse(
+            error_type="Unavailable",
+            error_message="Database query failed.",
+        ).model_dump(),
+    )
+
+
+def error_503_no_connection() -> HTTPException:
+    """Return 503 Service Unavailable for a deadline spent waiting.
+
+    The request got no database connection before its deadline.
+
+    :return HTTPException: HTTP Service Unavailable.
+    """
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=ErrResponse(
+            error_type="Unavailable",
+            error_message="No database connection before the deadline.",
+        ).model_dump(),
+    )
+
+
+def error_504_deadline_exceeded() -> HTTPException:
+    """Return 504 Gateway Timeout for a query cancelled at the deadline.
+
+    :return HTTPException: HTTP Gateway Timeout.
+    """
+    return HTTPException(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        detail=ErrResponse(
+            error_type="Timeout",
+            error_message="Request deadline exceeded.",
+        ).model_dump(),
+    )
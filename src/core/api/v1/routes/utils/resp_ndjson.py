@@ -0,0 +1,125 @@
+"""Response util for streaming organization documents as NDJSON."""
+
+from contextlib import aclosing
+from typing import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Optional,
+)
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from src.core.api.v1.routes.utils.resp_error import error_404_not_found
+from src.core.infrastructure.database import db
+from src.core.infrastructure.database.core.deadline import OUTLIVES_REQUEST
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+NDJSON_CHUNK_SIZE = 64 * 1024
+
+DocumentStream = Callable[[AsyncSession], AsyncIterator[str]]
+
+# Checks the streamed collection exists, e.g. its activity.
+CollectionExists = Callable[[AsyncSession], Awaitable[bool]]
+
+
+async def ndjson_chunks(
+    stream: DocumentStream,
+) -> AsyncGenerator[str, None]:
+    """Join documents into NDJSON chunks of about ``NDJSON_CHUNK_SIZE``.
+
+    :param stream: Documents stream opened on the given session.
+    :return: NDJSON chunks, one document per line.
+    """
+    async with db.catalog_session({OUTLIVES_REQUEST: True}) as session:
+        lines: list[str] = []
+        size = 0
+        async for document in stream(session):
+            lines.append(f"{document}\n")
+            size += len(document) + 1
+            if size >= NDJSON_CHUNK_SIZE:
+                yield "".join(lines)
+                lines.clear()
+                size = 0
+        if lines:
+            yield "".join(lines)
+
+
+async def prepend(
+    first: str, rest: AsyncGenerator[str, None]
+) -> AsyncGenerator[str, None]:
+    """Yield the already fetched chunk before the rest of the stream.
+
+    :param first: First chunk.
+    :param rest: Remaining chunks, closed with this stream.
+    :return: All chunks.
+    """
+    async with aclosing(rest):
+        yield first
+        async for chunk in rest:
+            yield chunk
+
+
+class NDJSONResponse(StreamingResponse):
+    """Streaming response closing its chunks when the response ends.
+
+    When the client disconnects mid-stream Starlette stops iterating the
+    chunks but leaves them suspended, with the session of the stream
+    checked out until the garbage collector finalizes them.
+    """
+
+    body_iterator: AsyncGenerator[str, None]
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Send the stream, then close it however sending ended.
+
+        :param scope: Request scope.
+        :param receive: Receive channel.
+        :param send: Send channel.
+        :return: None
+        """
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self.body_iterator.aclose()
+
+
+async def resp_ndjson(
+    stream: DocumentStream, exists: Optional[CollectionExists] = None
+) -> NDJSONResponse:
+    """Return organization documents as NDJSON stream.
+
+    The first chunk is fetched before the response starts, so a missing
+    collection or a failing query still gets a proper status code. It
+    is fetched under the request deadline, which the rest of the
+    stream, sent after the handler returned, is not limited by.
+
+    An empty stream of an existing collection is an empty body, as an
+    empty page is for JSON.
+
+    :param stream: Documents stream opened on the given session.
+    :param exists: Checks the collection exists when nothing was
+        streamed, any empty stream is ``200`` without it.
+    :return: NDJSONResponse with one document per line.
+    :raises HTTPException: The collection does not exist.
+    """
+    chunks = ndjson_chunks(stream)
+    try:
+        first = await anext(chunks)
+    except StopAsyncIteration:
+        if exists is not None:
+            async with db.catalog_session() as session:
+                if not await exists(session):
+                    raise error_404_not_found()
+        first = ""
+    return NDJSONResponse(
+        prepend(first, chunks),
+        status_code=status.HTTP_200_OK,
+        media_type=NDJSON_MEDIA_TYPE,
+    )
@@ -0,0 +1,209 @@
+"""In-process execution of batched sub-requests."""
+
+import asyncio
+import json
+import logging
+from typing import Any, List, NamedTuple
+from urllib.parse import urlencode
+
+from starlette import status
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Scope
+
+from src.core.api.v1.presentation.requests.batch import BatchItemRequest
+from src.core.api.v1.presentation.responses.error import ErrResponse
+from src.core.configs.env import settings
+
+LOGGER = logging.getLogger(settings.webconf.LOG_OUT_COMMON)
+
+FORWARDED_HEADERS = (b"x-api-key",)
+
+# Scope key of sub-requests, admitted along with their batch request.
+SUBREQUEST = "subrequest"
+
+
+class SubResponse(NamedTuple):
+    """Status and JSON body of a sub-request.
+
+    Attributes:
+        status (int): HTTP status.
+        body (bytes): JSON body, empty when the route sent none.
+    """
+
+    status: int
+    body: bytes
+
+
+def error_sub_response(
+    status_code: int, error_type: str, error_message: str
+) -> SubResponse:
+    """Return sub-response shaped as ``HTTPException`` detail.
+
+    :param status_code: HTTP status.
+    :param error_type: Error type.
+    :param error_message: Error message.
+    :return: SubResponse
+    """
+    detail = ErrResponse(error_type=error_type, error_message=error_message)
+    return SubResponse(
+        status=status_code,
+        body=json.dumps({"detail": detail.model_dump()}).encode(),
+    )
+
+
+def sub_scope(scope: Scope, prefix: str, item: BatchItemRequest) -> Scope:
+    """Build HTTP scope of a sub-request from the batch request scope.
+
+    :param scope: Scope of the batch request.
+    :param prefix: Path the batch route is mounted under.
+    :param item: Sub-request.
+    :return: Scope
+    """
+    path = f"{prefix}{item.path}"
+    headers = [
+        (name, value)
+        for name, value in scope["headers"]
+        if name in FORWARDED_HEADERS
+    ]
+    headers.append((b"accept", b"application/json"))
+    if item.body is not None:
+        headers.append((b"content-type", b"application/json"))
+    return {
+        "type": "http",
+        "asgi": scope.get("asgi", {"version": "3.0"}),
+        "http_version": scope.get("http_version", "1.1"),
+        "method": item.method,
+        "scheme": scope.get("scheme", "http"),
+        "server": scope.get("server"),
+        "client": scope.get("client"),
+        "root_path": scope.get("root_path", ""),
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": urlencode(item.query, doseq=True).encode(),
+        "headers": headers,
+        "state": {},
+        SUBREQUEST: True,
+    }
+
+
+async def dispatch(
+    app: ASGIApp, scope: Scope, prefix: str, item: BatchItemRequest
+) -> SubResponse:
+    """Run a sub-request through the application in process.
+
+    The route opens its own session, like a separate HTTP request.
+
+    :param app: ASGI application.
+    :param scope: Scope of the batch request.
+    :param prefix: Path the batch route is mounted under.
+    :param item: Sub-request.
+    :return: SubResponse
+    """
+    body = b"" if item.body is None else json.dumps(item.body).encode()
+    request_sent = False
+    response_done = asyncio.Event()
+    status_code: int | None = None
+    chunks: List[bytes] = []
+
+    async def receive() -> Message:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await response_done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                response_done.set()
+
+    try:
+        await app(sub_scope(scope, prefix, item), receive, send)
+    except Exception as e:
+        # The error middleware re-raises after sending its 500 response.
+        LOGGER.error("Sub-request %s failed: %s", item.path, e)
+        if status_code is None:
+            return error_sub_response(
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "InternalError",
+                "Sub-request failed.",
+            )
+    finally:
+        response_done.set()
+    return SubResponse(status=status_code or 500, body=b"".join(chunks))
+
+
+async def dispatch_all(
+    app: ASGIApp,
+    scope: Scope,
+    prefix: str,
+    items: List[BatchItemRequest],
+    timeout: float,
+) -> List[SubResponse]:
+    """Run sub-requests concurrently under one deadline.
+
+    Sub-requests still running at the deadline are cancelled and
+    answered with 504.
+
+    :param app: ASGI application.
+    :param scope: Scope of the batch request.
+    :param prefix: Path the batch route is mounted under.
+    :param items: Sub-requests.
+    :param timeout: Deadline in seconds.
+    :return: Sub-responses in the order of sub-requests.
+    """
+    tasks = [
+        asyncio.create_task(dispatch(app, scope, prefix, item))
+        for item in items
+    ]
+    _, pending = await asyncio.wait(tasks, timeout=timeout)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+    timeout_response = error_sub_response(
+        status.HTTP_504_GATEWAY_TIMEOUT,
+        "Timeout",
+        "Batch deadline exceeded.",
+    )
+    return [
+        timeout_response if task in pending else task.result()
+        for task in tasks
+    ]
+
+
+def is_json(body: bytes) -> bool:
+    """Return whether the body can be embedded as JSON.
+
+    :param body: Response body.
+    :return: bool
+    """
+    try:
+        json.loads(body)
+    except ValueError:
+        return False
+    return True
+
+
+def resp_sub_responses(responses: List[SubResponse]) -> Response:
+    """Return BatchResponse with sub-response bodies embedded as is.
+
+    :param responses: Sub-responses.
+    :return: Response
+    """
+    items: List[str] = []
+    for response in responses:
+        body: Any = response.body.decode() if response.body else "null"
+        if response.body and not is_json(response.body):
+            body = json.dumps(body)
+        items.append(f'{{"status":{response.status},"body":{body}}}')
+    return Response(
+        content=f'{{"responses":[{",".join(items)}]}}',
+        status_code=status.HTTP_200_OK,
+        media_type="application/json",
+    )
@@ -2,7 +2,7 @@
 
 from os import cpu_count
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Dict, Literal
 
 from pydantic import Field, ValidationError
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -53,6 +53,59 @@ class DataBaseClientEnvConf(EnvironmentSetting):
         POSTGRES_DB (str): The name of the PostgresSQL database.
         POSTGRES_PASSWORD (str): The password for the PostgresSQL user.
         ECHO (bool): A flag to enable or disable SQLAlchemy query logging.
+        SPATIAL_INDEX_ENABLED (bool): Answer location filters from
+            the in-process spatial index instead of PostGIS.
+        SPATIAL_INDEX_REFRESH_SECONDS (int): Spatial index refresh period.
+        AUTOCOMPLETE_ENABLED (bool): Serve autocomplete from memory.
+        AUTOCOMPLETE_REFRESH_SECONDS (int): Period of loading new names.
+        AUTOCOMPLETE_FULL_REFRESH_EVERY (int): Refreshes between rebuilds,
+            which pick up renamed and deleted organizations.
+        POSTGRES_REPLICA_HOSTS (str): Comma separated ``host:port`` of
+            read replicas, same user and database as the primary.
+        REPLICA_ROUTING (str): Replica choice, ``round_robin`` or
+            ``least_connections``.
+        REPLICA_MAX_LAG_SECONDS (float): Replicas lagging more get no
+            reads.
+        REPLICA_LAG_CHECK_SECONDS (int): Replication lag check period.
+        POOL_HEALTH_CHECK_SECONDS (int): Period of pinging the databases,
+            connections are not pinged on checkout.
+        RESPONSE_CACHE_ENABLED (bool): Cache serialized responses.
+        RESPONSE_CACHE_TTL_SECONDS (Dict[str, float]): Seconds responses
+            are cached, by method, methods missing are not cached.
+        RESPONSE_CACHE_SOFT_TTL_SECONDS (Dict[str, float]): Seconds
+            responses are fresh, by method. Older ones are served while
+            reloaded in the background until their TTL.
+        RESPONSE_CACHE_MAX_PENDING_REFRESHES (int): Max stale responses
+            queued for reload.
+        RESPONSE_CACHE_REFRESH_CONCURRENCY (int): Max stale responses
+            reloaded at a time.
+        RESPONSE_CACHE_MAX_ENTRIES (int): Max cached responses.
+        RESPONSE_CACHE_MAX_BYTES (int): Max size of cached responses.
+        SHARED_CACHE_ENABLED (bool): Share cached responses between the
+            workers of the node, needs ``RESPONSE_CACHE_ENABLED``.
+        SHARED_CACHE_PATH (str): File of the shared cache, memory-backed.
+        SHARED_CACHE_SLOTS (int): Responses the shared cache holds.
+        SHARED_CACHE_SLOT_BYTES (int): Size of a slot, larger responses
+            are cached per worker only. Zero fits a page of
+            ``PAGE_LIMIT_DEFAULT`` documents.
+        SHARED_CACHE_DOCUMENT_BYTES (int): Size of an organization
+            document slots are sized by.
+        CATALOG_VERSION_ENABLED (bool): Poll the catalog version, enables
+            ETags and versioned cache keys.
+        CATALOG_VERSION_CHECK_SECONDS (float): Catalog version poll
+            period, changes are seen by ETags that much later.
+        KEY_FILTER_ENABLED (bool): Answer lookups of missing organization
+            IDs and names from memory, needs ``CATALOG_VERSION_ENABLED``.
+        KEY_FILTER_ERROR_RATE (float): Share of missing keys still
+            looked up in the database.
+        KEY_FILTER_REBUILD_SECONDS (float): Min seconds between rebuilds
+            of the key filter, it is bypassed while behind the catalog.
+        NEGATIVE_CACHE_ENABLED (bool): Cache not found name lookups.
+        NEGATIVE_CACHE_TTL_SECONDS (float): Seconds a not found response
+            is cached, new organizations may be unseen that long.
+        NEGATIVE_CACHE_MAX_ENTRIES (int): Max cached not found responses.
+        SINGLE_FLIGHT_ENABLED (bool): Share one load between identical
+            concurrent requests of cached methods.
     """
 
     POSTGRES_HOST: str
@@ -64,6 +117,52 @@ class DataBaseClientEnvConf(EnvironmentSetting):
     POOL_TIMEOUT: int
     POOL_SIZE_SQL_ALCHEMY_CONF: int
     MAX_OVERFLOW: int
+    STREAM_YIELD_PER: int = Field(default=500)
+    SPATIAL_INDEX_ENABLED: bool = Field(default=False)
+    SPATIAL_INDEX_REFRESH_SECONDS: int = Field(default=300)
+    AUTOCOMPLETE_ENABLED: bool = Field(default=False)
+    AUTOCOMPLETE_REFRESH_SECONDS: int = Field(default=60)
+    AUTOCOMPLETE_FULL_REFRESH_EVERY: int = Field(default=60)
+    POSTGRES_REPLICA_HOSTS: str = Field(default="")
+    REPLICA_ROUTING: Literal["round_robin", "least_connections"] = Field(
+        default="round_robin"
+    )
+    REPLICA_MAX_LAG_SECONDS: float = Field(default=5.0)
+    REPLICA_LAG_CHECK_SECONDS: int = Field(default=5)
+    POOL_HEALTH_CHECK_SECONDS: int = Field(default=30)
+    RESPONSE_CACHE_ENABLED: bool = Field(default=False)
+    RESPONSE_CACHE_TTL_SECONDS: Dict[str, float] = Field(
+        default={
+            "org_by_id": 60.0,
+            "org_by_name": 60.0,
+            "org_by_building": 30.0,
+            "org_by_activity_tree": 60.0,
+        }
+    )
+    RESPONSE_CACHE_SOFT_TTL_SECONDS: Dict[str, float] = Field(
+        default={
+            "org_by_building": 20.0,
+            "org_by_activity_tree": 45.0,
+        }
+    )
+    RESPONSE_CACHE_MAX_PENDING_REFRESHES: int = Field(default=1000)
+    RESPONSE_CACHE_REFRESH_CONCURRENCY: int = Field(default=4)
+    RESPONSE_CACHE_MAX_ENTRIES: int = Field(default=10000)
+    RESPONSE_CACHE_MAX_BYTES: int = Field(default=64 * 1024 * 1024)
+    SHARED_CACHE_ENABLED: bool = Field(default=False)
+    SHARED_CACHE_PATH: str = Field(default="/dev/shm/org_response_cache")
+    SHARED_CACHE_SLOTS: int = Field(default=1024)
+    SHARED_CACHE_SLOT_BYTES: int = Field(default=0)
+    SHARED_CACHE_DOCUMENT_BYTES: int = Field(default=512)
+    CATALOG_VERSION_ENABLED: bool = Field(default=False)
+    CATALOG_VERSION_CHECK_SECONDS: float = Field(default=1.0)
+    KEY_FILTER_ENABLED: bool = Field(default=False)
+    KEY_FILTER_ERROR_RATE: float = Field(default=0.01)
+    KEY_FILTER_REBUILD_SECONDS: float = Field(default=30.0)
+    NEGATIVE_CACHE_ENABLED: bool = Field(default=False)
+    NEGATIVE_CACHE_TTL_SECONDS: float = Field(default=5.0)
+    NEGATIVE_CACHE_MAX_ENTRIES: int = Field(default=100000)
+    SINGLE_FLIGHT_ENABLED: bool = Field(default=False)
     MODE: Literal["prod", "test", "dev"]
 
     @property
@@ -82,6 +181,20 @@ class DataBaseClientEnvConf(EnvironmentSetting):
             f"{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
         )
 
+    @property
+    def get_url_replicas(self) -> list[str]:
+        """Return the database URLs of read replicas.
+
+        Returns:
+            list[str]: URLs in the order of ``POSTGRES_REPLICA_HOSTS``.
+        """
+        return [
+            f"postgresql+asyncpg://{self.POSTGRES_USER}:"
+            f"{self.POSTGRES_PASSWORD}@{host.strip()}/{self.POSTGRES_DB}"
+            for host in self.POSTGRES_REPLICA_HOSTS.split(",")
+            if host.strip()
+        ]
+
 
 LogType = Literal["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG", "NOTSET"]
 
@@ -103,6 +216,16 @@ class WebConfig(EnvironmentSetting):
     FORMATTER_STREAM_LOG: str
     HOST_LOGS: str
     HTTP_LOG_LEVEL: LogType
+    PAGE_LIMIT_DEFAULT: int = Field(default=100)
+    PAGE_LIMIT_MAX: int = Field(default=1000)
+    BATCH_LIMIT_MAX: int = Field(default=100)
+    BATCH_REQUESTS_MAX: int = Field(default=20)
+    BATCH_TIMEOUT_SECONDS: float = Field(default=5.0)
+    ADMISSION_ENABLED: bool = Field(default=False)
+    ADMISSION_DEFAULT_LIMIT: int = Field(default=64)
+    ADMISSION_ROUTE_LIMITS: Dict[str, int] = Field(
+        default={"/v1/org/location": 16, "/v1/org/nearest": 16}
+    )
 
     LOG_OUT_COMMON: Literal[
         "json",
@@ -0,0 +1,6 @@
+"""Background tasks of a worker."""
+
+from src.core.infrastructure.background.periodic import PeriodicTask
+from src.core.infrastructure.background.revalidate import Revalidator
+
+__all__ = ["PeriodicTask", "Revalidator"]
@@ -0,0 +1,66 @@
+"""Periodic background task."""
+
+import asyncio
+import logging
+from contextlib import suppress
+from typing import Awaitable, Callable, Optional
+
+from src.core.configs.env import settings
+
+LOGGER = logging.getLogger(settings.webconf.LOG_OUT_COMMON)
+
+
+class PeriodicTask:
+    """Run a coroutine function every ``interval`` seconds.
+
+    Failures are logged and the next run is scheduled as usual.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[None]],
+        interval: float,
+    ) -> None:
+        """Initialize task, started by ``start``.
+
+        :param name: Task name used in logs.
+        :param func: Coroutine function to run.
+        :param interval: Seconds between runs.
+        """
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def start(self) -> None:
+        """Schedule the task on the running loop.
+
+        :return: None
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=self.name)
+
+    async def stop(self) -> None:
+        """Cancel the task and wait for it.
+
+        :return: None
+        """
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        """Run ``func`` forever with ``interval`` pauses.
+
+        :return: None
+        """
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.func()
+            except Exception as e:
+                LOGGER.error("Periodic task %s failed: %s", self.name, e)
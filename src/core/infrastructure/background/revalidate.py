@@ -0,0 +1,109 @@
+"""Background reload of stale cached responses."""
+
+import asyncio
+import logging
+from contextlib import suppress
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from src.core.configs.env import settings
+
+LOGGER = logging.getLogger(settings.webconf.LOG_OUT_COMMON)
+
+Refresh = Callable[[], Awaitable[Any]]
+
+
+class Revalidator:
+    """Reload stale cached responses in background tasks.
+
+    Up to ``concurrency`` refreshes run at a time, so a slow one does
+    not hold the others back, nor do they take more connections than
+    that. Refreshes of keys already queued are skipped. While the
+    queue is full or the tasks are not running refreshes are dropped,
+    the stale response is then served until it expires. Counts are per
+    process.
+    """
+
+    def __init__(self, max_pending: int, concurrency: int) -> None:
+        """Initialize revalidator, started by ``start``.
+
+        :param max_pending: Max refreshes queued or running.
+        :param concurrency: Max refreshes running at a time.
+        """
+        self.max_pending = max_pending
+        self.concurrency = concurrency
+        self._queue: Optional[asyncio.Queue[tuple[str, Refresh]]] = None
+        self._pending: Set[str] = set()
+        self._tasks: List[asyncio.Task[None]] = []
+        self.counts: Dict[str, int] = {
+            "queued": 0,
+            "dropped": 0,
+            "refreshed": 0,
+            "failed": 0,
+        }
+
+    def submit(self, key: str, refresh: Refresh) -> None:
+        """Queue the refresh of the key unless it is queued already.
+
+        :param key: Cache key.
+        :param refresh: Reloads and caches the response.
+        :return: None
+        """
+        if key in self._pending:
+            return
+        if self._queue is None or len(self._pending) >= self.max_pending:
+            self.counts["dropped"] += 1
+            return
+        self._pending.add(key)
+        self._queue.put_nowait((key, refresh))
+        self.counts["queued"] += 1
+
+    def start(self) -> None:
+        """Schedule the tasks on the running loop.
+
+        :return: None
+        """
+        if not self._tasks:
+            queue: asyncio.Queue[tuple[str, Refresh]] = asyncio.Queue()
+            self._queue = queue
+            self._tasks = [
+                asyncio.create_task(self._run(queue), name=f"revalidate-{i}")
+                for i in range(self.concurrency)
+            ]
+
+    async def stop(self) -> None:
+        """Cancel the tasks and drop queued refreshes.
+
+        :return: None
+        """
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+        self._queue = None
+        self._pending.clear()
+
+    def snapshot(self) -> Dict[str, int]:
+        """Return queued refreshes and copy of the counters.
+
+        :return: Counters.
+        """
+        return {"pending": len(self._pending), **self.counts}
+
+    async def _run(self, queue: asyncio.Queue[tuple[str, Refresh]]) -> None:
+        """Run queued refreshes forever, one at a time.
+
+        :param queue: Queued keys and refreshes.
+        :return: None
+        """
+        while True:
+            key, refresh = await queue.get()
+            try:
+                await refresh()
+                self.counts["refreshed"] += 1
+            except Exception as e:
+                self.counts["failed"] += 1
+                LOGGER.error("Revalidation of %s failed: %s", key, e)
+            finally:
+                self._pending.discard(key)
@@ -0,0 +1,24 @@
+"""Caches of serialized API responses."""
+
+from src.core.infrastructure.cache.flight import LeaderCancelled, SingleFlight
+from src.core.infrastructure.cache.negative import NegativeCache
+from src.core.infrastructure.cache.response import (
+    Loader,
+    ResponseCache,
+    cache_key,
+)
+from src.core.infrastructure.cache.shared import (
+    SharedResponseCache,
+    configured_slot_bytes,
+)
+
+__all__ = [
+    "LeaderCancelled",
+    "Loader",
+    "NegativeCache",
+    "ResponseCache",
+    "SharedResponseCache",
+    "SingleFlight",
+    "cache_key",
+    "configured_slot_bytes",
+]
@@ -0,0 +1,112 @@
+"""Coalescing of identical concurrent loads."""
+
+import asyncio
+from typing import Any, Dict, Mapping, Optional
+
+from src.core.infrastructure.cache.response import Loader, cache_key
+
+
+class LeaderCancelled(Exception):
+    """Load of the key was cancelled with the request that ran it."""
+
+
+class SingleFlight:
+    """Runs one load per key at a time, shared by concurrent callers.
+
+    The first caller of a key runs the load, callers arriving while it
+    runs await its result or error instead of loading again. Callers
+    of a load cancelled with its request retry it, one of them as the
+    new leader. Counts are per process.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no loads in flight."""
+        self._calls: Dict[str, asyncio.Future[Optional[bytes]]] = {}
+        self.counts: Dict[str, Dict[str, int]] = {}
+
+    def __len__(self) -> int:
+        """Return number of loads in flight.
+
+        :return: int
+        """
+        return len(self._calls)
+
+    def record(self, method: str, outcome: str) -> None:
+        """Count one call.
+
+        :param method: Cached method name.
+        :param outcome: ``executed`` or ``coalesced``.
+        :return: None
+        """
+        counts = self.counts.setdefault(
+            method, {"executed": 0, "coalesced": 0}
+        )
+        counts[outcome] += 1
+
+    async def do(
+        self, method: str, params: Mapping[str, Any], load: Loader
+    ) -> Optional[bytes]:
+        """Return result of the load, joining one in flight.
+
+        :param method: Cached method name.
+        :param params: Arguments the response depends on.
+        :param load: Builds the response body.
+        :return: Body or ``None``.
+        """
+        key = cache_key(method, params)
+        # Counted once served, a waiter taking over a cancelled load
+        # is counted as executed only.
+        while (future := self._calls.get(key)) is not None:
+            try:
+                body = await asyncio.shield(future)
+            except LeaderCancelled:
+                continue
+            except Exception:
+                self.record(method, "coalesced")
+                raise
+            self.record(method, "coalesced")
+            return body
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        self.record(method, "executed")
+        try:
+            body = await load()
+        except asyncio.CancelledError:
+            self._fail(key, future, LeaderCancelled())
+            raise
+        except Exception as e:
+            self._fail(key, future, e)
+            raise
+        del self._calls[key]
+        future.set_result(body)
+        return body
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return loads in flight and copy of the counters.
+
+        :return: Loads in flight and counters by method name.
+        """
+        return {
+            "in_flight": len(self._calls),
+            "methods": {
+                method: dict(counts) for method, counts in self.counts.items()
+            },
+        }
+
+    def _fail(
+        self,
+        key: str,
+        future: asyncio.Future[Optional[bytes]],
+        error: BaseException,
+    ) -> None:
+        """Hand the error of the load to its waiting callers.
+
+        :param key: Key.
+        :param future: Future of the load.
+        :param error: Error of the load.
+        :return: None
+        """
+        del self._calls[key]
+        future.set_exception(error)
+        # Retrieved, so a load nobody joined is not reported by asyncio.
+        future.exception()
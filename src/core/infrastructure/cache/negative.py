@@ -0,0 +1,69 @@
+"""Short-lived cache of not found responses."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Mapping
+
+from src.core.infrastructure.cache.response import cache_key
+
+
+class NegativeCache:
+    """Requests answered not found, kept for a short TTL.
+
+    Bounded, the oldest entries are dropped first. Counts are per
+    process.
+    """
+
+    def __init__(self, ttl: float, max_entries: int) -> None:
+        """Initialize empty cache.
+
+        :param ttl: Seconds a miss is remembered.
+        :param max_entries: Max number of entries.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._expires: OrderedDict[str, float] = OrderedDict()
+        self.counts: Dict[str, int] = {"hit": 0, "miss": 0, "added": 0}
+
+    def __contains__(self, key: str) -> bool:
+        """Check the key was recently not found.
+
+        :param key: Key built by ``cache_key``.
+        :return: bool
+        """
+        expires = self._expires.get(key)
+        if expires is not None and expires <= time.monotonic():
+            del self._expires[key]
+            expires = None
+        self.counts["miss" if expires is None else "hit"] += 1
+        return expires is not None
+
+    def known_missing(self, method: str, params: Mapping[str, Any]) -> bool:
+        """Check the request was recently answered not found.
+
+        :param method: Cached method name.
+        :param params: Arguments the response depends on.
+        :return: bool
+        """
+        return cache_key(method, params) in self
+
+    def add(self, method: str, params: Mapping[str, Any]) -> None:
+        """Remember the request was answered not found.
+
+        :param method: Cached method name.
+        :param params: Arguments the response depends on.
+        :return: None
+        """
+        key = cache_key(method, params)
+        self._expires.pop(key, None)
+        self._expires[key] = time.monotonic() + self.ttl
+        self.counts["added"] += 1
+        while len(self._expires) > self.max_entries:
+            self._expires.popitem(last=False)
+
+    def snapshot(self) -> Dict[str, int]:
+        """Return copy of the counters.
+
+        :return: Counters.
+        """
+        return {"entries": len(self._expires), **self.counts}
@@ -0,0 +1,294 @@
+"""TTL and LRU cache of serialized responses."""
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from src.core.configs.env import settings
+from src.core.infrastructure.cache.shared import SharedResponseCache
+
+LOGGER = logging.getLogger(settings.webconf.LOG_OUT_COMMON)
+
+# Loaders open their own session: stale entries are reloaded in the
+# background, after the request that cached them is done.
+Loader = Callable[[], Awaitable[Optional[bytes]]]
+
+
+def cache_key(method: str, params: Mapping[str, Any]) -> str:
+    """Build the key of a response.
+
+    Parameters are sorted and ``None`` values dropped, so the same
+    request gets the same key whatever the order of its arguments.
+
+    :param method: Cached method name.
+    :param params: Arguments the response depends on.
+    :return: Key.
+    """
+    return json.dumps(
+        [method, {k: v for k, v in params.items() if v is not None}],
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+
+
+class CacheEntry(NamedTuple):
+    """Cached response body.
+
+    Attributes:
+        method (str): Cached method name.
+        body (bytes): Serialized response.
+        size (int): Bytes counted against the cache limit.
+        stale (float): Monotonic time the entry is reloaded after.
+        expires (float): Monotonic time the entry expires at.
+    """
+
+    method: str
+    body: bytes
+    size: int
+    stale: float
+    expires: float
+
+
+class ResponseCache:
+    """Serialized responses with per-method TTL, bounded LRU.
+
+    Entries are evicted least recently used first once ``max_entries``
+    or ``max_bytes`` is exceeded. Methods without a TTL, or with
+    a TTL of zero, are not cached. Counts are per process.
+
+    Methods with a soft TTL shorter than their TTL serve entries older
+    than the soft TTL as stale, the caller reloads them meanwhile, see
+    ``lookup``. Only expired entries make callers wait for a load.
+
+    With ``shared``, misses are looked up in the cache shared by the
+    workers of the node before loading, and loaded responses are
+    written to it, so a response is loaded once per node.
+    """
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float],
+        max_entries: int,
+        max_bytes: int,
+        shared: Optional[SharedResponseCache] = None,
+        soft_ttls: Optional[Mapping[str, float]] = None,
+    ) -> None:
+        """Initialize empty cache.
+
+        :param ttls: Seconds responses are kept, by method name.
+        :param max_entries: Max number of entries.
+        :param max_bytes: Max total size of keys and bodies.
+        :param shared: Cache shared by the workers of the node.
+        :param soft_ttls: Seconds responses are fresh, by method name.
+        """
+        self.ttls = dict(ttls)
+        self.soft_ttls = dict(soft_ttls or {})
+        self.shared = shared
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self.counts: Dict[str, Dict[str, int]] = {}
+
+    def __len__(self) -> int:
+        """Return number of entries.
+
+        :return: int
+        """
+        return len(self._entries)
+
+    def record(self, method: str, outcome: str) -> None:
+        """Count one cache outcome.
+
+        :param method: Cached method name.
+        :param outcome: ``hit``, ``stale``, ``miss``, ``expired`` or
+            ``eviction``.
+        :return: None
+        """
+        counts = self.counts.setdefault(
+            method,
+            {"hit": 0, "stale": 0, "miss": 0, "expired": 0, "eviction": 0},
+        )
+        counts[outcome] += 1
+
+    def get(self, method: str, params: Mapping[str, Any]) -> Optional[bytes]:
+        """Return the cached response, stale or not.
+
+        :param method: Cached method name.
+        :param params: Arguments the response depends on.
+        :return: Body, ``None`` when missing or expired.
+        """
+        return self.lookup(method, params)[0]
+
+    def lookup(
+        self, method: str, params: Mapping[str, Any]
+    ) -> Tuple[Optional[bytes], bool]:
+        """Return the cached response and whether it is stale.
+
+        :param method: Cached method name.
+        :param params: Arguments the response depends on.
+        :return: Body, ``None`` when missing or expired, and True when
+            it is past its soft TTL and due to be reloaded.
+        """
+        key = cache_key(method, params)
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is not None and entry.expires <= now:
+            self._remove(key)
+            self.record(method, "expired")
+            entry = None
+        if entry is None:
+            self.record(method, "miss")
+            return None, False
+        self._entries.move_to_end(key)
+        stale = entry.stale <= now
+        self.record(method, "stale" if stale else "hit")
+        return entry.body, stale
+
+    def set(
+        self,
+        method: str,
+        params: Mapping[str, Any],
+        body: bytes,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Cache the response, evicting least recently used ones.
+
+        :param method: Cached method name.
+        :param params: Arguments the response depends on.
+        :param body: Serialized response.
+        :param ttl: Seconds the response is kept, TTL of the method
+            by default.
+        :return: None
+        """
+        if ttl is None:
+            ttl = self.ttls.get(method, 0)
+        key = cache_key(method, params)
+        size = len(key.encode()) + len(body)
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        # Entries from the shared cache come with the rest of their TTL,
+        # they go stale as long before expiring as fresh ones.
+        full_ttl = self.ttls.get(method, 0)
+        window = max(full_ttl - self.soft_ttls.get(method, full_ttl), 0)
+        now = time.monotonic()
+        self._entries[key] = CacheEntry(
+            method, body, size, now + max(ttl - window, 0), now + ttl
+        )
+        self.size += size
+        while len(self._entries) > self.max_entries or (
+            self.size > self.max_bytes
+        ):
+            key, evicted = next(iter(self._entries.items()))
+            self._remove(key)
+            self.record(evicted.method, "eviction")
+
+    async def get_or_load(
+        self, method: str, params: Mapping[str, Any], load: Loader
+    ) -> Optional[bytes]:
+        """Return the cached response, loading and caching it on a miss.
+
+        ``None`` returned by the loader, e.g. not found, is not cached.
+
+        :param method: Cached method name.
+        :param params: Arguments the response depends on.
+        :param load: Builds the response body.
+        :return: Body or ``None``.
+        """
+        body = self.get(method, params)
+        if body is not None:
+            return body
+        return await self.fill(method, params, load)
+
+    async def fill(
+        self, method: str, params: Mapping[str, Any], load: Loader
+    ) -> Optional[bytes]:
+        """Load the response missing from this worker and cache it.
+
+        The shared cache is looked up before loading.
+
+        :param method: Cached method name.
+        :param params: Arguments the response depends on.
+        :param load: Builds the response body.
+        :return: Body or ``None``.
+        """
+        shared = self.shared if self.ttls.get(method, 0) > 0 else None
+        if shared is not None:
+            entry = shared.get(cache_key(method, params))
+            if entry is not None:
+                ttl = entry.expires - time.time()
+                self.set(method, params, entry.body, ttl)
+                return entry.body
+        return await self.refresh(method, params, load)
+
+    async def refresh(
+        self, method: str, params: Mapping[str, Any], load: Loader
+    ) -> Optional[bytes]:
+        """Load the response and cache it, replacing a stale one.
+
+        The shared cache is written but not read, it may hold the same
+        stale response. A response gone, e.g. not found, is dropped.
+
+        :param method: Cached method name.
+        :param params: Arguments the response depends on.
+        :param load: Builds the response body.
+        :return: Body or ``None``.
+        """
+        body = await load()
+        if body is None:
+            key = cache_key(method, params)
+            if key in self._entries:
+                self._remove(key)
+            return None
+        self.set(method, params, body)
+        if self.shared is not None and self.ttls.get(method, 0) > 0:
+            self.shared.set(cache_key(method, params), body, self.ttls[method])
+        return body
+
+    def clear(self) -> None:
+        """Drop all entries, shared ones too, counters are kept.
+
+        :return: None
+        """
+        self._entries.clear()
+        self.size = 0
+        if self.shared is not None:
+            self.shared.clear()
+        LOGGER.info("Response cache cleared")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return size and copy of the counters.
+
+        :return: Entries, bytes and counters by method name.
+        """
+        return {
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "methods": {
+                method: dict(counts) for method, counts in self.counts.items()
+            },
+            "shared": None if self.shared is None else self.shared.snapshot(),
+        }
+
+    def _remove(self, key: str) -> None:
+        """Remove the entry.
+
+        :param key: Key.
+        :return: None
+        """
+        self.size -= self._entries.pop(key).size
@@ -0,0 +1,274 @@
+"""Response cache shared by the workers of a node.
+
+Responses are kept in fixed-size slots of a memory-mapped file, e.g.
+on ``/dev/shm``, which every worker maps. The slot of a key is given by
+its hash, a newer response of another key takes the slot over.
+
+Slots are sized to fit a page of organization documents, the largest
+response cached. Smaller ones leave the rest of their slot unused.
+
+Slots are guarded by a sequence lock: a writer makes the sequence odd,
+writes the entry and makes it even again, holding a ``lockf`` lock of
+the slot against other writers. Readers take no lock, they copy the
+entry and read it again when the sequence was odd or changed meanwhile,
+a few times at most.
+Entries are stamped with the generation of the file, ``clear`` bumps
+the generation and so invalidates all entries at once.
+"""
+
+import fcntl
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import time
+from typing import Dict, NamedTuple, Optional
+
+from src.core.configs.env import settings
+
+LOGGER = logging.getLogger(settings.webconf.LOG_OUT_COMMON)
+
+MAGIC = b"ORGCACHE"
+# Magic, slot count, slot size, generation.
+FILE_HEADER = struct.Struct("<8sIIQ")
+# Sequence, generation, key digest, expiry (UNIX time), body length.
+SLOT_HEADER = struct.Struct("<QQ16sdI")
+SEQUENCE = struct.Struct("<Q")
+HEADER_SIZE = 64
+SLOT_HEADER_SIZE = 48
+GENERATION_OFFSET = 16
+# Reads of a slot being written before it is deemed missing.
+READ_ATTEMPTS = 3
+# Collection around the documents of a page: key, cursor, commas.
+PAGE_ENVELOPE_BYTES = 256
+
+
+def page_slot_bytes(page_limit: int, document_bytes: int) -> int:
+    """Return size of a slot fitting a page of documents.
+
+    :param page_limit: Documents of a page.
+    :param document_bytes: Size of a document.
+    :return: Slot size, entry header included.
+    """
+    return (
+        SLOT_HEADER_SIZE
+        + PAGE_ENVELOPE_BYTES
+        + page_limit * (document_bytes + 1)
+    )
+
+
+def configured_slot_bytes() -> int:
+    """Return slot size of the settings.
+
+    :return: ``SHARED_CACHE_SLOT_BYTES``, or a slot fitting a page of
+        ``PAGE_LIMIT_DEFAULT`` documents when it is zero.
+    """
+    return settings.db.SHARED_CACHE_SLOT_BYTES or page_slot_bytes(
+        settings.webconf.PAGE_LIMIT_DEFAULT,
+        settings.db.SHARED_CACHE_DOCUMENT_BYTES,
+    )
+
+
+class SharedEntry(NamedTuple):
+    """Response read from a slot.
+
+    Attributes:
+        body (bytes): Serialized response.
+        expires (float): UNIX time the entry expires at.
+    """
+
+    body: bytes
+    expires: float
+
+
+class SharedResponseCache:
+    """Fixed-size slots of serialized responses in a shared file.
+
+    Counts are per process.
+    """
+
+    def __init__(self, path: str, slots: int, slot_bytes: int) -> None:
+        """Map the cache file, creating it when missing or of other layout.
+
+        :param path: Path of the file, shared by the workers.
+        :param slots: Number of slots.
+        :param slot_bytes: Size of a slot, entry header included.
+        """
+        self.path = path
+        self.slots = slots
+        self.slot_bytes = slot_bytes
+        self.max_body = slot_bytes - SLOT_HEADER_SIZE
+        self.counts: Dict[str, int] = {
+            "hit": 0,
+            "miss": 0,
+            "write": 0,
+            "busy": 0,
+            "oversize": 0,
+        }
+        size = HEADER_SIZE + slots * slot_bytes
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, HEADER_SIZE, 0, os.SEEK_SET)
+        try:
+            if os.fstat(self._fd).st_size != size:
+                os.ftruncate(self._fd, 0)
+                os.ftruncate(self._fd, size)
+            self._mm = mmap.mmap(self._fd, size)
+            magic, file_slots, file_slot_bytes, _ = FILE_HEADER.unpack_from(
+                self._mm, 0
+            )
+            if (magic, file_slots, file_slot_bytes) != (
+                MAGIC,
+                slots,
+                slot_bytes,
+            ):
+                FILE_HEADER.pack_into(self._mm, 0, MAGIC, slots, slot_bytes, 1)
+                LOGGER.info("Shared response cache created: %s", path)
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, HEADER_SIZE, 0, os.SEEK_SET)
+
+    @classmethod
+    def create(
+        cls, path: str, slots: int, slot_bytes: int
+    ) -> "SharedResponseCache":
+        """Create the cache file anew, dropping entries of a previous run.
+
+        Called by the gunicorn master before workers are forked.
+
+        :param path: Path of the file.
+        :param slots: Number of slots.
+        :param slot_bytes: Size of a slot.
+        :return: SharedResponseCache
+        """
+        if os.path.exists(path):
+            os.unlink(path)
+        return cls(path, slots, slot_bytes)
+
+    @property
+    def generation(self) -> int:
+        """Return generation entries must be stamped with to be valid.
+
+        :return: int
+        """
+        return SEQUENCE.unpack_from(self._mm, GENERATION_OFFSET)[0]
+
+    def slot_of(self, key: str) -> tuple[int, bytes]:
+        """Return offset of the slot of the key and the key digest.
+
+        :param key: Cache key.
+        :return: Offset and digest.
+        """
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        index = int.from_bytes(digest[:8], "little") % self.slots
+        return HEADER_SIZE + index * self.slot_bytes, digest
+
+    def get(self, key: str) -> Optional[SharedEntry]:
+        """Return the entry of the key without locking.
+
+        :param key: Cache key.
+        :return: Entry, ``None`` when missing, expired or being written.
+        """
+        offset, digest = self.slot_of(key)
+        entry = None
+        for _ in range(READ_ATTEMPTS):
+            sequence, generation, slot_digest, expires, length = (
+                SLOT_HEADER.unpack_from(self._mm, offset)
+            )
+            if sequence & 1:
+                continue
+            if (
+                generation != self.generation
+                or slot_digest != digest
+                or expires <= time.time()
+                or length > self.max_body
+            ):
+                # A consistent read of another or an invalid entry.
+                if SEQUENCE.unpack_from(self._mm, offset)[0] == sequence:
+                    break
+                continue
+            start = offset + SLOT_HEADER_SIZE
+            end = start + length
+            body = self._mm[start:end]
+            if SEQUENCE.unpack_from(self._mm, offset)[0] == sequence:
+                entry = SharedEntry(body, expires)
+                break
+        self.counts["miss" if entry is None else "hit"] += 1
+        return entry
+
+    def set(self, key: str, body: bytes, ttl: float) -> None:
+        """Write the entry, skipped while another worker writes the slot.
+
+        :param key: Cache key.
+        :param body: Serialized response.
+        :param ttl: Seconds the entry is valid.
+        :return: None
+        """
+        if len(body) > self.max_body:
+            self.counts["oversize"] += 1
+            return
+        offset, digest = self.slot_of(key)
+        try:
+            fcntl.lockf(
+                self._fd,
+                fcntl.LOCK_EX | fcntl.LOCK_NB,
+                self.slot_bytes,
+                offset,
+                os.SEEK_SET,
+            )
+        except OSError:
+            self.counts["busy"] += 1
+            return
+        try:
+            sequence = SEQUENCE.unpack_from(self._mm, offset)[0] | 1
+            SEQUENCE.pack_into(self._mm, offset, sequence)
+            start = offset + SLOT_HEADER_SIZE
+            end = start + len(body)
+            self._mm[start:end] = body
+            SLOT_HEADER.pack_into(
+                self._mm,
+                offset,
+                sequence,
+                self.generation,
+                digest,
+                time.time() + ttl,
+                len(body),
+            )
+            SEQUENCE.pack_into(self._mm, offset, sequence + 1)
+            self.counts["write"] += 1
+        finally:
+            fcntl.lockf(
+                self._fd,
+                fcntl.LOCK_UN,
+                self.slot_bytes,
+                offset,
+                os.SEEK_SET,
+            )
+
+    def clear(self) -> None:
+        """Invalidate entries of all workers by bumping the generation.
+
+        :return: None
+        """
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, HEADER_SIZE, 0, os.SEEK_SET)
+        try:
+            SEQUENCE.pack_into(
+                self._mm, GENERATION_OFFSET, self.generation + 1
+            )
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, HEADER_SIZE, 0, os.SEEK_SET)
+        LOGGER.info("Shared response cache cleared")
+
+    def snapshot(self) -> Dict[str, int]:
+        """Return copy of the counters.
+
+        :return: Counters.
+        """
+        return dict(self.counts)
+
+    def close(self) -> None:
+        """Unmap the file.
+
+        :return: None
+        """
+        self._mm.close()
+        os.close(self._fd)
@@ -1,5 +1,14 @@
 """DB package."""
 
+from src.core.configs.env import settings
+from src.core.infrastructure.background import Revalidator
+from src.core.infrastructure.cache import (
+    NegativeCache,
+    ResponseCache,
+    SharedResponseCache,
+    SingleFlight,
+    configured_slot_bytes,
+)
 from src.core.infrastructure.database.client import Connector
 from src.core.infrastructure.database.cruds.facade import Crud
 from src.core.infrastructure.database.cruds.models.activity import ActivityCRUD
@@ -14,6 +23,11 @@ from src.core.infrastructure.database.schemas.activity import (
 from src.core.infrastructure.database.schemas.buildings import Building
 from src.core.infrastructure.database.schemas.organizations import Organization
 from src.core.infrastructure.database.schemas.phones import PhoneNumber
+from src.core.infrastructure.search import (
+    AutocompleteIndex,
+    OrganizationKeyFilter,
+)
+from src.core.infrastructure.spatial import SpatialIndex
 
 
 def db_client() -> Connector:
@@ -22,9 +36,71 @@ def db_client() -> Connector:
     :return: Connector worker.
     """
     return Connector(
-        org=OrganizationCRUD(Organization),
+        org=OrganizationCRUD(
+            Organization,
+            autocomplete=(
+                AutocompleteIndex(
+                    full_refresh_every=(
+                        settings.db.AUTOCOMPLETE_FULL_REFRESH_EVERY
+                    )
+                )
+                if settings.db.AUTOCOMPLETE_ENABLED
+                else None
+            ),
+            key_filter=(
+                OrganizationKeyFilter(
+                    error_rate=settings.db.KEY_FILTER_ERROR_RATE,
+                    rebuild_seconds=settings.db.KEY_FILTER_REBUILD_SECONDS,
+                )
+                if settings.db.KEY_FILTER_ENABLED
+                else None
+            ),
+        ),
         activity=ActivityCRUD(Activity, Organization),
-        location=OrganizationByLocationCRUD(Organization, Building),
+        location=OrganizationByLocationCRUD(
+            Organization,
+            Building,
+            spatial_index=(
+                SpatialIndex() if settings.db.SPATIAL_INDEX_ENABLED else None
+            ),
+        ),
+        cache=(
+            ResponseCache(
+                ttls=settings.db.RESPONSE_CACHE_TTL_SECONDS,
+                soft_ttls=settings.db.RESPONSE_CACHE_SOFT_TTL_SECONDS,
+                max_entries=settings.db.RESPONSE_CACHE_MAX_ENTRIES,
+                max_bytes=settings.db.RESPONSE_CACHE_MAX_BYTES,
+                shared=(
+                    SharedResponseCache(
+                        path=settings.db.SHARED_CACHE_PATH,
+                        slots=settings.db.SHARED_CACHE_SLOTS,
+                        slot_bytes=configured_slot_bytes(),
+                    )
+                    if settings.db.SHARED_CACHE_ENABLED
+                    else None
+                ),
+            )
+            if settings.db.RESPONSE_CACHE_ENABLED
+            else None
+        ),
+        negative=(
+            NegativeCache(
+                ttl=settings.db.NEGATIVE_CACHE_TTL_SECONDS,
+                max_entries=settings.db.NEGATIVE_CACHE_MAX_ENTRIES,
+            )
+            if settings.db.NEGATIVE_CACHE_ENABLED
+            else None
+        ),
+        flight=SingleFlight() if settings.db.SINGLE_FLIGHT_ENABLED else None,
+        revalidator=(
+            Revalidator(
+                max_pending=settings.db.RESPONSE_CACHE_MAX_PENDING_REFRESHES,
+                concurrency=settings.db.RESPONSE_CACHE_REFRESH_CONCURRENCY,
+            )
+            if settings.db.RESPONSE_CACHE_ENABLED
+            and settings.db.RESPONSE_CACHE_SOFT_TTL_SECONDS
+            else None
+        ),
     )
 
 
@@ -1,22 +1,30 @@
 """Create connect to database session."""
 
 import logging
-from typing import Any
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, List, Mapping, Optional
 
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.configs.env import settings
 from src.core.infrastructure.database.core.engine import (
     ClientDatabase,
     get_engine,
 )
+from src.core.infrastructure.database.core.replicas import RoutingSession
+from src.core.infrastructure.database.cruds.catalog import (
+    get_catalog_version,
+)
 from src.core.infrastructure.database.cruds.facade import Crud
+from src.core.infrastructure.database.cruds.statements import (
+    WarmUpStatement,
+)
 
 LOGGER = logging.getLogger(settings.webconf.LOG_OUT_COMMON)
 
 
 class Connector(Crud):
-    """Database mq and _session management using context manager."""
+    """Database engine and session management."""
 
     @classmethod
     async def init_engine(
@@ -42,23 +50,155 @@ class Connector(Crud):
             url=settings.db.get_url_database, echo=settings.db.ECHO
         )
         await connect.async_engine.dispose()
+        await connect.router.dispose()
         LOGGER.debug("Disconnected database")
 
-    async def __aenter__(self) -> "AsyncSession":
-        """Initialize the engine and connect to the database."""
+    @asynccontextmanager
+    async def session(
+        self, info: Optional[Mapping[str, Any]] = None
+    ) -> AsyncIterator[AsyncSession]:
+        """Open a session of the shared sessionmaker.
+
+        Each caller gets its own session: the request dependency,
+        streaming responses, which outlive the endpoint, loaders of
+        cached responses, which are reloaded in the background, and
+        background tasks.
+
+        :param info: Session info, e.g. ``OUTLIVES_REQUEST``.
+        :return: AsyncSession closed on exit.
+        """
         engine = await get_engine(
             url=settings.db.get_url_database, echo=settings.db.ECHO
         )
-        async with engine.get_scoped_session() as __session:
-            self.session = __session
-            LOGGER.debug("Connected database")
-            return self.session
-
-    async def __aexit__(
-        self, exc_type: Any, exc_val: Any, exc_tb: Any
-    ) -> None:
-        """Close _session when exiting the context."""
-        if hasattr(self, "session") and self.session is not None:
-            await self.session.close()
-            self.session = None
-            LOGGER.debug("Disconnected database")
+        async with engine.session_factory(info=dict(info or {})) as session:
+            yield session
+
+    @asynccontextmanager
+    async def catalog_session(
+        self, info: Optional[Mapping[str, Any]] = None
+    ) -> AsyncIterator[AsyncSession]:
+        """Open a session reading at least the polled catalog version.
+
+        ETags carry the polled version, so the data of a response must
+        not be older. The version is read first in the transaction the
+        data is read in; a replica behind the poll leaves the session
+        to the primary.
+
+        :param info: Session info, e.g. ``OUTLIVES_REQUEST``.
+        :return: AsyncSession closed on exit.
+        """
+        version = self.catalog_version
+        async with self.session(info) as session:
+            if version is not None:
+                current = await get_catalog_version(session)
+                if current is None or current < version:
+                    LOGGER.debug(
+                        "Catalog version %s behind %s, reading primary",
+                        current,
+                        version,
+                    )
+                    await session.rollback()
+                    if isinstance(session.sync_session, RoutingSession):
+                        session.sync_session.read_primary()
+            yield session
+
+    async def refresh_spatial_index(self) -> None:
+        """Reload the spatial index of the location CRUD, if enabled.
+
+        :return: None
+        """
+        if self.location.spatial_index is None:
+            return
+        async with self.session() as session:
+            coordinates = await self.location.get_building_coordinates(session)
+        await self.location.spatial_index.load(*coordinates)
+
+    async def warm_up(self) -> None:
+        """Fill the connection pools and prime the hot statements.
+
+        :return: None
+        """
+        engine = await get_engine(
+            url=settings.db.get_url_database, echo=settings.db.ECHO
+        )
+        await engine.warm_up(self.warm_up_statements())
+
+    async def check_pool_health(self) -> None:
+        """Ping pooled connections, evicting dead ones.
+
+        Pools of unreachable databases are dropped and warmed up again.
+
+        :return: None
+        """
+        engine = await get_engine(
+            url=settings.db.get_url_database, echo=settings.db.ECHO
+        )
+        await engine.check_health(self.warm_up_statements())
+
+    def warm_up_statements(self) -> List[WarmUpStatement]:
+        """Return hot statements of the CRUDs, primed on warm-up.
+
+        :return: Statements and parameter values.
+        """
+        return [
+            *self.org.warm_up_statements(),
+            *self.activity.warm_up_statements(),
+            *self.location.warm_up_statements(),
+        ]
+
+    @staticmethod
+    async def refresh_replica_lag() -> None:
+        """Measure replication lag of read replicas.
+
+        :return: None
+        """
+        engine = await get_engine(
+            url=settings.db.get_url_database, echo=settings.db.ECHO
+        )
+        await engine.router.check_lag()
+
+    async def refresh_catalog_version(self) -> None:
+        """Poll the catalog version ETags and cache keys are derived from.
+
+        Rebuilds the key filter of the organization CRUD, if enabled,
+        when it is behind the version and a rebuild is due. Keys are
+        read after the version, so the filter holds at least the
+        organizations of the version.
+
+        :return: None
+        """
+        key_filter = self.org.key_filter
+        rows = None
+        async with self.session() as session:
+            version = await get_catalog_version(session)
+            if (
+                version is not None
+                and key_filter is not None
+                and key_filter.rebuild_due(version)
+            ):
+                rows = await self.org.get_names(session)
+        if version is not None and version != self.catalog_version:
+            LOGGER.info("Catalog version: %s", version)
+            self.catalog_version = version
+        if rows is not None and key_filter is not None:
+            await key_filter.load(rows, version)
+
+    async def refresh_autocomplete(self) -> None:
+        """Load new names into the autocomplete index, if enabled.
+
+        Rebuilds the index instead when a full refresh is due.
+
+        :return: None
+        """
+        index = self.org.autocomplete
+        if index is None:
+            return
+        full = index.full_refresh_due
+        async with self.session() as session:
+            rows = await self.org.get_names(
+                session, after_id=0 if full else index.max_id
+            )
+        if full:
+            await index.load(rows)
+        else:
+            await index.extend(rows)
@@ -0,0 +1,114 @@
+"""Deadline of the current request, applied to its queries.
+
+The request runs under an ``asyncio.timeout`` which routes set to their
+deadline. When it expires the request task is cancelled, and asyncpg
+cancels the running query on the server. Transactions opened by the
+request also get ``statement_timeout`` set to the time left, so
+PostgreSQL stops the query itself when the cancellation is lost.
+
+Sessions outliving the request, e.g. of streamed responses, fetch their
+first rows under the deadline too, the rest after the request returned.
+Their transactions get no ``statement_timeout``, it would cut the
+stream.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import SessionTransaction
+
+from src.core.infrastructure.database.core.replicas import RoutingSession
+
+SET_STATEMENT_TIMEOUT = text(
+    "SELECT set_config('statement_timeout', :timeout, true)"
+)
+
+# Session info key of sessions outliving the request.
+OUTLIVES_REQUEST = "outlives_request"
+
+
+class RequestDeadline:
+    """Timeout of a request and whether it got a database connection."""
+
+    def __init__(self, timeout: asyncio.Timeout) -> None:
+        """Initialize deadline of a request.
+
+        :param timeout: Timeout the request runs under.
+        """
+        self.timeout = timeout
+        # A transaction of the request has begun.
+        self.connected = False
+
+    def remaining(self) -> Optional[float]:
+        """Return seconds left.
+
+        :return: Seconds, ``None`` without a deadline.
+        """
+        when = self.timeout.when()
+        if when is None:
+            return None
+        return when - asyncio.get_running_loop().time()
+
+
+REQUEST_DEADLINE: ContextVar[Optional[RequestDeadline]] = ContextVar(
+    "request_deadline", default=None
+)
+
+
+@asynccontextmanager
+async def request_deadline() -> AsyncIterator[RequestDeadline]:
+    """Run the block under a deadline set later by ``set_deadline``.
+
+    :return: RequestDeadline of the block.
+    :raises TimeoutError: The deadline expired.
+    """
+    async with asyncio.timeout(None) as timeout:
+        deadline = RequestDeadline(timeout)
+        token = REQUEST_DEADLINE.set(deadline)
+        try:
+            yield deadline
+        finally:
+            REQUEST_DEADLINE.reset(token)
+
+
+def set_deadline(seconds: float) -> None:
+    """Set the deadline of the current request.
+
+    Ignored outside ``request_deadline``.
+
+    :param seconds: Seconds from now.
+    :return: None
+    """
+    deadline = REQUEST_DEADLINE.get()
+    if deadline is not None:
+        deadline.timeout.reschedule(
+            asyncio.get_running_loop().time() + seconds
+        )
+
+
+@event.listens_for(RoutingSession, "after_begin")
+def apply_statement_timeout(
+    session: RoutingSession,
+    transaction: SessionTransaction,
+    connection: Connection,
+) -> None:
+    """Limit statements of the transaction to the time left.
+
+    :param session: Session beginning the transaction.
+    :param transaction: Session transaction.
+    :param connection: Connection of the transaction.
+    :return: None
+    """
+    deadline = REQUEST_DEADLINE.get()
+    if deadline is None:
+        return
+    deadline.connected = True
+    remaining = deadline.remaining()
+    if remaining is None or session.info.get(OUTLIVES_REQUEST):
+        return
+    timeout_ms = max(int(remaining * 1000), 1)
+    connection.execute(SET_STATEMENT_TIMEOUT, {"timeout": str(timeout_ms)})
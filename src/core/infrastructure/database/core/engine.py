@@ -1,17 +1,36 @@
 """SQLAlchemy engine."""
 
-from asyncio import current_task
-from typing import Any, Dict, Optional, Tuple
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, cast
 
+from sqlalchemy import Executable, text
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncEngine,
     AsyncSession,
-    async_scoped_session,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import QueuePool
 
 from src.core.configs.env import settings
+from src.core.infrastructure.database.core.pool_pressure import (
+    POOL_PRESSURE,
+)
+from src.core.infrastructure.database.core.replicas import (
+    Replica,
+    ReplicaRouter,
+    RoutingSession,
+)
+from src.core.infrastructure.database.core.statement_cache import (
+    STATEMENT_CACHE_STATS,
+)
+
+LOGGER = logging.getLogger(settings.webconf.LOG_OUT_COMMON)
+
+HEALTH_QUERY = text("SELECT 1")
 
 
 class ClientDatabase:
@@ -27,25 +46,53 @@ class ClientDatabase:
             cls._instance = super(ClientDatabase, cls).__new__(cls)
         return cls._instance
 
-    def __init__(self, url: str, echo: bool) -> "None":
+    def __init__(
+        self,
+        url: str,
+        echo: bool,
+        replica_urls: Optional[Sequence[str]] = None,
+    ) -> "None":
         """Init SQLAlchemy manager.
 
+        Engines are created once, later calls of the singleton reuse
+        them and their pools.
+
         :param url: SQLAlchemy url.
         :param echo: Echo mode.
+        :param replica_urls: SQLAlchemy urls of read replicas,
+            ``settings.db.get_url_replicas`` by default.
         :return: None
         """
+        if hasattr(self, "async_engine"):
+            return
         self.__url = url
         self.__echo = echo
         self.async_engine = self.create_async_engine()
-        self._session = self.create_session(self.async_engine)
+        if replica_urls is None:
+            replica_urls = settings.db.get_url_replicas
+        self.router = ReplicaRouter(
+            primary=self.async_engine,
+            replicas=[
+                Replica(engine=self.create_async_engine(replica_url))
+                for replica_url in replica_urls
+            ],
+            policy=settings.db.REPLICA_ROUTING,
+            max_lag=settings.db.REPLICA_MAX_LAG_SECONDS,
+        )
+        POOL_PRESSURE.route_reads(self.router.read_engines)
+        self._session = self.create_session(self.async_engine, self.router)
+        # Engines whose pool was disposed and not warmed up since.
+        self._cold: Set[AsyncEngine] = set()
 
     @staticmethod
     def create_session(
         engine: "AsyncEngine",
+        router: Optional[ReplicaRouter] = None,
     ) -> "async_sessionmaker[AsyncSession]":
         """Create crud _session.
 
         :param engine: SQLAlchemy engine.
+        :param router: Replica router, reads go to ``engine`` without it.
         :return: async_sessionmaker[AsyncSession]
         """
         return async_sessionmaker(
@@ -54,32 +101,190 @@ class ClientDatabase:
             autoflush=False,
             autocommit=False,
             class_=AsyncSession,
+            sync_session_class=RoutingSession,
+            router=router,
         )
 
     @property
-    def get_scoped_session(self) -> async_scoped_session[AsyncSession | Any]:
-        """Return current scope.
+    def session_factory(self) -> "async_sessionmaker[AsyncSession]":
+        """Return the sessionmaker of the engine.
+
+        Built once, sessions of all requests come from it.
 
-        :return: current scope.
+        :return: async_sessionmaker[AsyncSession]
         """
-        return async_scoped_session(
-            session_factory=self.create_session(self.async_engine),
-            scopefunc=current_task,
-        )
+        return self._session
 
-    def create_async_engine(self) -> "AsyncEngine":
+    def create_async_engine(self, url: Optional[str] = None) -> "AsyncEngine":
         """Create async engine.
 
+        Its executions are counted in ``STATEMENT_CACHE_STATS``, its
+        pool checkouts in ``POOL_PRESSURE``.
+
+        :param url: SQLAlchemy url, the primary by default.
         :return: async engine.
         """
-        return create_async_engine(
-            url=self.__url,
+        engine = create_async_engine(
+            url=url or self.__url,
             echo=self.__echo,
-            pool_pre_ping=True,
             pool_size=settings.db.POOL_SIZE_SQL_ALCHEMY_CONF,
             pool_timeout=settings.db.POOL_TIMEOUT,
             max_overflow=settings.db.MAX_OVERFLOW,
         )
+        STATEMENT_CACHE_STATS.listen(engine)
+        POOL_PRESSURE.listen(engine, max_overflow=settings.db.MAX_OVERFLOW)
+        return engine
+
+    @property
+    def engines(self) -> List[AsyncEngine]:
+        """Return engines of the primary and the replicas.
+
+        :return: Engines.
+        """
+        return [
+            self.async_engine,
+            *(replica.engine for replica in self.router.replicas),
+        ]
+
+    @staticmethod
+    async def prime(
+        conn: AsyncConnection,
+        statements: Sequence[Tuple[Executable, Dict[str, Any]]],
+    ) -> None:
+        """Execute statements on the connection.
+
+        asyncpg prepares each statement on the first execution on a
+        connection and reuses it afterwards.
+
+        :param conn: Connection.
+        :param statements: Statements and parameter values.
+        :return: None
+        """
+        async with AsyncSession(bind=conn) as session:
+            for stmt, params in statements:
+                try:
+                    await session.execute(stmt, params)
+                except SQLAlchemyError as e:
+                    LOGGER.error("Statement is not primed: %s", e)
+                    await session.rollback()
+
+    async def warm_up_engine(
+        self,
+        engine: AsyncEngine,
+        statements: Sequence[Tuple[Executable, Dict[str, Any]]],
+    ) -> int:
+        """Fill the pool of the engine and prime statements.
+
+        ``POOL_SIZE_SQL_ALCHEMY_CONF`` connections are opened at once,
+        so the pool keeps them all.
+
+        :param engine: Engine.
+        :param statements: Statements and parameter values.
+        :return: Number of connections opened.
+        """
+        opened = await asyncio.gather(
+            *(
+                engine.connect().start()
+                for _ in range(settings.db.POOL_SIZE_SQL_ALCHEMY_CONF)
+            ),
+            return_exceptions=True,
+        )
+        connections = [
+            conn for conn in opened if isinstance(conn, AsyncConnection)
+        ]
+        try:
+            await asyncio.gather(
+                *(self.prime(conn, statements) for conn in connections)
+            )
+        finally:
+            for conn in connections:
+                await conn.close()
+        errors = [e for e in opened if isinstance(e, BaseException)]
+        if errors:
+            LOGGER.error(
+                "Connections to %s are not opened: %s",
+                engine.url.host,
+                errors[0],
+            )
+        LOGGER.info(
+            "Pool of %s warmed up: %s/%s connections",
+            engine.url.host,
+            len(connections),
+            len(opened),
+        )
+        return len(connections)
+
+    async def warm_up(
+        self, statements: Sequence[Tuple[Executable, Dict[str, Any]]]
+    ) -> None:
+        """Fill the pools and prime statements on every connection.
+
+        :param statements: Statements and parameter values.
+        :return: None
+        """
+        for engine in self.engines:
+            await self.warm_up_engine(engine, statements)
+
+    @staticmethod
+    async def ping(engine: AsyncEngine) -> bool:
+        """Ping one pooled connection, invalidating it when dead.
+
+        :param engine: Engine.
+        :return: Whether the connection answered.
+        """
+        try:
+            conn = await engine.connect().start()
+        except (SQLAlchemyError, OSError):
+            return False
+        try:
+            await conn.execute(HEALTH_QUERY)
+            return True
+        except (SQLAlchemyError, OSError) as e:
+            if not conn.invalidated:
+                await conn.invalidate(e)
+            return False
+        finally:
+            await conn.close()
+
+    async def check_health(
+        self, statements: Sequence[Tuple[Executable, Dict[str, Any]]]
+    ) -> None:
+        """Ping pooled connections of every engine, evicting dead ones.
+
+        Connections are not pinged on checkout, so every idle one is
+        pinged here instead, off the request path, and a dead one is
+        invalidated alone. When none answers the database is deemed
+        unreachable and the pool disposed. A disposed pool is warmed up
+        again at once, or by a later check while it stays unreachable,
+        so requests don't open its connections cold.
+
+        :param statements: Statements and parameter values to prime.
+        :return: None
+        """
+        for engine in self.engines:
+            idle = cast(QueuePool, engine.pool).checkedin()
+            pings = await asyncio.gather(
+                *(self.ping(engine) for _ in range(max(idle, 1)))
+            )
+            alive = sum(pings)
+            if alive < len(pings):
+                LOGGER.warning(
+                    "Health check of %s: %s/%s connections dead",
+                    engine.url.host,
+                    len(pings) - alive,
+                    len(pings),
+                )
+            if not alive:
+                LOGGER.warning(
+                    "Health check of %s failed, pool disposed",
+                    engine.url.host,
+                )
+                await engine.dispose()
+                self._cold.add(engine)
+            if engine in self._cold and await self.warm_up_engine(
+                engine, statements
+            ):
+                self._cold.discard(engine)
 
 
 async def get_engine(url: str, echo: bool) -> "ClientDatabase":
@@ -0,0 +1,194 @@
+"""Connection pool pressure, estimated from pool checkouts."""
+
+import math
+import time
+from typing import Any, Callable, Dict, List, Optional, cast
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import (
+    ConnectionPoolEntry,
+    PoolProxiedConnection,
+    QueuePool,
+)
+
+# Connection record info key of the checkout time.
+CHECKOUT_AT = "checkout_at"
+
+# Weight of the newest hold time in the moving average.
+SMOOTHING = 0.2
+
+
+class PoolLoad:
+    """Checked out connections of one pool and their hold time.
+
+    Connections are counted by the pool itself, so connections
+    invalidated or lost with a disposed pool are not left counted.
+    """
+
+    def __init__(self, engine: AsyncEngine, max_overflow: int) -> None:
+        """Initialize load of the engine pool.
+
+        :param engine: Async engine.
+        :param max_overflow: Connections the pool opens beyond its size.
+        """
+        self.engine = engine
+        self.max_overflow = max_overflow
+        # Moving average of seconds a connection is held.
+        self.hold_seconds = 0.0
+
+    @property
+    def pool(self) -> QueuePool:
+        """Return the current pool of the engine, replaced on dispose.
+
+        :return: QueuePool
+        """
+        return cast(QueuePool, self.engine.pool)
+
+    @property
+    def capacity(self) -> int:
+        """Return max connections of the pool, overflow included.
+
+        :return: int
+        """
+        return self.pool.size() + self.max_overflow
+
+    @property
+    def checked_out(self) -> int:
+        """Return connections in use.
+
+        :return: int
+        """
+        return self.pool.checkedout()
+
+    def checkout(
+        self,
+        dbapi_connection: Any,
+        connection_record: ConnectionPoolEntry,
+        connection_proxy: PoolProxiedConnection,
+    ) -> None:
+        """Note when the connection was checked out.
+
+        :param dbapi_connection: DBAPI connection.
+        :param connection_record: Pool entry of the connection.
+        :param connection_proxy: Checked out connection.
+        :return: None
+        """
+        connection_record.info[CHECKOUT_AT] = time.monotonic()
+
+    def checkin(
+        self, dbapi_connection: Any, connection_record: ConnectionPoolEntry
+    ) -> None:
+        """Count how long the returned connection was held.
+
+        :param dbapi_connection: DBAPI connection, ``None`` if
+            invalidated.
+        :param connection_record: Pool entry of the connection.
+        :return: None
+        """
+        started = connection_record.info.pop(CHECKOUT_AT, None)
+        if started is None:
+            return
+        held = time.monotonic() - started
+        self.hold_seconds += SMOOTHING * (held - self.hold_seconds)
+
+    def estimated_wait(self, queued: int) -> float:
+        """Estimate seconds a new request waits for a connection.
+
+        While connections are free there is no wait. Otherwise the
+        queued requests are served first, one hold time per connection.
+
+        :param queued: Requests waiting for the pool.
+        :return: Seconds.
+        """
+        capacity = self.capacity
+        if capacity == 0 or self.checked_out < capacity:
+            return 0.0
+        return (queued + 1) * self.hold_seconds / capacity
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return capacity, checked out connections and hold time.
+
+        :return: Pool load.
+        """
+        return {
+            "capacity": self.capacity,
+            "checked_out": self.checked_out,
+            "hold_seconds": self.hold_seconds,
+        }
+
+
+class PoolPressure:
+    """Load of the pools reads go to.
+
+    A request reads from one pool, a fresh replica or the primary, so
+    the wait is estimated per pool and the worst one counts. Hold times
+    are per process.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no pools."""
+        self.pools: Dict[AsyncEngine, PoolLoad] = {}
+        self._readers: Optional[Callable[[], List[AsyncEngine]]] = None
+
+    def listen(self, engine: AsyncEngine, max_overflow: int) -> None:
+        """Track the engine pool.
+
+        :param engine: Async engine.
+        :param max_overflow: Connections the pool opens beyond its size.
+        :return: None
+        """
+        load = PoolLoad(engine, max_overflow)
+        self.pools[engine] = load
+        event.listen(engine.sync_engine, "checkout", load.checkout)
+        event.listen(engine.sync_engine, "checkin", load.checkin)
+
+    def route_reads(self, readers: Callable[[], List[AsyncEngine]]) -> None:
+        """Set the engines reads may go to, all pools by default.
+
+        :param readers: Returns engines reads may go to now.
+        :return: None
+        """
+        self._readers = readers
+
+    def read_pools(self) -> List[PoolLoad]:
+        """Return loads of the pools reads may go to.
+
+        :return: Pool loads.
+        """
+        if self._readers is None:
+            return list(self.pools.values())
+        return [
+            self.pools[engine]
+            for engine in self._readers()
+            if engine in self.pools
+        ]
+
+    def estimated_wait(self, in_flight: int) -> float:
+        """Estimate seconds a new request waits for a connection.
+
+        Requests in flight beyond the capacity of the pools reads go to
+        are assumed to queue, spread evenly over those pools.
+
+        :param in_flight: Requests being served.
+        :return: Seconds, of the pool with the longest wait.
+        """
+        pools = self.read_pools()
+        if not pools:
+            return 0.0
+        capacity = sum(load.capacity for load in pools)
+        queued = math.ceil(max(in_flight - capacity, 0) / len(pools))
+        return max(load.estimated_wait(queued) for load in pools)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return loads of the pools, by host and port.
+
+        :return: Pool loads.
+        """
+        return {
+            f"{engine.url.host}:{engine.url.port}": load.snapshot()
+            for engine, load in self.pools.items()
+        }
+
+
+POOL_PRESSURE = PoolPressure()
@@ -0,0 +1,205 @@
+"""Routing of reads between the primary and its replicas."""
+
+import asyncio
+import itertools
+import logging
+from typing import Any, List, Literal, Optional, cast
+
+from sqlalchemy import Engine, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.sql.dml import UpdateBase
+
+from src.core.configs.env import settings
+
+LOGGER = logging.getLogger(settings.webconf.LOG_OUT_COMMON)
+
+RoutingPolicy = Literal["round_robin", "least_connections"]
+
+# Zero while the replica streams WAL and has replayed all it received,
+# otherwise time since the last replayed transaction, which keeps
+# growing when the WAL receiver has stopped. NULL on a primary.
+LAG_QUERY = text(
+    "SELECT CASE "
+    "WHEN NOT pg_is_in_recovery() THEN NULL "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() "
+    "AND EXISTS (SELECT FROM pg_stat_wal_receiver) THEN 0 "
+    "ELSE coalesce("
+    "EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), "
+    "'Infinity'"
+    ") "
+    "END"
+)
+
+
+class Replica:
+    """Replica engine and its last measured replication lag.
+
+    ``lag`` is ``None`` until measured and while the replica is
+    unreachable, such a replica gets no reads.
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        """Initialize replica.
+
+        :param engine: Engine of the replica.
+        """
+        self.name = f"{engine.url.host}:{engine.url.port}"
+        self.engine = engine
+        self.lag: Optional[float] = None
+
+    @property
+    def connections(self) -> int:
+        """Return connections checked out of the pool.
+
+        :return: int
+        """
+        return cast(QueuePool, self.engine.pool).checkedout()
+
+    async def check_lag(self) -> None:
+        """Measure the replication lag.
+
+        :return: None
+        """
+        try:
+            async with self.engine.connect() as conn:
+                lag = await conn.scalar(LAG_QUERY)
+        except Exception as e:
+            LOGGER.warning("Replica %s is unreachable: %s", self.name, e)
+            self.lag = None
+            return
+        if lag is None:
+            LOGGER.warning("Replica %s is not in recovery", self.name)
+        self.lag = None if lag is None else float(lag)
+
+
+class ReplicaRouter:
+    """Pick the engine reads go to.
+
+    Replicas lagging more than ``max_lag`` seconds are skipped, reads
+    go to the primary when no replica is left.
+    """
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: List[Replica],
+        policy: RoutingPolicy,
+        max_lag: float,
+    ) -> None:
+        """Initialize router.
+
+        :param primary: Engine of the primary.
+        :param replicas: Replicas.
+        :param policy: How a replica is picked among the fresh ones.
+        :param max_lag: Max replication lag in seconds.
+        """
+        self.primary = primary
+        self.replicas = replicas
+        self.policy = policy
+        self.max_lag = max_lag
+        self._turn = itertools.count()
+
+    def fresh(self) -> List[Replica]:
+        """Return replicas within the lag threshold.
+
+        :return: Replicas.
+        """
+        return [
+            replica
+            for replica in self.replicas
+            if replica.lag is not None and replica.lag <= self.max_lag
+        ]
+
+    def read_engines(self) -> List[AsyncEngine]:
+        """Return engines the next reads may go to.
+
+        :return: Fresh replica engines, the primary when none is fresh.
+        """
+        replicas = self.fresh()
+        if not replicas:
+            return [self.primary]
+        return [replica.engine for replica in replicas]
+
+    def reader(self) -> AsyncEngine:
+        """Return the engine of the next read.
+
+        :return: Replica engine, the primary when none is fresh.
+        """
+        replicas = self.fresh()
+        if not replicas:
+            return self.primary
+        if self.policy == "least_connections":
+            return min(replicas, key=lambda r: r.connections).engine
+        return replicas[next(self._turn) % len(replicas)].engine
+
+    async def check_lag(self) -> None:
+        """Measure the lag of all replicas.
+
+        :return: None
+        """
+        await asyncio.gather(
+            *(replica.check_lag() for replica in self.replicas)
+        )
+        LOGGER.debug(
+            "Fresh replicas: %s/%s", len(self.fresh()), len(self.replicas)
+        )
+
+    async def dispose(self) -> None:
+        """Close connections of all replicas.
+
+        :return: None
+        """
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+
+class RoutingSession(Session):
+    """Session reading from a replica and writing to the primary.
+
+    The replica is picked on the first read and kept for the session,
+    so all reads of a request see the same replica.
+    """
+
+    def __init__(
+        self, router: Optional[ReplicaRouter] = None, **kwargs: Any
+    ) -> None:
+        """Initialize session.
+
+        :param router: Replica router, reads use the bound engine
+            without it.
+        :param kwargs: ``Session`` arguments.
+        """
+        super().__init__(**kwargs)
+        self.router = router
+        self._reader: Optional[AsyncEngine] = None
+
+    def get_bind(
+        self, mapper: Any = None, clause: Any = None, **kwargs: Any
+    ) -> Engine:
+        """Return the engine of the statement.
+
+        :param mapper: Mapper of the statement.
+        :param clause: Statement.
+        :param kwargs: Other ``Session.get_bind`` arguments.
+        :return: Sync engine.
+        """
+        if self.router is None:
+            return cast(Engine, super().get_bind(mapper, clause, **kwargs))
+        if self._flushing or isinstance(clause, UpdateBase):
+            return self.router.primary.sync_engine
+        if self._reader is None:
+            self._reader = self.router.reader()
+        return self._reader.sync_engine
+
+    def read_primary(self) -> None:
+        """Send the following reads to the primary.
+
+        Called between transactions, e.g. when the replica of the
+        session is behind the data the request needs.
+
+        :return: None
+        """
+        if self.router is not None:
+            self._reader = self.router.primary
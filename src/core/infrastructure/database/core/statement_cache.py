@@ -0,0 +1,91 @@
+"""Counters of the SQLAlchemy compiled statement cache."""
+
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.engine.interfaces import CacheStats
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Execution option naming a statement for the counters.
+STATEMENT_NAME = "statement_name"
+
+UNNAMED = "unnamed"
+
+OUTCOMES = {
+    CacheStats.CACHE_HIT: "hit",
+    CacheStats.CACHE_MISS: "miss",
+}
+
+
+class StatementCacheStats:
+    """Compiled cache hits and misses counted per statement name.
+
+    Statements without the ``statement_name`` execution option are
+    counted as ``unnamed``, executions the cache does not apply to
+    (e.g. plain SQL text) as ``uncached``. Counts are per process.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self.counts: Dict[str, Dict[str, int]] = {}
+
+    def record(self, name: str, outcome: str) -> None:
+        """Count one execution.
+
+        :param name: Statement name.
+        :param outcome: ``hit``, ``miss`` or ``uncached``.
+        :return: None
+        """
+        counts = self.counts.setdefault(
+            name, {"hit": 0, "miss": 0, "uncached": 0}
+        )
+        counts[outcome] += 1
+
+    def before_cursor_execute(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Optional[ExecutionContext],
+        executemany: bool,
+    ) -> None:
+        """Count the cache outcome of the statement being executed.
+
+        :param conn: Connection.
+        :param cursor: DBAPI cursor.
+        :param statement: SQL text.
+        :param parameters: Parameter values.
+        :param context: Execution context with the cache outcome.
+        :param executemany: Whether executed for many parameter sets.
+        :return: None
+        """
+        if context is None:
+            return
+        self.record(
+            context.execution_options.get(STATEMENT_NAME, UNNAMED),
+            OUTCOMES.get(getattr(context, "cache_hit", None), "uncached"),
+        )
+
+    def listen(self, engine: AsyncEngine) -> None:
+        """Count executions of the engine.
+
+        :param engine: Async engine.
+        :return: None
+        """
+        event.listen(
+            engine.sync_engine,
+            "before_cursor_execute",
+            self.before_cursor_execute,
+        )
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """Return copy of the counters.
+
+        :return: Counters by statement name.
+        """
+        return {name: dict(counts) for name, counts in self.counts.items()}
+
+
+STATEMENT_CACHE_STATS = StatementCacheStats()
@@ -0,0 +1,39 @@
+"""Catalog data version, bumped by triggers on writes."""
+
+import logging
+from typing import Optional
+
+from opentelemetry import trace
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.configs.env import settings
+from src.core.infrastructure.database.cruds.statements import named
+from src.core.infrastructure.database.schemas.catalog import CatalogVersion
+
+LOGGER = logging.getLogger(settings.webconf.LOG_OUT_COMMON)
+TRACER = trace.get_tracer(__name__)
+
+CATALOG_VERSION_STMT = named(
+    select(CatalogVersion.version).where(CatalogVersion.id == 1),
+    "catalog_version",
+)
+
+
+async def get_catalog_version(session: AsyncSession) -> Optional[int]:
+    """Return the catalog version.
+
+    :param session: SQLAlchemy session.
+    :return: Version, ``None`` on error.
+    """
+    with TRACER.start_as_current_span("get_catalog_version") as span:
+        try:
+            version = await session.scalar(CATALOG_VERSION_STMT)
+            span.set_attribute("catalog.version", version or 0)
+            return version
+        except SQLAlchemyError as e:
+            span.record_exception(e)
+            span.set_status(trace.status.Status(trace.status.StatusCode.ERROR))
+            LOGGER.error("Error retrieving catalog version: %s", str(e))
+            return None
@@ -0,0 +1,166 @@
+"""Organization response documents built by PostgreSQL.
+
+Documents are precomputed into ``organization_document`` and kept
+current by triggers on the tables they are built from, see
+``schemas.documents``, so reads fetch one column instead of assembling
+the document on every request.
+"""
+
+import logging
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional
+
+from opentelemetry import trace
+from sqlalchemy import JSON, ColumnElement, Select, Text, cast, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.configs.env import settings
+from src.core.infrastructure.database.schemas.buildings import Building
+from src.core.infrastructure.database.schemas.documents import (
+    OrganizationDocument,
+    json_object,
+)
+from src.core.infrastructure.database.schemas.organizations import Organization
+
+LOGGER = logging.getLogger(settings.webconf.LOG_OUT_COMMON)
+TRACER = trace.get_tracer(__name__)
+
+
+class DocumentPage(NamedTuple):
+    """Page of organization documents.
+
+    Attributes:
+        documents (List[str]): JSON documents ordered by organization ID.
+        last_id (Optional[int]): ID of the last organization on the page
+            when more rows follow, ``None`` on the last page.
+    """
+
+    documents: List[str]
+    last_id: Optional[int]
+
+
+def select_organization_documents() -> Select[tuple[str]]:
+    """Select organization documents joined with their building.
+
+    :return: Select of JSON documents, filters are added by the caller.
+    """
+    return (
+        select(OrganizationDocument.document)
+        .select_from(Organization)
+        .join(
+            OrganizationDocument,
+            OrganizationDocument.organization_id == Organization.id,
+        )
+        .join(Building, Organization.building_id == Building.id)
+    )
+
+
+def select_distance_documents(
+    distance: ColumnElement[float],
+) -> Select[tuple[str]]:
+    """Select ``NearestOrganizationResponse`` documents.
+
+    :param distance: SQL expression of the distance in meters.
+    :return: Select of JSON documents, filters are added by the caller.
+    """
+    document = json_object(
+        distance=distance,
+        organization=cast(OrganizationDocument.document, JSON),
+    )
+    return (
+        select(cast(document, Text).label("document"))
+        .select_from(Organization)
+        .join(
+            OrganizationDocument,
+            OrganizationDocument.organization_id == Organization.id,
+        )
+        .join(Building, Organization.building_id == Building.id)
+    )
+
+
+def page_of(
+    stmt: Select[tuple[str]],
+    after_id: int | ColumnElement[int],
+    limit: int | ColumnElement[int],
+) -> Select[tuple[str, int]]:
+    """Apply keyset pagination on organization ID.
+
+    One extra row is requested to know whether a next page exists.
+
+    :param stmt: Select of organization documents.
+    :param after_id: Organization ID the page starts after, or its
+        bound parameter.
+    :param limit: Page size, or its bound parameter.
+    :return: Select of documents and their organization IDs.
+    """
+    return (
+        stmt.add_columns(Organization.id)
+        .where(Organization.id > after_id)
+        .order_by(Organization.id)
+        .limit(limit + 1)
+    )
+
+
+async def fetch_page(
+    session: AsyncSession,
+    stmt: Select[tuple[str, int]],
+    limit: int,
+    params: Optional[Dict[str, Any]] = None,
+) -> DocumentPage:
+    """Execute paginated select of documents.
+
+    :param session: SQLAlchemy session.
+    :param stmt: Select built by ``page_of``.
+    :param limit: Page size used by ``page_of``.
+    :param params: Values of bound parameters of the select.
+    :return: Page of documents.
+    """
+    rows = (await session.execute(stmt, params)).all()
+    return DocumentPage(
+        documents=[document for document, _ in rows[:limit]],
+        last_id=rows[limit - 1][1] if len(rows) > limit else None,
+    )
+
+
+async def stream_documents(
+    session: AsyncSession,
+    stmt: Select[tuple[str]],
+    span_name: str,
+    after_id: int = 0,
+    yield_per: int = settings.db.STREAM_YIELD_PER,
+    params: Optional[Dict[str, Any]] = None,
+) -> AsyncIterator[str]:
+    """Stream documents through a server-side cursor.
+
+    Rows are fetched ``yield_per`` at a time, so memory does not grow
+    with the size of the result set. Errors are logged and re-raised:
+    the response is already started and can only be aborted.
+
+    :param session: SQLAlchemy session, open while iterating.
+    :param stmt: Select of organization documents.
+    :param span_name: Name of the tracing span.
+    :param after_id: Organization ID the stream starts after.
+    :param yield_per: Rows fetched per roundtrip.
+    :param params: Values of bound parameters of the select.
+    :return: JSON documents ordered by organization ID.
+    """
+    span = TRACER.start_span(span_name)
+    count = 0
+    try:
+        result = await session.stream_scalars(
+            stmt.where(Organization.id > after_id)
+            .order_by(Organization.id)
+            .execution_options(yield_per=yield_per),
+            params,
+        )
+        async for document in result:
+            count += 1
+            yield document
+        span.set_attribute("db.result_count", count)
+    except SQLAlchemyError as e:
+        span.record_exception(e)
+        span.set_status(trace.status.Status(trace.status.StatusCode.ERROR))
+        LOGGER.error("Error streaming documents: %s", str(e))
+        raise
+    finally:
+        span.end()
@@ -1,5 +1,16 @@
 """Facade ORM models."""
 
+from functools import partial
+from typing import Any, Mapping, Optional
+
+from src.core.infrastructure.background import Revalidator
+from src.core.infrastructure.cache import (
+    Loader,
+    NegativeCache,
+    ResponseCache,
+    SingleFlight,
+    cache_key,
+)
 from src.core.infrastructure.database.cruds.models.activity import ActivityCRUD
 from src.core.infrastructure.database.cruds.models.location import (
     OrganizationByLocationCRUD,
@@ -15,6 +26,10 @@ class Crud:
         org: OrganizationCRUD,
         location: OrganizationByLocationCRUD,
         activity: ActivityCRUD,
+        cache: Optional[ResponseCache] = None,
+        negative: Optional[NegativeCache] = None,
+        flight: Optional[SingleFlight] = None,
+        revalidator: Optional[Revalidator] = None,
     ) -> None:
         """Initialize Crud with specific CRUD instances.
 
@@ -24,8 +39,97 @@ class Crud:
         :type location: OrganizationByLocationCRUD
         :param activity: Activity CRUD
         :type activity: ActivityCRUD
+        :param cache: Cache of serialized responses, disabled without it.
+        :type cache: Optional[ResponseCache]
+        :param negative: Cache of not found responses, disabled without it.
+        :type negative: Optional[NegativeCache]
+        :param flight: Coalesces identical concurrent loads, disabled
+            without it.
+        :type flight: Optional[SingleFlight]
+        :param revalidator: Reloads stale responses in the background,
+            they are served until expired without it.
+        :type revalidator: Optional[Revalidator]
 
         """
         self.org = org
         self.location = location
         self.activity = activity
+        self.cache = cache
+        self.negative = negative
+        self.flight = flight
+        self.revalidator = revalidator
+        # Polled catalog version, ``None`` until known or if not polled.
+        self.catalog_version: Optional[int] = None
+
+    def may_exist(
+        self, id_: Optional[int] = None, name: Optional[str] = None
+    ) -> bool:
+        """Check the organization may exist, without the database.
+
+        The key filter is consulted only while it was built at the
+        polled catalog version, so new organizations are never
+        rejected.
+
+        :param id_: Organization ID.
+        :param name: Organization name.
+        :return: False when no organization has the ID or name.
+        """
+        key_filter = self.org.key_filter
+        if (
+            key_filter is None
+            or self.catalog_version is None
+            or key_filter.version != self.catalog_version
+        ):
+            return True
+        return key_filter.may_exist(id_=id_, name=name)
+
+    async def cached(
+        self,
+        method: str,
+        params: Mapping[str, Any],
+        load: Loader,
+        remember_missing: bool = False,
+    ) -> Optional[bytes]:
+        """Return the serialized response, cached when enabled.
+
+        Hits skip the database and serialization. ``None``, e.g. not
+        found, is not cached, except by the negative cache for a
+        shorter TTL when ``remember_missing`` is set.
+        Responses are cached per catalog version, so a change of the
+        catalog is not served from the cache. Stale responses are
+        served while reloaded in the background. Concurrent misses of
+        the same request share one load when coalescing is enabled.
+
+        :param method: Cached method name, its TTL is configured by it.
+        :param params: Arguments the response depends on.
+        :param load: Queries the database and serializes the response.
+        :param remember_missing: Keep ``None`` in the negative cache,
+            for lookups of keys clients get wrong, e.g. names.
+        :return: Response body or ``None``.
+        """
+        params = {**params, "catalog_version": self.catalog_version}
+        negative = self.negative if remember_missing else None
+        if negative is not None and negative.known_missing(method, params):
+            return None
+        if self.cache is not None:
+            body, stale = self.cache.lookup(method, params)
+            if body is not None:
+                if stale and self.revalidator is not None:
+                    self.revalidator.submit(
+                        cache_key(method, params),
+                        partial(self.cache.refresh, method, params, load),
+                    )
+                return body
+
+        async def fill() -> Optional[bytes]:
+            if self.cache is None:
+                body = await load()
+            else:
+                body = await self.cache.fill(method, params, load)
+            if body is None and negative is not None:
+                negative.add(method, params)
+            return body
+
+        if self.flight is None:
+            return await fill()
+        return await self.flight.do(method, params, fill)
@@ -1,18 +1,34 @@
 """Activity CRUD API."""
 
 import logging
+from typing import AsyncIterator, List, Type
 
 from opentelemetry import trace
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, Select, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from src.core.configs.env import settings
+from src.core.infrastructure.database.cruds.documents import (
+    DocumentPage,
+    fetch_page,
+    page_of,
+    select_organization_documents,
+    stream_documents,
+)
 from src.core.infrastructure.database.cruds.models.base import (
     CRUDWithOneSubModel,
 )
-from src.core.infrastructure.database.schemas.activity import Activity
+from src.core.infrastructure.database.cruds.statements import (
+    Param,
+    WarmUpStatement,
+    named,
+    page_params,
+)
+from src.core.infrastructure.database.schemas.activity import (
+    Activity,
+    OrganizationActivity,
+)
 from src.core.infrastructure.database.schemas.organizations import Organization
 
 LOGGER = logging.getLogger(settings.webconf.LOG_OUT_COMMON)
@@ -22,51 +38,202 @@ TRACER = trace.get_tracer(__name__)
 class ActivityCRUD(CRUDWithOneSubModel[Activity, Organization]):
     """Activity CRUD."""
 
-    async def get_activity(
+    def __init__(
+        self, model: Type[Activity], submodel: Type[Organization]
+    ) -> None:
+        """Initialize CRUD model and build its statements.
+
+        :param model: SQLAlchemy model
+        :param submodel: sub model
+        :type model: Type[Activity]
+        :type submodel: Type[Organization]
+        """
+        super().__init__(model, submodel)
+        self.activity_id_stmt = named(
+            select(self.model.id).where(self.model.name == Param.NAME),
+            "activity_id_by_name",
+        )
+        self.documents_stmt = {
+            with_children: named(
+                page_of(
+                    select_organization_documents().where(
+                        self.submodel.id.in_(
+                            self.organization_ids(Param.NAME, with_children)
+                        )
+                    ),
+                    after_id=Param.AFTER_ID,
+                    limit=Param.PAGE_SIZE,
+                ),
+                name,
+            )
+            for with_children, name in (
+                (False, "documents_by_activity"),
+                (True, "documents_by_activity_tree"),
+            )
+        }
+
+    def warm_up_statements(self) -> List[WarmUpStatement]:
+        """Return prebuilt statements with values matching nothing.
+
+        :return: Statements and parameter values.
+        """
+        return [
+            (self.activity_id_stmt, {"name": ""}),
+            *(
+                (stmt, {"name": "", **page_params(after_id=0, limit=1)})
+                for stmt in self.documents_stmt.values()
+            ),
+        ]
+
+    async def activity_exists(
         self,
         activity_name: str,
         session: AsyncSession,
-        with_children: bool = False,
-    ) -> Activity | None:
-        """Return Organization by activity type.
+    ) -> bool:
+        """Check the activity exists, without loading its organizations.
 
         :param activity_name: Activity name.
         :param session: SQLAlchemy session.
-        :param with_children: Return children activities.
-        :return: Organization by activity type.
+        :return: True when the activity exists.
         """
-        with TRACER.start_as_current_span("get_activity") as span:
+        with TRACER.start_as_current_span("activity_exists") as span:
             span.set_attribute("activity.name", activity_name)
             try:
-
-                stmt = select(self.model).where(
-                    self.model.name == activity_name
+                result = await session.execute(
+                    self.activity_id_stmt, {"name": activity_name}
                 )
-
-                if with_children:
-                    stmt = stmt.options(
-                        selectinload(self.model.organizations).selectinload(
-                            self.submodel.activities
-                        ),
-                        selectinload(self.model.children)
-                        .selectinload(self.model.organizations)
-                        .selectinload(self.submodel.activities),
-                        selectinload(self.model.children)
-                        .selectinload(self.model.children)
-                        .selectinload(self.model.organizations)
-                        .selectinload(self.submodel.activities),
-                    )
-
-                result = await session.execute(stmt)
-                activity = result.scalar_one_or_none()
+                exists = result.scalar_one_or_none() is not None
                 span.set_attribute(
-                    "db.result", "success" if activity else "not_found"
+                    "db.result", "success" if exists else "not_found"
                 )
-                return activity if activity else None
+                return exists
             except SQLAlchemyError as e:
                 span.record_exception(e)
                 span.set_status(
                     trace.status.Status(trace.status.StatusCode.ERROR)
                 )
-                LOGGER.error("Error retrieving activity by name: %s", str(e))
-                return None
+                LOGGER.error("Error checking activity by name: %s", str(e))
+                return False
+
+    def activity_organization_ids(
+        self, activity_name: str | ColumnElement[str]
+    ) -> Select[tuple[int]]:
+        """Build query of organization IDs of the activity itself.
+
+        :param activity_name: Activity name.
+        :return: Select of organization IDs.
+        """
+        return (
+            select(OrganizationActivity.organization_id)
+            .join(
+                self.model, OrganizationActivity.activity_id == self.model.id
+            )
+            .where(self.model.name == activity_name)
+        )
+
+    def subtree_organization_ids(
+        self, activity_name: str | ColumnElement[str]
+    ) -> Select[tuple[int]]:
+        """Build query of organization IDs of the activity and descendants.
+
+        The tree is walked by a recursive CTE over ``activity.parent_id``,
+        so the depth of the taxonomy is not limited.
+
+        :param activity_name: Root activity name.
+        :return: Select of distinct organization IDs.
+        """
+        tree = (
+            select(self.model.id)
+            .where(self.model.name == activity_name)
+            .cte("activity_tree", recursive=True)
+        )
+        tree = tree.union(
+            select(self.model.id).join(tree, self.model.parent_id == tree.c.id)
+        )
+        return (
+            select(OrganizationActivity.organization_id)
+            .join(tree, OrganizationActivity.activity_id == tree.c.id)
+            .distinct()
+        )
+
+    def organization_ids(
+        self, activity_name: str | ColumnElement[str], with_children: bool
+    ) -> Select[tuple[int]]:
+        """Build query of organization IDs by activity.
+
+        :param activity_name: Activity name.
+        :param with_children: Include organizations of all descendants.
+        :return: Select of organization IDs.
+        """
+        if with_children:
+            return self.subtree_organization_ids(activity_name)
+        return self.activity_organization_ids(activity_name)
+
+    async def get_documents_by_activity(
+        self,
+        activity_name: str,
+        session: AsyncSession,
+        limit: int,
+        after_id: int = 0,
+        with_children: bool = False,
+    ) -> DocumentPage:
+        """Return page of JSON documents of organizations by activity.
+
+        :param activity_name: Activity name.
+        :param session: SQLAlchemy session.
+        :param limit: Page size.
+        :param after_id: Organization ID the page starts after.
+        :param with_children: Include organizations of all descendants.
+        :return: Page of JSON documents ordered by organization ID.
+        """
+        with TRACER.start_as_current_span("get_documents_by_activity") as span:
+            span.set_attribute("activity.name", activity_name)
+            span.set_attribute("activity.with_children", with_children)
+            try:
+                page = await fetch_page(
+                    session,
+                    self.documents_stmt[with_children],
+                    limit,
+                    params={
+                        "name": activity_name,
+                        **page_params(after_id, limit),
+                    },
+                )
+                span.set_attribute("db.result_count", len(page.documents))
+                return page
+            except SQLAlchemyError as e:
+                span.record_exception(e)
+                span.set_status(
+                    trace.status.Status(trace.status.StatusCode.ERROR)
+                )
+                LOGGER.error(
+                    "Error retrieving documents by activity: %s", str(e)
+                )
+                return DocumentPage(documents=[], last_id=None)
+
+    def stream_documents_by_activity(
+        self,
+        activity_name: str,
+        session: AsyncSession,
+        after_id: int = 0,
+        with_children: bool = False,
+    ) -> AsyncIterator[str]:
+        """Stream JSON documents of organizations by activity.
+
+        :param activity_name: Activity name.
+        :param session: SQLAlchemy session, open while iterating.
+        :param after_id: Organization ID the stream starts after.
+        :param with_children: Include organizations of all descendants.
+        :return: JSON documents ordered by organization ID.
+        """
+        return stream_documents(
+            session,
+            select_organization_documents().where(
+                self.submodel.id.in_(
+                    self.organization_ids(Param.NAME, with_children)
+                )
+            ),
+            span_name="stream_documents_by_activity",
+            after_id=after_id,
+            params={"name": activity_name},
+        )
@@ -1,118 +1,443 @@
 """Location CRUD API."""
 
 import logging
-from typing import List
-
-from geoalchemy2.functions import (
-    ST_Covers,
-    ST_DWithin,
-    ST_GeomFromText,
-    ST_MakeEnvelope,
-    ST_SetSRID,
-    ST_Transform,
-)
+from typing import Any, AsyncIterator, Dict, List, Optional, Type
+
+from geoalchemy2.functions import ST_X, ST_Y, ST_Distance
 from opentelemetry import trace
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, Float, Select, func, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.configs.env import settings
+from src.core.infrastructure.database.cruds.documents import (
+    DocumentPage,
+    fetch_page,
+    page_of,
+    select_distance_documents,
+    select_organization_documents,
+    stream_documents,
+)
 from src.core.infrastructure.database.cruds.models.base import (
     CRUDWithOneSubModel,
 )
+from src.core.infrastructure.database.cruds.statements import (
+    GEOGRAPHY_POINT,
+    SPATIAL_PREDICATES,
+    SPATIAL_WARM_UP_PARAMS,
+    Param,
+    SpatialFilter,
+    SpatialKind,
+    WarmUpStatement,
+    named,
+    page_params,
+)
 from src.core.infrastructure.database.schemas.buildings import Building
 from src.core.infrastructure.database.schemas.organizations import Organization
+from src.core.infrastructure.spatial import SpatialIndex
 
 LOGGER = logging.getLogger(settings.webconf.LOG_OUT_COMMON)
 TRACER = trace.get_tracer(__name__)
 
 
 class OrganizationByLocationCRUD(CRUDWithOneSubModel[Organization, Building]):
-    """Location CRUD."""
+    """Location CRUD.
 
-    async def get_objects_in_rectangle(
+    With a ready ``spatial_index`` location filters become primary key
+    lookups of the buildings it found, PostGIS predicates otherwise.
+    """
+
+    def __init__(
         self,
-        bounds: tuple[float, float, float, float],
-        session: AsyncSession,
-    ) -> List[Organization]:
-        """Return Organization by activity type.
+        model: Type[Organization],
+        submodel: Type[Building],
+        spatial_index: Optional[SpatialIndex] = None,
+    ) -> None:
+        """Initialize CRUD model.
+
+        :param model: SQLAlchemy model
+        :param submodel: sub model
+        :param spatial_index: In-process index of building coordinates.
+        :type model: Type[Organization]
+        :type submodel: Type[Building]
+        :type spatial_index: Optional[SpatialIndex]
+        """
+        super().__init__(model, submodel)
+        self.spatial_index = spatial_index
+        self.building_id_stmt = named(
+            select(self.submodel.id).where(self.submodel.id == Param.ID),
+            "building_by_id",
+        )
+        self.documents_stmt = {
+            kind: named(
+                page_of(
+                    select_organization_documents().where(predicate),
+                    after_id=Param.AFTER_ID,
+                    limit=Param.PAGE_SIZE,
+                ),
+                f"documents_in_{kind}",
+            )
+            for kind, predicate in SPATIAL_PREDICATES.items()
+        }
+        nearest = self.select_nearest()
+        self.nearest_stmt: dict[Optional[SpatialKind], Select[tuple[str]]] = {
+            None: named(nearest, "nearest"),
+            "radius": named(
+                nearest.where(SPATIAL_PREDICATES["radius"]),
+                "nearest_in_radius",
+            ),
+            "buildings": named(
+                nearest.where(SPATIAL_PREDICATES["buildings"]),
+                "nearest_in_buildings",
+            ),
+        }
+
+    def select_nearest(self) -> Select[tuple[str]]:
+        """Build select of the ``Param.LIMIT`` nearest documents.
+
+        :return: Select of JSON documents with distance to the point.
+        """
+        return (
+            select_distance_documents(
+                ST_Distance(self.submodel.location_geog, GEOGRAPHY_POINT)
+            )
+            .order_by(
+                self.submodel.location_geog.op("<->", return_type=Float)(
+                    GEOGRAPHY_POINT
+                ),
+                self.model.id,
+            )
+            .limit(Param.LIMIT)
+        )
+
+    def warm_up_statements(self) -> List[WarmUpStatement]:
+        """Return prebuilt statements with values matching nothing.
+
+        :return: Statements and parameter values.
+        """
+        point = {"lon": 0.0, "lat": 0.0, "limit": 0}
+        statements: List[WarmUpStatement] = [
+            (self.building_id_stmt, {"id": 0})
+        ]
+        for kind, params in SPATIAL_WARM_UP_PARAMS.items():
+            statements.append(
+                (
+                    self.documents_stmt[kind],
+                    {**params, **page_params(after_id=0, limit=1)},
+                )
+            )
+        for kind, stmt in self.nearest_stmt.items():
+            params = SPATIAL_WARM_UP_PARAMS[kind] if kind else {}
+            statements.append((stmt, {**params, **point}))
+        return statements
+
+    def rectangle_filter(
+        self, bounds: tuple[float, float, float, float]
+    ) -> SpatialFilter:
+        """Return filter of buildings covered by the rectangle.
+
+        :param bounds: Rectangle by location
+        :return: SpatialFilter
+        """
+        if self.spatial_index is not None and self.spatial_index.ready:
+            return SpatialFilter(
+                "buildings", {"ids": self.spatial_index.in_rectangle(bounds)}
+            )
+        min_lon, max_lon, min_lat, max_lat = bounds
+        return SpatialFilter(
+            "rectangle",
+            {
+                "min_lon": min_lon,
+                "max_lon": max_lon,
+                "min_lat": min_lat,
+                "max_lat": max_lat,
+            },
+        )
+
+    def radius_filter(
+        self, point: tuple[float, float], radius: float
+    ) -> SpatialFilter:
+        """Return filter of buildings within the radius of the point.
+
+        Compared on the ``location_geog`` column, so the GiST index is
+        used and the radius is in geodesic meters.
+
+        :param point: Точка (долгота, широта).
+        :param radius: Радиус в метрах.
+        :return: SpatialFilter
+        """
+        if self.spatial_index is not None and self.spatial_index.ready:
+            return SpatialFilter(
+                "buildings",
+                {"ids": self.spatial_index.in_radius(point, radius)},
+            )
+        return SpatialFilter(
+            "radius", {"lon": point[0], "lat": point[1], "radius": radius}
+        )
+
+    @staticmethod
+    def predicate(spatial_filter: SpatialFilter) -> ColumnElement[bool]:
+        """Build predicate with the filter values bound in place.
+
+        For statements built on the fly, prebuilt ones take the values
+        as execution parameters instead.
+
+        :param spatial_filter: Spatial filter.
+        :return: SQL predicate.
+        """
+        return SPATIAL_PREDICATES[spatial_filter.kind].params(
+            **spatial_filter.params
+        )
+
+    def in_rectangle(
+        self, bounds: tuple[float, float, float, float]
+    ) -> ColumnElement[bool]:
+        """Build predicate of buildings covered by the rectangle.
 
         :param bounds: Rectangle by location
+        :return: SQL predicate.
+        """
+        return self.predicate(self.rectangle_filter(bounds))
+
+    def in_radius(
+        self, point: tuple[float, float], radius: float
+    ) -> ColumnElement[bool]:
+        """Build predicate of buildings within the radius of the point.
+
+        :param point: Точка (долгота, широта).
+        :param radius: Радиус в метрах.
+        :return: SQL predicate.
+        """
+        return self.predicate(self.radius_filter(point, radius))
+
+    async def building_exists(
+        self,
+        building_id: int,
+        session: AsyncSession,
+    ) -> bool:
+        """Check the building exists, without loading its organizations.
+
+        :param building_id: Building ID.
         :param session: SQLAlchemy session.
-        :return: Organization by activity type.
+        :return: True when the building exists.
         """
-        with TRACER.start_as_current_span("get_objects_in_rectangle") as span:
-            span.set_attribute("bounds", bounds)
+        with TRACER.start_as_current_span("building_exists") as span:
+            span.set_attribute("building.id", building_id)
             try:
-                min_lon, max_lon, min_lat, max_lat = bounds
-                rectangle = ST_SetSRID(
-                    ST_MakeEnvelope(min_lon, min_lat, max_lon, max_lat),
-                    4326,
+                result = await session.execute(
+                    self.building_id_stmt, {"id": building_id}
+                )
+                exists = result.scalar_one_or_none() is not None
+                span.set_attribute(
+                    "db.result", "success" if exists else "not_found"
+                )
+                return exists
+            except SQLAlchemyError as e:
+                span.record_exception(e)
+                span.set_status(
+                    trace.status.Status(trace.status.StatusCode.ERROR)
                 )
+                LOGGER.error("Error checking building by ID: %s", str(e))
+                return False
 
-                stmt = (
-                    select(self.model)
-                    .join(self.submodel)
-                    .where(ST_Covers(rectangle, self.submodel.location))
+    async def get_building_coordinates(
+        self, session: AsyncSession
+    ) -> tuple[List[int], List[float], List[float]]:
+        """Return IDs and coordinates of all buildings.
+
+        Errors are raised, so a failed refresh keeps the previous
+        snapshot of the spatial index.
+
+        :param session: SQLAlchemy session.
+        :return: Building IDs, longitudes and latitudes.
+        """
+        with TRACER.start_as_current_span("get_building_coordinates") as span:
+            ids, lon, lat = (
+                await session.execute(
+                    select(
+                        func.array_agg(self.submodel.id),
+                        func.array_agg(ST_X(self.submodel.location)),
+                        func.array_agg(ST_Y(self.submodel.location)),
+                    )
                 )
+            ).one()
+            span.set_attribute("db.result_count", len(ids or []))
+            return ids or [], lon or [], lat or []
 
-                result = await session.execute(stmt)
-                organizations = result.scalars().all()
-                span.set_attribute(
-                    "db.result", "success" if organizations else "not_found"
+    async def get_documents_in_rectangle(
+        self,
+        bounds: tuple[float, float, float, float],
+        session: AsyncSession,
+        limit: int,
+        after_id: int = 0,
+    ) -> DocumentPage:
+        """Return page of JSON documents of Organizations in the rectangle.
+
+        :param bounds: Rectangle by location
+        :param session: SQLAlchemy session.
+        :param limit: Page size.
+        :param after_id: Organization ID the page starts after.
+        :return: Page of JSON documents ordered by organization ID.
+        """
+        with TRACER.start_as_current_span(
+            "get_documents_in_rectangle"
+        ) as span:
+            span.set_attribute("bounds", bounds)
+            try:
+                spatial_filter = self.rectangle_filter(bounds)
+                page = await fetch_page(
+                    session,
+                    self.documents_stmt[spatial_filter.kind],
+                    limit,
+                    params={
+                        **spatial_filter.params,
+                        **page_params(after_id, limit),
+                    },
                 )
-                return list(organizations) if organizations else []
+                span.set_attribute("db.result_count", len(page.documents))
+                return page
             except SQLAlchemyError as e:
                 span.record_exception(e)
                 span.set_status(
                     trace.status.Status(trace.status.StatusCode.ERROR)
                 )
                 LOGGER.error(
-                    "Error retrieving organization by location: %s", str(e)
+                    "Error retrieving documents by location: %s", str(e)
                 )
-                return []
+                return DocumentPage(documents=[], last_id=None)
 
-    async def get_objects_in_radius(
+    async def get_documents_in_radius(
         self,
         point: tuple[float, float],
         radius: float,
         session: AsyncSession,
-    ) -> List[Organization]:
-        """
-        Найти объекты в заданном радиусе от точки.
+        limit: int,
+        after_id: int = 0,
+    ) -> DocumentPage:
+        """Return page of JSON documents of Organizations in the radius.
 
-        :param session: Сессия SQLAlchemy.
-        :param point: Точка (широта, долгота).
+        :param point: Точка (долгота, широта).
         :param radius: Радиус в метрах.
-        :return: Список объектов.
+        :param session: Сессия SQLAlchemy.
+        :param limit: Page size.
+        :param after_id: Organization ID the page starts after.
+        :return: Page of JSON documents ordered by organization ID.
         """
-        with TRACER.start_as_current_span("get_objects_in_radius") as span:
+        with TRACER.start_as_current_span("get_documents_in_radius") as span:
             span.set_attribute("radius", radius)
             try:
-                point_wkt = f"SRID=4326;POINT({point[0]} {point[1]})"
-                stmt = (
-                    select(self.model)
-                    .join(self.submodel)
-                    .where(
-                        ST_DWithin(
-                            ST_Transform(self.submodel.location, 3857),
-                            ST_Transform(ST_GeomFromText(point_wkt), 3857),
-                            radius,
-                        )
-                    )
+                spatial_filter = self.radius_filter(point, radius)
+                page = await fetch_page(
+                    session,
+                    self.documents_stmt[spatial_filter.kind],
+                    limit,
+                    params={
+                        **spatial_filter.params,
+                        **page_params(after_id, limit),
+                    },
                 )
-
-                result = await session.execute(stmt)
-                span.set_attribute(
-                    "db.result", "success" if result else "not_found"
+                span.set_attribute("db.result_count", len(page.documents))
+                return page
+            except SQLAlchemyError as e:
+                span.record_exception(e)
+                span.set_status(
+                    trace.status.Status(trace.status.StatusCode.ERROR)
+                )
+                LOGGER.error(
+                    "Error retrieving documents by location: %s", str(e)
                 )
-                return list(result.scalars().unique().all())
+                return DocumentPage(documents=[], last_id=None)
+
+    async def get_documents_nearest(
+        self,
+        point: tuple[float, float],
+        k: int,
+        session: AsyncSession,
+        max_distance: Optional[float] = None,
+    ) -> List[str]:
+        """Return JSON documents of the K nearest Organizations.
+
+        Ordered by the KNN ``<->`` operator, so the GiST index of
+        ``location_geog`` yields rows closest first without a radius.
+
+        :param point: Точка (долгота, широта).
+        :param k: Max organizations.
+        :param session: Сессия SQLAlchemy.
+        :param max_distance: Max distance in meters.
+        :return: JSON documents with distance, closest first.
+        """
+        with TRACER.start_as_current_span("get_documents_nearest") as span:
+            span.set_attribute("k", k)
+            try:
+                params: Dict[str, Any] = {
+                    "lon": point[0],
+                    "lat": point[1],
+                    "limit": k,
+                }
+                kind: Optional[SpatialKind] = None
+                if max_distance is not None:
+                    kind, within = self.radius_filter(point, max_distance)
+                    params.update(within)
+                stmt = self.nearest_stmt[kind]
+                documents = list((await session.scalars(stmt, params)).all())
+                span.set_attribute("db.result_count", len(documents))
+                return documents
             except SQLAlchemyError as e:
                 span.record_exception(e)
                 span.set_status(
                     trace.status.Status(trace.status.StatusCode.ERROR)
                 )
                 LOGGER.error(
-                    "Error retrieving organization by location: %s", str(e)
+                    "Error retrieving nearest organizations: %s", str(e)
                 )
                 return []
+
+    def stream_documents_in_rectangle(
+        self,
+        bounds: tuple[float, float, float, float],
+        session: AsyncSession,
+        after_id: int = 0,
+    ) -> AsyncIterator[str]:
+        """Stream JSON documents of Organizations in the rectangle.
+
+        :param bounds: Rectangle by location
+        :param session: SQLAlchemy session, open while iterating.
+        :param after_id: Organization ID the stream starts after.
+        :return: JSON documents ordered by organization ID.
+        """
+        spatial_filter = self.rectangle_filter(bounds)
+        return stream_documents(
+            session,
+            select_organization_documents().where(
+                SPATIAL_PREDICATES[spatial_filter.kind]
+            ),
+            span_name="stream_documents_in_rectangle",
+            after_id=after_id,
+            params=spatial_filter.params,
+        )
+
+    def stream_documents_in_radius(
+        self,
+        point: tuple[float, float],
+        radius: float,
+        session: AsyncSession,
+        after_id: int = 0,
+    ) -> AsyncIterator[str]:
+        """Stream JSON documents of Organizations in the radius.
+
+        :param point: Точка (долгота, широта).
+        :param radius: Радиус в метрах.
+        :param session: Сессия SQLAlchemy, открыта на время итерации.
+        :param after_id: Organization ID the stream starts after.
+        :return: JSON documents ordered by organization ID.
+        """
+        spatial_filter = self.radius_filter(point, radius)
+        return stream_documents(
+            session,
+            select_organization_documents().where(
+                SPATIAL_PREDICATES[spatial_filter.kind]
+            ),
+            span_name="stream_documents_in_radius",
+            after_id=after_id,
+            params=spatial_filter.params,
+        )
@@ -1,15 +1,45 @@
 """Organization CRUD API."""
 
 import logging
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Type
 
 from opentelemetry import trace
-from sqlalchemy import select
+from sqlalchemy import (
+    ARRAY,
+    Integer,
+    Select,
+    String,
+    any_,
+    func,
+    literal,
+    or_,
+    select,
+)
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.infrastructure.database.cruds.documents import (
+    DocumentPage,
+    fetch_page,
+    page_of,
+    select_organization_documents,
+)
 from src.core.infrastructure.database.cruds.models.base import CRUDBase
-from src.core.infrastructure.database.schemas.organizations import Organization
+from src.core.infrastructure.database.cruds.statements import (
+    Param,
+    WarmUpStatement,
+    named,
+    page_params,
+)
+from src.core.infrastructure.database.schemas.organizations import (
+    Organization,
+    search_key,
+)
+from src.core.infrastructure.search import (
+    AutocompleteIndex,
+    OrganizationKeyFilter,
+    normalize,
+)
 
 LOGGER = logging.getLogger(__name__)
 TRACER = trace.get_tracer(__name__)
@@ -18,74 +48,319 @@ TRACER = trace.get_tracer(__name__)
 class OrganizationCRUD(CRUDBase[Organization]):
     """Organization CRUD."""
 
-    async def get_by_id(
+    def __init__(
+        self,
+        model: Type[Organization],
+        autocomplete: Optional[AutocompleteIndex] = None,
+        key_filter: Optional[OrganizationKeyFilter] = None,
+    ) -> None:
+        """Initialize CRUD model.
+
+        :param model: SQLAlchemy model
+        :param autocomplete: In-process prefix index of names.
+        :param key_filter: In-process filter of existing IDs and names.
+        """
+        super().__init__(model)
+        self.autocomplete = autocomplete
+        self.key_filter = key_filter
+        self.document_by_id_stmt = named(
+            select_organization_documents().where(self.model.id == Param.ID),
+            "document_by_id",
+        )
+        self.document_by_name_stmt = named(
+            select_organization_documents()
+            .where(self.model.name == Param.NAME)
+            .order_by(self.model.id)
+            .limit(1),
+            "document_by_name",
+        )
+        self.documents_by_building_stmt = named(
+            page_of(
+                select_organization_documents().where(
+                    self.model.building_id == Param.ID
+                ),
+                after_id=Param.AFTER_ID,
+                limit=Param.PAGE_SIZE,
+            ),
+            "documents_by_building",
+        )
+
+    def warm_up_statements(self) -> List[WarmUpStatement]:
+        """Return prebuilt statements with values matching nothing.
+
+        :return: Statements and parameter values.
+        """
+        return [
+            (self.document_by_id_stmt, {"id": 0}),
+            (self.document_by_name_stmt, {"name": ""}),
+            (
+                self.documents_by_building_stmt,
+                {"id": 0, **page_params(after_id=0, limit=1)},
+            ),
+        ]
+
+    async def get_document_by_id(
         self, session: AsyncSession, id_obj: Any
-    ) -> Optional[Organization]:
-        """Get Organization by ID."""
-        with TRACER.start_as_current_span("get_organization_by_id") as span:
+    ) -> Optional[str]:
+        """Get JSON document of Organization by ID."""
+        with TRACER.start_as_current_span(
+            "get_organization_document_by_id"
+        ) as span:
             span.set_attribute("organization.id", id_obj)
             try:
-                organization = await session.get(self.model, id_obj)
+                document = await session.scalar(
+                    self.document_by_id_stmt, {"id": id_obj}
+                )
                 span.set_attribute(
-                    "db.result", "success" if organization else "not_found"
+                    "db.result", "success" if document else "not_found"
                 )
-                return organization
+                return document
             except SQLAlchemyError as e:
                 span.record_exception(e)
                 span.set_status(
                     trace.status.Status(trace.status.StatusCode.ERROR)
                 )
-                LOGGER.error("Error retrieving object: %s", str(e))
+                LOGGER.error("Error retrieving document: %s", str(e))
                 return None
 
-    async def get_by_name(
+    async def get_document_by_name(
         self, session: AsyncSession, name: str
-    ) -> Optional[Organization]:
-        """Get Organization by name."""
-        with TRACER.start_as_current_span("get_organization_by_name") as span:
+    ) -> Optional[str]:
+        """Get JSON document of Organization by name."""
+        with TRACER.start_as_current_span(
+            "get_organization_document_by_name"
+        ) as span:
             span.set_attribute("organization.name", name)
             try:
-                stmt = select(self.model).where(self.model.name == name)
-                result = await session.execute(stmt)
-                organization = result.scalar_one_or_none()
+                document = await session.scalar(
+                    self.document_by_name_stmt, {"name": name}
+                )
                 span.set_attribute(
-                    "db.result", "success" if organization else "not_found"
+                    "db.result", "success" if document else "not_found"
                 )
-                return organization
+                return document
             except SQLAlchemyError as e:
                 span.record_exception(e)
                 span.set_status(
                     trace.status.Status(trace.status.StatusCode.ERROR)
                 )
-                LOGGER.error(
-                    "Error retrieving organization by name: %s", str(e)
-                )
+                LOGGER.error("Error retrieving document by name: %s", str(e))
                 return None
 
-    async def get_by_building(
+    async def get_documents_by_building(
         self,
         building_id: int,
         session: AsyncSession,
-    ) -> List[Organization]:
-        """Return Organization by building ID."""
+        limit: int,
+        after_id: int = 0,
+    ) -> DocumentPage:
+        """Return page of JSON documents of Organizations by building ID."""
         with TRACER.start_as_current_span(
-            "get_organization_by_building"
+            "get_organization_documents_by_building"
         ) as span:
             span.set_attribute("building.id", building_id)
             try:
-                stmt = select(self.model).where(
-                    self.model.building_id == building_id
+                page = await fetch_page(
+                    session,
+                    self.documents_by_building_stmt,
+                    limit,
+                    params={"id": building_id, **page_params(after_id, limit)},
                 )
-                result = await session.execute(stmt)
-                organizations = list(result.scalars().all())
-                span.set_attribute("db.result_count", len(organizations))
-                return organizations
+                span.set_attribute("db.result_count", len(page.documents))
+                return page
             except SQLAlchemyError as e:
                 span.record_exception(e)
                 span.set_status(
                     trace.status.Status(trace.status.StatusCode.ERROR)
                 )
                 LOGGER.error(
-                    "Error retrieving organization by building ID: %s", str(e)
+                    "Error retrieving documents by building ID: %s", str(e)
                 )
+                return DocumentPage(documents=[], last_id=None)
+
+    def search_statement(self, query: str, limit: int) -> Select[tuple[str]]:
+        """Build select of documents with names similar to the query.
+
+        Names are matched by trigram word similarity on the normalized
+        name, which is served by the ``ix_organization_name_trgm`` index.
+
+        :param query: Part of organization name.
+        :param limit: Max organizations.
+        :return: Select of JSON documents, most similar first.
+        """
+        name = search_key(self.model.name)
+        text = search_key(literal(query))
+        return (
+            select_organization_documents()
+            .where(name.op("%>")(text))
+            .order_by(func.word_similarity(text, name).desc(), self.model.id)
+            .limit(limit)
+        )
+
+    async def search_documents(
+        self,
+        query: str,
+        session: AsyncSession,
+        limit: int,
+    ) -> List[str]:
+        """Return JSON documents of Organizations with similar names.
+
+        :param query: Part of organization name.
+        :param session: SQLAlchemy session.
+        :param limit: Max organizations.
+        :return: JSON documents, most similar first.
+        """
+        with TRACER.start_as_current_span(
+            "search_organization_documents"
+        ) as span:
+            span.set_attribute("organization.query", query)
+            try:
+                stmt = self.search_statement(query, limit)
+                documents = list((await session.scalars(stmt)).all())
+                span.set_attribute("db.result_count", len(documents))
+                return documents
+            except SQLAlchemyError as e:
+                span.record_exception(e)
+                span.set_status(
+                    trace.status.Status(trace.status.StatusCode.ERROR)
+                )
+                LOGGER.error("Error searching organizations: %s", str(e))
                 return []
+
+    async def get_names(
+        self, session: AsyncSession, after_id: int = 0
+    ) -> List[tuple[int, str]]:
+        """Return IDs and names of Organizations created after the ID.
+
+        Errors are raised, so a failed refresh keeps the previous
+        autocomplete index or key filter.
+        """
+        with TRACER.start_as_current_span("get_organization_names") as span:
+            span.set_attribute("organization.after_id", after_id)
+            result = await session.execute(
+                select(self.model.id, self.model.name)
+                .where(self.model.id > after_id)
+                .order_by(self.model.id)
+            )
+            rows = [(row.id, row.name) for row in result]
+            span.set_attribute("db.result_count", len(rows))
+            return rows
+
+    async def suggest_names(
+        self, prefix: str, session: AsyncSession, limit: int
+    ) -> List[tuple[int, str]]:
+        """Return IDs and names with a name word starting with prefix.
+
+        Used while the autocomplete index is not built.
+        """
+        with TRACER.start_as_current_span(
+            "suggest_organization_names"
+        ) as span:
+            span.set_attribute("organization.prefix", prefix)
+            try:
+                name = search_key(self.model.name)
+                prefix = normalize(prefix)
+                result = await session.execute(
+                    select(self.model.id, self.model.name)
+                    .where(
+                        name.startswith(prefix, autoescape=True)
+                        | name.contains(f" {prefix}", autoescape=True)
+                    )
+                    .order_by(name, self.model.id)
+                    .limit(limit)
+                )
+                rows = [(row.id, row.name) for row in result]
+                span.set_attribute("db.result_count", len(rows))
+                return rows
+            except SQLAlchemyError as e:
+                span.record_exception(e)
+                span.set_status(
+                    trace.status.Status(trace.status.StatusCode.ERROR)
+                )
+                LOGGER.error("Error suggesting organizations: %s", str(e))
+                return []
+
+    async def get_documents_by_ids(
+        self, ids: List[int], session: AsyncSession
+    ) -> List[str]:
+        """Return JSON documents of Organizations in the order of IDs.
+
+        Missing IDs are skipped.
+        """
+        with TRACER.start_as_current_span(
+            "get_organization_documents_by_ids"
+        ) as span:
+            span.set_attribute("organization.count", len(ids))
+            if not ids:
+                return []
+            try:
+                id_array = literal(ids, ARRAY(Integer))
+                stmt = (
+                    select_organization_documents()
+                    .where(self.model.id == any_(id_array))
+                    .order_by(func.array_position(id_array, self.model.id))
+                )
+                documents = list((await session.scalars(stmt)).all())
+                span.set_attribute("db.result_count", len(documents))
+                return documents
+            except SQLAlchemyError as e:
+                span.record_exception(e)
+                span.set_status(
+                    trace.status.Status(trace.status.StatusCode.ERROR)
+                )
+                LOGGER.error("Error retrieving documents by IDs: %s", str(e))
+                return []
+
+    async def get_documents_by_keys(
+        self, ids: List[int], names: List[str], session: AsyncSession
+    ) -> tuple[dict[int, str], dict[str, str]]:
+        """Return JSON documents of Organizations by IDs and names.
+
+        One query for both lists. A name shared by several
+        organizations resolves to the one with the lowest ID, as in
+        ``get_document_by_name``.
+
+        :param ids: Organization IDs.
+        :param names: Organization names.
+        :param session: SQLAlchemy session.
+        :return: Documents by ID and documents by name, misses are absent.
+        :raises SQLAlchemyError: The query failed, so misses are unknown.
+        """
+        with TRACER.start_as_current_span(
+            "get_organization_documents_by_keys"
+        ) as span:
+            span.set_attribute("organization.ids", len(ids))
+            span.set_attribute("organization.names", len(names))
+            try:
+                stmt = (
+                    select_organization_documents()
+                    .add_columns(self.model.id, self.model.name)
+                    .where(
+                        or_(
+                            self.model.id
+                            == any_(literal(ids, ARRAY(Integer))),
+                            self.model.name
+                            == any_(literal(names, ARRAY(String))),
+                        )
+                    )
+                    .order_by(self.model.id)
+                )
+                by_id: dict[int, str] = {}
+                by_name: dict[str, str] = {}
+                requested_ids, requested_names = set(ids), set(names)
+                for document, id_, name in await session.execute(stmt):
+                    if id_ in requested_ids:
+                        by_id[id_] = document
+                    if name in requested_names:
+                        by_name.setdefault(name, document)
+                span.set_attribute(
+                    "db.result_count", len(by_id) + len(by_name)
+                )
+                return by_id, by_name
+            except SQLAlchemyError as e:
+                span.record_exception(e)
+                span.set_status(
+                    trace.status.Status(trace.status.StatusCode.ERROR)
+                )
+                LOGGER.error("Error retrieving documents by keys: %s", str(e))
+                raise
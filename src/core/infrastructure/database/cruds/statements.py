@@ -0,0 +1,125 @@
+"""Parameterized statements of CRUD hot paths.
+
+Statements are built once from the bound parameters below and executed
+with their values, so every call has the same cache key and SQL text:
+SQLAlchemy reuses the compiled statement and asyncpg its prepared
+statement instead of building, compiling and preparing on every call.
+"""
+
+from typing import Any, Dict, Literal, NamedTuple, Tuple, TypeVar
+
+from geoalchemy2.functions import (
+    ST_Covers,
+    ST_DWithin,
+    ST_MakeEnvelope,
+    ST_MakePoint,
+    ST_SetSRID,
+)
+from sqlalchemy import (
+    ARRAY,
+    ColumnElement,
+    Executable,
+    Float,
+    Integer,
+    String,
+    any_,
+    bindparam,
+    func,
+)
+
+from src.core.infrastructure.database.core.statement_cache import (
+    STATEMENT_NAME,
+)
+from src.core.infrastructure.database.schemas.buildings import Building
+
+SpatialKind = Literal["rectangle", "radius", "buildings"]
+
+E = TypeVar("E", bound=Executable)
+
+# Statement and parameter values it is primed with on pool warm-up.
+WarmUpStatement = Tuple[Executable, Dict[str, Any]]
+
+
+class Param:
+    """Bound parameters shared by prebuilt statements."""
+
+    ID = bindparam("id", type_=Integer)
+    IDS = bindparam("ids", type_=ARRAY(Integer))
+    NAME = bindparam("name", type_=String)
+    AFTER_ID = bindparam("after_id", type_=Integer)
+    PAGE_SIZE = bindparam("page_size", type_=Integer)
+    LIMIT = bindparam("limit", type_=Integer)
+    LON = bindparam("lon", type_=Float)
+    LAT = bindparam("lat", type_=Float)
+    RADIUS = bindparam("radius", type_=Float)
+    MIN_LON = bindparam("min_lon", type_=Float)
+    MAX_LON = bindparam("max_lon", type_=Float)
+    MIN_LAT = bindparam("min_lat", type_=Float)
+    MAX_LAT = bindparam("max_lat", type_=Float)
+
+
+def named(stmt: E, name: str) -> E:
+    """Name the statement for the statement cache counters.
+
+    :param stmt: Statement.
+    :param name: Name the hits and misses are counted under.
+    :return: Statement with the ``statement_name`` execution option.
+    """
+    return stmt.execution_options(**{STATEMENT_NAME: name})
+
+
+def page_params(after_id: int, limit: int) -> Dict[str, Any]:
+    """Return values of a statement paginated by ``Param.AFTER_ID``.
+
+    :param after_id: Organization ID the page starts after.
+    :param limit: Page size.
+    :return: Parameter values.
+    """
+    return {"after_id": after_id, "page_size": limit}
+
+
+# Point given by ``Param.LON`` and ``Param.LAT``.
+GEOGRAPHY_POINT: ColumnElement[Any] = func.geography(
+    ST_SetSRID(ST_MakePoint(Param.LON, Param.LAT), 4326)
+)
+
+SPATIAL_PREDICATES: Dict[SpatialKind, ColumnElement[bool]] = {
+    "rectangle": ST_Covers(
+        ST_SetSRID(
+            ST_MakeEnvelope(
+                Param.MIN_LON, Param.MIN_LAT, Param.MAX_LON, Param.MAX_LAT
+            ),
+            4326,
+        ),
+        Building.location,
+    ),
+    "radius": ST_DWithin(
+        Building.location_geog, GEOGRAPHY_POINT, Param.RADIUS
+    ),
+    # Buildings found by the in-process spatial index.
+    "buildings": Building.id == any_(Param.IDS),
+}
+
+# Values of ``SPATIAL_PREDICATES`` matching (next to) no building.
+SPATIAL_WARM_UP_PARAMS: Dict[SpatialKind, Dict[str, Any]] = {
+    "rectangle": {
+        "min_lon": 0.0,
+        "max_lon": 0.0,
+        "min_lat": 0.0,
+        "max_lat": 0.0,
+    },
+    "radius": {"lon": 0.0, "lat": 0.0, "radius": 0.0},
+    "buildings": {"ids": []},
+}
+
+
+class SpatialFilter(NamedTuple):
+    """Spatial predicate and values of its parameters.
+
+    Attributes:
+        kind (SpatialKind): Key of the predicate in ``SPATIAL_PREDICATES``.
+        params (Dict[str, Any]): Values of its bound parameters.
+    """
+
+    kind: SpatialKind
+    params: Dict[str, Any]
@@ -1,6 +1,6 @@
 """Organization's activity schema."""
 
-from sqlalchemy import CheckConstraint, ForeignKey, Integer, String
+from sqlalchemy import ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, backref, mapped_column, relationship
 
 from src.core.infrastructure.database.schemas.base import BaseModel
@@ -14,29 +14,27 @@ class Activity(BaseModel):
     id: Mapped[int] = mapped_column(
         Integer, primary_key=True, autoincrement=True
     )
-    name: Mapped[str] = mapped_column(String, nullable=False)
+    name: Mapped[str] = mapped_column(String, nullable=False, index=True)
     parent_id: Mapped[int | None] = mapped_column(
-        ForeignKey("activity.id", ondelete="CASCADE"), nullable=True
+        ForeignKey("activity.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True,
     )
     level: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
 
     children = relationship(
         "Activity",
-        backref=backref("parent", remote_side=[id]),
+        backref=backref("parent", remote_side=[id], lazy="raise"),
         cascade="all, delete-orphan",
         single_parent=True,
-        lazy="selectin",
+        lazy="raise",
     )
 
     organizations = relationship(
         "Organization",
         secondary="organization_activity",
         back_populates="activities",
-        lazy="selectin",
-    )
-
-    __table_args__ = (
-        CheckConstraint(sqltext="level <= 3", name="check_max_level"),
+        lazy="raise",
     )
 
 
@@ -53,4 +51,5 @@ class OrganizationActivity(BaseModel):
     activity_id: Mapped[int] = mapped_column(
         ForeignKey("activity.id", ondelete="CASCADE"),
         primary_key=True,
+        index=True,
     )
@@ -1,7 +1,7 @@
 """Sqlalchemy models for buildings."""
 
-from geoalchemy2 import Geometry
-from sqlalchemy import Integer
+from geoalchemy2 import Geography, Geometry
+from sqlalchemy import Computed, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.infrastructure.database.schemas.base import BaseModel
@@ -19,9 +19,16 @@ class Building(BaseModel):
     location: Mapped[Geometry] = mapped_column(
         Geometry("POINT", srid=4326), nullable=False, index=True
     )
+    # Geodesic copy of ``location`` for radius search in meters.
+    location_geog: Mapped[Geography] = mapped_column(
+        Geography("POINT", srid=4326),
+        Computed("location::geography", persisted=True),
+        nullable=False,
+        deferred=True,
+    )
 
     organizations = relationship(
         "Organization",
         back_populates="building",
-        lazy="selectin",
+        lazy="raise",
     )
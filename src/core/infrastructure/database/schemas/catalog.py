@@ -0,0 +1,92 @@
+"""Sqlalchemy model of the catalog data version.
+
+The version is a row updated by the writing transaction, so it changes
+when the change is committed, not before, and never goes back.
+``catalog_version_ddl`` builds its current triggers for
+``metadata.create_all``; migrations keep a copy of the statements as of
+their revision.
+"""
+
+from typing import Any, List
+
+from sqlalchemy import (
+    BigInteger,
+    CheckConstraint,
+    Connection,
+    Integer,
+    MetaData,
+    event,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.infrastructure.database.schemas.base import BaseModel
+
+
+class CatalogVersion(BaseModel):
+    """Single row counting committed changes of the catalog.
+
+    Bumped by database triggers only, see ``catalog_version_ddl``.
+    """
+
+    __tablename__ = "catalog_version"
+    __table_args__ = (CheckConstraint("id = 1", name="catalog_version_one"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, default=1)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+
+# Tables responses are built from.
+CATALOG_TABLES = (
+    "organization",
+    "building",
+    "activity",
+    "phone_number",
+    "organization_activity",
+)
+
+
+def catalog_version_ddl() -> List[str]:
+    """Build the function and triggers bumping the catalog version.
+
+    One bump per writing statement, whatever the number of rows.
+
+    :return: DDL statements, safe to run again.
+    """
+    ddl = [
+        "INSERT INTO catalog_version (id, version) VALUES (1, 0) "
+        "ON CONFLICT (id) DO NOTHING",
+        """
+        CREATE OR REPLACE FUNCTION bump_catalog_version()
+        RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+            RETURN NULL;
+        END
+        $$
+        """,
+    ]
+    for table in CATALOG_TABLES:
+        ddl.append(f"DROP TRIGGER IF EXISTS {table}_version ON {table}")
+        ddl.append(
+            f"CREATE TRIGGER {table}_version "
+            f"AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION bump_catalog_version()"
+        )
+    return ddl
+
+
+@event.listens_for(BaseModel.metadata, "after_create")
+def create_catalog_version_triggers(
+    target: MetaData, connection: Connection, **kw: Any
+) -> None:
+    """Create version triggers along with the tables, e.g. in tests.
+
+    Migrations create them from their own copy of the statements.
+
+    :param target: Metadata created.
+    :param connection: Connection creating it.
+    :param kw: Other event arguments.
+    :return: None
+    """
+    for statement in catalog_version_ddl():
+        connection.exec_driver_sql(statement)
@@ -0,0 +1,230 @@
+"""Sqlalchemy model of precomputed organization documents.
+
+Documents are kept current by triggers on the tables they are built
+from. ``document_triggers_ddl`` builds the current triggers for
+``metadata.create_all``; migrations keep a copy of the statements as of
+their revision, so a change of ``organization_json`` needs a new
+migration with the changed function.
+"""
+
+from typing import Any, List
+
+from geoalchemy2.functions import ST_X, ST_Y
+from sqlalchemy import (
+    ColumnElement,
+    Connection,
+    ForeignKey,
+    Insert,
+    MetaData,
+    Text,
+    any_,
+    cast,
+    event,
+    func,
+    literal_column,
+    select,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.infrastructure.database.schemas.activity import (
+    Activity,
+    OrganizationActivity,
+)
+from src.core.infrastructure.database.schemas.base import BaseModel
+from src.core.infrastructure.database.schemas.buildings import Building
+from src.core.infrastructure.database.schemas.organizations import Organization
+from src.core.infrastructure.database.schemas.phones import PhoneNumber
+
+
+class OrganizationDocument(BaseModel):
+    """Ready-to-serve ``OrganizationResponse`` JSON of an organization.
+
+    Written by database triggers only, see ``document_triggers_ddl``.
+    """
+
+    __tablename__ = "organization_document"
+
+    organization_id: Mapped[int] = mapped_column(
+        ForeignKey("organization.id", ondelete="CASCADE"), primary_key=True
+    )
+    document: Mapped[str] = mapped_column(Text, nullable=False)
+
+
+EMPTY_JSON_ARRAY = literal_column("'[]'::json")
+
+
+def json_object(**fields: ColumnElement[Any]) -> ColumnElement[Any]:
+    """Build ``json_build_object`` with constant keys.
+
+    Keys are rendered as SQL literals, so they are not sent as untyped
+    bind parameters.
+
+    :param fields: Keys and values of the JSON object.
+    :return: SQL expression of the JSON object.
+    """
+    arguments: list[ColumnElement[Any]] = []
+    for key, value in fields.items():
+        arguments.extend((literal_column(f"'{key}'"), value))
+    return func.json_build_object(*arguments)
+
+
+def organization_json() -> ColumnElement[Any]:
+    """Build the ``OrganizationResponse`` JSON of an organization row.
+
+    Correlated to ``organization`` and ``building`` of the outer query.
+
+    :return: SQL expression of the JSON object.
+    """
+    phones = (
+        select(
+            func.coalesce(
+                func.json_agg(
+                    aggregate_order_by(
+                        json_object(phone=PhoneNumber.number), PhoneNumber.id
+                    )
+                ),
+                EMPTY_JSON_ARRAY,
+            )
+        )
+        .where(PhoneNumber.organization_id == Organization.id)
+        .scalar_subquery()
+    )
+    activities = (
+        select(
+            func.coalesce(
+                func.json_agg(
+                    aggregate_order_by(
+                        json_object(name=Activity.name), Activity.id
+                    )
+                ),
+                EMPTY_JSON_ARRAY,
+            )
+        )
+        .join(
+            OrganizationActivity,
+            OrganizationActivity.activity_id == Activity.id,
+        )
+        .where(OrganizationActivity.organization_id == Organization.id)
+        .scalar_subquery()
+    )
+    building = json_object(
+        id=Building.id,
+        address=Building.address,
+        location=json_object(
+            longitude=ST_X(Building.location),
+            latitude=ST_Y(Building.location),
+        ),
+    )
+    return json_object(
+        id=Organization.id,
+        name=Organization.name,
+        building=building,
+        phones=phones,
+        activity=activities,
+    )
+
+
+def refresh_documents() -> Insert:
+    """Build upsert of documents of organizations given by ``ids``.
+
+    Organizations missing, e.g. deleted meanwhile, are skipped.
+
+    :return: Insert referring to the ``ids`` argument of the function.
+    """
+    stmt = insert(OrganizationDocument).from_select(
+        ["organization_id", "document"],
+        select(Organization.id, cast(organization_json(), Text))
+        .select_from(Organization)
+        .join(Building, Organization.building_id == Building.id)
+        .where(Organization.id == any_(literal_column("ids"))),
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[OrganizationDocument.organization_id],
+        set_={"document": stmt.excluded.document},
+    )
+
+
+# Changes of these tables change the documents. Deleted organizations
+# lose their document by the foreign key cascade.
+DOCUMENT_TRIGGER_EVENTS = {
+    "organization": "INSERT OR UPDATE OF name, building_id",
+    "building": "UPDATE OF address, location",
+    "activity": "UPDATE OF name",
+    "phone_number": "INSERT OR UPDATE OR DELETE",
+    "organization_activity": "INSERT OR UPDATE OR DELETE",
+}
+
+
+def document_triggers_ddl() -> List[str]:
+    """Build functions and triggers maintaining ``organization_document``.
+
+    :return: DDL statements, safe to run again.
+    """
+    refresh = refresh_documents().compile(
+        dialect=postgresql.dialect(),
+        compile_kwargs={"literal_binds": True},
+    )
+    ddl = [
+        f"""
+        CREATE OR REPLACE FUNCTION refresh_organization_documents(
+            ids integer[]
+        ) RETURNS void LANGUAGE sql AS $$ {refresh} $$
+        """,
+        """
+        CREATE OR REPLACE FUNCTION organization_document_trigger()
+        RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_TABLE_NAME = 'organization' THEN
+                PERFORM refresh_organization_documents(ARRAY[NEW.id]);
+            ELSIF TG_TABLE_NAME = 'building' THEN
+                PERFORM refresh_organization_documents(ARRAY(
+                    SELECT id FROM organization WHERE building_id = NEW.id
+                ));
+            ELSIF TG_TABLE_NAME = 'activity' THEN
+                PERFORM refresh_organization_documents(ARRAY(
+                    SELECT organization_id FROM organization_activity
+                    WHERE activity_id = NEW.id
+                ));
+            ELSE
+                IF TG_OP <> 'INSERT' THEN
+                    PERFORM refresh_organization_documents(
+                        ARRAY[OLD.organization_id]
+                    );
+                END IF;
+                IF TG_OP <> 'DELETE' THEN
+                    PERFORM refresh_organization_documents(
+                        ARRAY[NEW.organization_id]
+                    );
+                END IF;
+            END IF;
+            RETURN NULL;
+        END
+        $$
+        """,
+    ]
+    for table, events in DOCUMENT_TRIGGER_EVENTS.items():
+        ddl.append(f"DROP TRIGGER IF EXISTS {table}_document ON {table}")
+        ddl.append(
+            f"CREATE TRIGGER {table}_document AFTER {events} ON {table} "
+            "FOR EACH ROW EXECUTE FUNCTION organization_document_trigger()"
+        )
+    return ddl
+
+
+@event.listens_for(BaseModel.metadata, "after_create")
+def create_document_triggers(
+    target: MetaData, connection: Connection, **kw: Any
+) -> None:
+    """Create document triggers along with the tables, e.g. in tests.
+
+    Migrations create them from their own copy of the statements.
+
+    :param target: Metadata created.
+    :param connection: Connection creating it.
+    :param kw: Other event arguments.
+    :return: None
+    """
+    for statement in document_triggers_ddl():
+        connection.exec_driver_sql(statement)
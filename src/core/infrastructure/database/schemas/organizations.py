@@ -1,11 +1,36 @@
 """Sqlalchemy models for organization."""
 
-from sqlalchemy import ForeignKey, Integer
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    ForeignKey,
+    Index,
+    Integer,
+    func,
+    literal,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.infrastructure.database.schemas.base import BaseModel
 
 
+def search_key(name: ColumnElement[Any]) -> ColumnElement[str]:
+    """Fold case and ``ё`` to ``е`` for name search.
+
+    The same expression is indexed. Constants are rendered inline, so
+    queries match the index definition.
+
+    :param name: Name column or search text.
+    :return: SQL expression of the normalized text.
+    """
+    return func.replace(
+        func.lower(name),
+        literal("ё", literal_execute=True),
+        literal("е", literal_execute=True),
+    )
+
+
 class Organization(BaseModel):
     """Organization model."""
 
@@ -22,17 +47,25 @@ class Organization(BaseModel):
     building = relationship(
         "Building",
         back_populates="organizations",
-        lazy="selectin",
+        lazy="raise",
     )
     phone_numbers = relationship(
         "PhoneNumber",
         back_populates="organization",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise",
     )
     activities = relationship(
         "Activity",
         secondary="organization_activity",
         back_populates="organizations",
-        lazy="selectin",
+        lazy="raise",
     )
+
+
+Index(
+    "ix_organization_name_trgm",
+    search_key(Organization.name).label("name_search"),
+    postgresql_using="gin",
+    postgresql_ops={"name_search": "gin_trgm_ops"},
+)
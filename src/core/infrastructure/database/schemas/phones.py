@@ -22,5 +22,5 @@ class PhoneNumber(BaseModel):
     organization = relationship(
         "Organization",
         back_populates="phone_numbers",
-        lazy="selectin",
+        lazy="raise",
     )
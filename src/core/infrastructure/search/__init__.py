@@ -0,0 +1,17 @@
+"""In-process search structures."""
+
+from src.core.infrastructure.search.autocomplete import (
+    AutocompleteIndex,
+    normalize,
+)
+from src.core.infrastructure.search.bloom import (
+    BloomFilter,
+    OrganizationKeyFilter,
+)
+
+__all__ = [
+    "AutocompleteIndex",
+    "BloomFilter",
+    "OrganizationKeyFilter",
+    "normalize",
+]
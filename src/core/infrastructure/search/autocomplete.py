@@ -0,0 +1,178 @@
+"""Prefix autocomplete of organization names."""
+
+import asyncio
+import heapq
+import logging
+from array import array
+from bisect import bisect_left
+from typing import Iterable, List, NamedTuple, Optional, Sequence
+
+from src.core.configs.env import settings
+
+LOGGER = logging.getLogger(settings.webconf.LOG_OUT_COMMON)
+
+
+def normalize(text: str) -> str:
+    """Fold case, ``ё`` to ``е`` and whitespace runs to one space.
+
+    Case and ``ё`` are folded as by ``search_key`` of the trigram
+    index, which keeps whitespace as is.
+
+    :param text: Name or typed prefix.
+    :return: Normalized text.
+    """
+    return " ".join(text.lower().replace("ё", "е").split())
+
+
+def name_keys(name: str) -> List[str]:
+    """Return keys of a name: the name from the start of every word.
+
+    So ``Ромашка`` finds ``ООО Ромашка`` as well.
+
+    :param name: Organization name.
+    :return: Normalized keys.
+    """
+    words = normalize(name).split(" ")
+    return [" ".join(words[start:]) for start in range(len(words))]
+
+
+class AutocompleteSnapshot(NamedTuple):
+    """Sorted keys with organization IDs.
+
+    Attributes:
+        keys (List[str]): Normalized keys, sorted.
+        ids (array): Organization ID of every key.
+        names (dict[int, str]): Display name by organization ID.
+        max_id (int): Max organization ID loaded.
+    """
+
+    keys: List[str]
+    ids: "array[int]"
+    names: dict[int, str]
+    max_id: int
+
+
+def build_snapshot(
+    rows: Iterable[tuple[int, str]],
+    base: Optional[AutocompleteSnapshot] = None,
+) -> AutocompleteSnapshot:
+    """Build snapshot of names, merged into ``base`` when given.
+
+    :param rows: Organization IDs and names.
+    :param base: Snapshot to extend.
+    :return: AutocompleteSnapshot
+    """
+    names = dict(base.names) if base is not None else {}
+    entries: list[tuple[str, int]] = []
+    for organization_id, name in rows:
+        names[organization_id] = name
+        entries.extend((key, organization_id) for key in name_keys(name))
+    entries.sort()
+
+    merged: Iterable[tuple[str, int]] = entries
+    if base is not None:
+        merged = heapq.merge(zip(base.keys, base.ids), entries)
+
+    keys: List[str] = []
+    ids = array("q")
+    for key, organization_id in merged:
+        keys.append(key)
+        ids.append(organization_id)
+    return AutocompleteSnapshot(
+        keys=keys,
+        ids=ids,
+        names=names,
+        max_id=max(names, default=0),
+    )
+
+
+class AutocompleteIndex:
+    """Sorted array of normalized names searched with bisect.
+
+    Built from all organizations, then extended with organizations
+    added since the last refresh. Renames and deletions are picked up
+    by a full rebuild every ``full_refresh_every`` refreshes.
+    """
+
+    def __init__(self, full_refresh_every: int) -> None:
+        """Initialize empty index, not ready until the first load.
+
+        :param full_refresh_every: Refreshes between full rebuilds.
+        """
+        self.full_refresh_every = full_refresh_every
+        self._snapshot: Optional[AutocompleteSnapshot] = None
+        self._refreshes = 0
+
+    @property
+    def ready(self) -> bool:
+        """Return whether the index was built.
+
+        :return: bool
+        """
+        return self._snapshot is not None
+
+    @property
+    def full_refresh_due(self) -> bool:
+        """Return whether the next refresh must rebuild the index.
+
+        :return: bool
+        """
+        return (
+            self._snapshot is None
+            or self._refreshes >= self.full_refresh_every
+        )
+
+    @property
+    def max_id(self) -> int:
+        """Return max organization ID loaded.
+
+        :return: int
+        """
+        return 0 if self._snapshot is None else self._snapshot.max_id
+
+    async def load(self, rows: Sequence[tuple[int, str]]) -> None:
+        """Replace the index with all organization names.
+
+        :param rows: Organization IDs and names.
+        :return: None
+        """
+        self._snapshot = await asyncio.to_thread(build_snapshot, rows)
+        self._refreshes = 0
+        LOGGER.info("Autocomplete rebuilt: %s names", len(rows))
+
+    async def extend(self, rows: Sequence[tuple[int, str]]) -> None:
+        """Add names of organizations created since the last refresh.
+
+        :param rows: Organization IDs and names.
+        :return: None
+        """
+        self._refreshes += 1
+        if rows:
+            self._snapshot = await asyncio.to_thread(
+                build_snapshot, rows, self._snapshot
+            )
+            LOGGER.info("Autocomplete extended: %s names", len(rows))
+
+    def suggest(self, prefix: str, limit: int) -> List[tuple[int, str]]:
+        """Return organizations with a name word starting with prefix.
+
+        :param prefix: Typed prefix.
+        :param limit: Max suggestions.
+        :return: Organization IDs and names, by normalized name.
+        :raises RuntimeError: Index is not ready.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            raise RuntimeError("Autocomplete index is not built")
+        prefix = normalize(prefix)
+        found: dict[int, str] = {}
+        position = bisect_left(snapshot.keys, prefix)
+        while (
+            len(found) < limit
+            and position < len(snapshot.keys)
+            and snapshot.keys[position].startswith(prefix)
+        ):
+            organization_id = snapshot.ids[position]
+            found.setdefault(organization_id, snapshot.names[organization_id])
+            position += 1
+        return list(found.items())
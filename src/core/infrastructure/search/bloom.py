@@ -0,0 +1,181 @@
+"""Bloom filter of existing organization IDs and names."""
+
+import asyncio
+import hashlib
+import logging
+import math
+import time
+from typing import Dict, Iterable, NamedTuple, Optional, Sequence
+
+from src.core.configs.env import settings
+
+LOGGER = logging.getLogger(settings.webconf.LOG_OUT_COMMON)
+
+
+class BloomFilter:
+    """Set membership with false positives but no false negatives.
+
+    Sized for ``capacity`` keys at the given false positive rate, bit
+    positions come from double hashing of one BLAKE2b digest.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        """Initialize empty filter.
+
+        :param capacity: Expected number of keys.
+        :param error_rate: False positive rate at ``capacity`` keys.
+        """
+        capacity = max(capacity, 1)
+        self.size = max(
+            8, int(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def positions(self, key: bytes) -> Iterable[int]:
+        """Return bit positions of the key.
+
+        :param key: Key.
+        :return: ``hashes`` positions.
+        """
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, key: bytes) -> None:
+        """Add the key.
+
+        :param key: Key.
+        :return: None
+        """
+        for position in self.positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: bytes) -> bool:
+        """Check the key.
+
+        :param key: Key.
+        :return: False when the key was surely not added.
+        """
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self.positions(key)
+        )
+
+
+class KeySnapshot(NamedTuple):
+    """Filters of organization keys at a catalog version.
+
+    Attributes:
+        ids (BloomFilter): Organization IDs.
+        names (BloomFilter): Organization names, exact.
+        version (int): Catalog version the keys were read at.
+    """
+
+    ids: BloomFilter
+    names: BloomFilter
+    version: int
+
+
+def build_key_snapshot(
+    rows: Sequence[tuple[int, str]], version: int, error_rate: float
+) -> KeySnapshot:
+    """Build filters of organization IDs and names.
+
+    :param rows: Organization IDs and names.
+    :param version: Catalog version read before the rows.
+    :param error_rate: False positive rate.
+    :return: KeySnapshot
+    """
+    ids = BloomFilter(len(rows), error_rate)
+    names = BloomFilter(len(rows), error_rate)
+    for id_, name in rows:
+        ids.add(str(id_).encode())
+        names.add(name.encode())
+    return KeySnapshot(ids=ids, names=names, version=version)
+
+
+class OrganizationKeyFilter:
+    """Rejects IDs and names of organizations that surely don't exist.
+
+    Valid only at the catalog version it was built at: keys of newer
+    organizations are missing from it. Rebuilds read all names, so they
+    are at most one per ``rebuild_seconds`` however often the catalog
+    changes, the filter is not consulted meanwhile.
+    """
+
+    def __init__(self, error_rate: float, rebuild_seconds: float) -> None:
+        """Initialize filter, empty until loaded.
+
+        :param error_rate: False positive rate.
+        :param rebuild_seconds: Min seconds between rebuilds.
+        """
+        self.error_rate = error_rate
+        self.rebuild_seconds = rebuild_seconds
+        self._snapshot: Optional[KeySnapshot] = None
+        self._loaded_at = -math.inf
+        self.counts: Dict[str, int] = {"rejected": 0, "passed": 0}
+
+    @property
+    def version(self) -> Optional[int]:
+        """Return catalog version of the loaded keys.
+
+        :return: Version, ``None`` until loaded.
+        """
+        return None if self._snapshot is None else self._snapshot.version
+
+    def rebuild_due(self, version: int) -> bool:
+        """Return whether to rebuild the filter at the catalog version.
+
+        :param version: Current catalog version.
+        :return: True when behind the version and not rebuilt lately.
+        """
+        return (
+            self.version != version
+            and time.monotonic() - self._loaded_at >= self.rebuild_seconds
+        )
+
+    async def load(
+        self, rows: Sequence[tuple[int, str]], version: int
+    ) -> None:
+        """Replace the keys, built off the event loop.
+
+        :param rows: Organization IDs and names.
+        :param version: Catalog version read before the rows.
+        :return: None
+        """
+        self._snapshot = await asyncio.to_thread(
+            build_key_snapshot, rows, version, self.error_rate
+        )
+        self._loaded_at = time.monotonic()
+        LOGGER.info(
+            "Organization key filter loaded: %s keys, version %s",
+            len(rows),
+            version,
+        )
+
+    def may_exist(
+        self, id_: Optional[int] = None, name: Optional[str] = None
+    ) -> bool:
+        """Check the organization ID or name.
+
+        :param id_: Organization ID.
+        :param name: Organization name.
+        :return: False when no organization has it, True when one may.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            return True
+        exists = (id_ is None or str(id_).encode() in snapshot.ids) and (
+            name is None or name.encode() in snapshot.names
+        )
+        self.counts["passed" if exists else "rejected"] += 1
+        return exists
+
+    def snapshot(self) -> Dict[str, int]:
+        """Return copy of the counters.
+
+        :return: Counters.
+        """
+        return dict(self.counts)
@@ -0,0 +1,5 @@
+"""In-process spatial index of buildings."""
+
+from src.core.infrastructure.spatial.index import SpatialIndex
+
+__all__ = ["SpatialIndex"]
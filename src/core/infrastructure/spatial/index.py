@@ -0,0 +1,189 @@
+"""Snapshot of building coordinates queried without PostGIS."""
+
+import asyncio
+import logging
+import math
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+import numpy.typing as npt
+import shapely
+from shapely import STRtree
+
+from src.core.configs.env import settings
+
+LOGGER = logging.getLogger(settings.webconf.LOG_OUT_COMMON)
+
+# Mean Earth radius, meters.
+EARTH_RADIUS = 6_371_008.8
+
+
+class SpatialSnapshot(NamedTuple):
+    """Immutable building coordinates and their R-tree.
+
+    Attributes:
+        ids (NDArray[int64]): Building IDs.
+        lon (NDArray[float64]): Longitudes in radians.
+        lat (NDArray[float64]): Latitudes in radians.
+        tree (STRtree): R-tree of points in degrees, same order as IDs.
+    """
+
+    ids: npt.NDArray[np.int64]
+    lon: npt.NDArray[np.float64]
+    lat: npt.NDArray[np.float64]
+    tree: STRtree
+
+
+def build_snapshot(
+    ids: List[int], lon: List[float], lat: List[float]
+) -> SpatialSnapshot:
+    """Build snapshot from building coordinates in degrees.
+
+    :param ids: Building IDs.
+    :param lon: Longitudes.
+    :param lat: Latitudes.
+    :return: SpatialSnapshot
+    """
+    lon_deg = np.asarray(lon, dtype=np.float64)
+    lat_deg = np.asarray(lat, dtype=np.float64)
+    return SpatialSnapshot(
+        ids=np.asarray(ids, dtype=np.int64),
+        lon=np.radians(lon_deg),
+        lat=np.radians(lat_deg),
+        tree=STRtree(shapely.points(lon_deg, lat_deg)),
+    )
+
+
+def radius_boxes(
+    point: tuple[float, float], radius: float
+) -> List[shapely.Polygon]:
+    """Build boxes in degrees covering the radius around the point.
+
+    The box is split on the antimeridian and spans all longitudes
+    when the circle reaches a pole.
+
+    :param point: Point (longitude, latitude).
+    :param radius: Radius in meters.
+    :return: Boxes to query the R-tree with.
+    """
+    lon, lat = point
+    delta_lat = math.degrees(radius / EARTH_RADIUS)
+    min_lat, max_lat = max(lat - delta_lat, -90.0), min(lat + delta_lat, 90.0)
+    if min_lat == -90.0 or max_lat == 90.0:
+        return [shapely.box(-180.0, min_lat, 180.0, max_lat)]
+
+    delta_lon = delta_lat / math.cos(
+        math.radians(max(abs(min_lat), abs(max_lat)))
+    )
+    if delta_lon >= 180.0:
+        return [shapely.box(-180.0, min_lat, 180.0, max_lat)]
+
+    min_lon, max_lon = lon - delta_lon, lon + delta_lon
+    boxes = [
+        shapely.box(
+            max(min_lon, -180.0), min_lat, min(max_lon, 180.0), max_lat
+        )
+    ]
+    if min_lon < -180.0:
+        boxes.append(shapely.box(min_lon + 360.0, min_lat, 180.0, max_lat))
+    if max_lon > 180.0:
+        boxes.append(shapely.box(-180.0, min_lat, max_lon - 360.0, max_lat))
+    return boxes
+
+
+class SpatialIndex:
+    """Building coordinates held by the worker, refreshed periodically.
+
+    Answers building IDs for rectangle and radius filters, so only the
+    organization payloads are fetched from the database, by key.
+    Radius is measured by haversine on the mean Earth sphere, which
+    differs from the PostGIS spheroid by less than 0.5%.
+    Buildings changed after the last refresh are not seen until the
+    next one.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty index, not ready until the first refresh."""
+        self._snapshot: Optional[SpatialSnapshot] = None
+
+    @property
+    def ready(self) -> bool:
+        """Return whether the index was built.
+
+        :return: bool
+        """
+        return self._snapshot is not None
+
+    def __len__(self) -> int:
+        """Return number of indexed buildings.
+
+        :return: int
+        """
+        return 0 if self._snapshot is None else len(self._snapshot.ids)
+
+    async def load(
+        self, ids: List[int], lon: List[float], lat: List[float]
+    ) -> None:
+        """Swap the snapshot for the given building coordinates.
+
+        The R-tree is built in a thread, queries keep using the previous
+        snapshot meanwhile.
+
+        :param ids: Building IDs.
+        :param lon: Longitudes in degrees.
+        :param lat: Latitudes in degrees.
+        :return: None
+        """
+        self._snapshot = await asyncio.to_thread(build_snapshot, ids, lon, lat)
+        LOGGER.info("Spatial index refreshed: %s buildings", len(self))
+
+    def in_rectangle(
+        self, bounds: tuple[float, float, float, float]
+    ) -> List[int]:
+        """Return IDs of buildings covered by the rectangle.
+
+        :param bounds: Rectangle (min_lon, max_lon, min_lat, max_lat).
+        :return: Building IDs.
+        :raises RuntimeError: Index is not ready.
+        """
+        snapshot = self._require_snapshot()
+        min_lon, max_lon, min_lat, max_lat = bounds
+        found = snapshot.tree.query(
+            shapely.box(min_lon, min_lat, max_lon, max_lat)
+        )
+        return snapshot.ids[found].tolist()
+
+    def in_radius(
+        self, point: tuple[float, float], radius: float
+    ) -> List[int]:
+        """Return IDs of buildings within the radius of the point.
+
+        :param point: Point (longitude, latitude).
+        :param radius: Radius in meters.
+        :return: Building IDs.
+        :raises RuntimeError: Index is not ready.
+        """
+        snapshot = self._require_snapshot()
+        candidates = np.unique(
+            snapshot.tree.query(radius_boxes(point, radius))[1]
+        )
+        lon, lat = math.radians(point[0]), math.radians(point[1])
+        lat2 = snapshot.lat[candidates]
+        a = (
+            np.sin((lat2 - lat) / 2) ** 2
+            + math.cos(lat)
+            * np.cos(lat2)
+            * np.sin((snapshot.lon[candidates] - lon) / 2) ** 2
+        )
+        distance = 2 * EARTH_RADIUS * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+        return snapshot.ids[candidates[distance <= radius]].tolist()
+
+    def _require_snapshot(self) -> SpatialSnapshot:
+        """Return current snapshot.
+
+        :return: SpatialSnapshot
+        :raises RuntimeError: Index is not ready.
+        """
+        if self._snapshot is None:
+            raise RuntimeError("Spatial index is not built")
+        return self._snapshot
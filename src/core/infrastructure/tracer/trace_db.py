@@ -42,12 +42,12 @@ async def setup_jaeger_of_database(
     :raises: TraceDbError: Raise if any errors occur during tracing.
     """
     try:
+        # Instrument the engines sessions are bound to, not a new one.
         client: ClientDatabase = await db.init_engine()
-        engine = client.create_async_engine()
-        sync_engine = engine.sync_engine
-        LOGGER.info("Engine initialized: %s", str(engine))
+        engines = [engine.sync_engine for engine in client.engines]
+        LOGGER.info("Instrumenting engines: %s", engines)
         SQLAlchemyInstrumentor().instrument(
-            engine=sync_engine,
+            engines=engines,
             service=service_name,
             tracer_provider=tracer_provider,
             enable_commenter=enable_commenter,
@@ -0,0 +1,219 @@
+import json
+from typing import Any, Dict, List
+
+import pytest
+from fastapi import Depends, FastAPI
+from sqlalchemy.ext.asyncio import create_async_engine
+from starlette import status
+from starlette.types import Message
+
+from src.core.api.v1.routes.middlewars.admission import (
+    AdmissionControl,
+    AdmissionMiddleware,
+)
+from src.core.api.v1.routes.utils.dependencies.deadline import Deadline
+from src.core.api.v1.routes.utils.subrequests import SUBREQUEST
+from src.core.infrastructure.database.core.pool_pressure import (
+    PoolLoad,
+    PoolPressure,
+)
+
+
+class StubPool:
+    """Pool with set size and connections in use."""
+
+    def __init__(self, size: int, checked_out: int) -> None:
+        """Initialize pool."""
+        self.pool_size = size
+        self.busy = checked_out
+
+    def size(self) -> int:
+        """Return pool size."""
+        return self.pool_size
+
+    def checkedout(self) -> int:
+        """Return connections in use."""
+        return self.busy
+
+
+class StubEngine:
+    """Engine of a stub pool."""
+
+    def __init__(self, size: int, checked_out: int) -> None:
+        """Initialize engine."""
+        self.pool = StubPool(size, checked_out)
+
+
+def pressure_of(*pools: tuple[int, int, float]) -> PoolPressure:
+    """Create pressure of pools with size, connections in use, hold."""
+    pressure = PoolPressure()
+    for size, checked_out, hold in pools:
+        engine: Any = StubEngine(size, checked_out)
+        load = PoolLoad(engine, max_overflow=0)
+        load.hold_seconds = hold
+        pressure.pools[engine] = load
+    return pressure
+
+
+class StubPressure(PoolPressure):
+    """Pressure with a set estimated wait."""
+
+    def __init__(self, wait: float) -> None:
+        """Initialize with the wait."""
+        super().__init__()
+        self.wait = wait
+
+    def estimated_wait(self, in_flight: int) -> float:
+        """Return the set wait."""
+        return self.wait
+
+
+def test_pool_load_counted_by_pool() -> None:
+    """Test connections and capacity are read from the engine pool."""
+    engine = create_async_engine(
+        "postgresql+asyncpg://u:p@127.0.0.1:1/d", pool_size=4, max_overflow=2
+    )
+    load = PoolLoad(engine, max_overflow=2)
+
+    assert load.capacity == 6
+    assert load.checked_out == 0
+
+
+def test_no_wait_while_connections_free() -> None:
+    """Test requests don't wait while pools have free connections."""
+    pressure = pressure_of((10, 9, 0.1), (10, 0, 0.1))
+
+    assert pressure.estimated_wait(in_flight=100) == 0.0
+
+
+def test_wait_of_busiest_pool_not_summed() -> None:
+    """Test a full pool counts although another one is idle."""
+    pressure = pressure_of((10, 10, 0.1), (10, 0, 0.1))
+
+    assert pressure.estimated_wait(in_flight=20) == pytest.approx(0.01)
+    assert pressure.estimated_wait(in_flight=30) == pytest.approx(0.06)
+
+
+def test_wait_of_pools_reads_go_to() -> None:
+    """Test pools reads don't go to are left out."""
+    pressure = pressure_of((10, 10, 0.1), (10, 0, 0.1))
+    full, idle = list(pressure.pools)
+    pressure.route_reads(lambda: [idle])
+
+    assert pressure.estimated_wait(in_flight=30) == 0.0
+
+    pressure.route_reads(lambda: [full])
+    assert pressure.estimated_wait(in_flight=30) == pytest.approx(0.21)
+
+
+def app_with(limit: int, wait: float) -> tuple[FastAPI, AdmissionControl]:
+    """Create app with a route under a 1 second deadline."""
+    control = AdmissionControl(
+        limits={"/slow": limit}, default_limit=1, pressure=StubPressure(wait)
+    )
+    app = FastAPI()
+
+    async def slow() -> Dict[str, bool]:
+        return {"ok": True}
+
+    async def free() -> Dict[str, bool]:
+        return {"ok": True}
+
+    app.add_api_route("/slow", slow, dependencies=[Depends(Deadline(1.0))])
+    app.add_api_route("/free", free)
+    app.add_middleware(AdmissionMiddleware, control=control)  # noqa
+    return app, control
+
+
+async def get(
+    app: FastAPI, path: str, subrequest: bool = False
+) -> tuple[int, Dict[str, str], Any]:
+    """Send a GET request, return status, headers and JSON body."""
+    sent: List[Message] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    scope: Dict[str, Any] = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [],
+        "server": ("test", 80),
+        "client": ("test", 1),
+        "root_path": "",
+    }
+    if subrequest:
+        scope[SUBREQUEST] = True
+    await app(scope, receive, send)
+    headers = {
+        name.decode(): value.decode() for name, value in sent[0]["headers"]
+    }
+    body = b"".join(m.get("body", b"") for m in sent[1:])
+    return sent[0]["status"], headers, json.loads(body)
+
+
+async def test_request_admitted() -> None:
+    """Test a request within limits is served and counted."""
+    app, control = app_with(limit=1, wait=0.5)
+
+    code, _, body = await get(app, "/slow")
+
+    assert (code, body) == (status.HTTP_200_OK, {"ok": True})
+    gate = control.gates["/slow"]
+    assert gate.counts["admitted"] == 1
+    assert gate.in_flight == 0
+    assert control.in_flight == 0
+
+
+async def test_shed_at_route_limit() -> None:
+    """Test a route at its concurrency limit answers 503."""
+    app, control = app_with(limit=0, wait=0.0)
+
+    code, headers, body = await get(app, "/slow")
+
+    assert code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert headers["retry-after"] == "1"
+    assert body["detail"]["error_type"] == "Overloaded"
+    assert control.gates["/slow"].counts["shed_concurrency"] == 1
+
+
+async def test_shed_when_pool_wait_exceeds_deadline() -> None:
+    """Test a wait longer than the deadline answers 503."""
+    app, control = app_with(limit=1, wait=2.4)
+
+    code, headers, body = await get(app, "/slow")
+
+    assert code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert headers["retry-after"] == "3"
+    assert headers["content-length"] == str(len(json.dumps(body)))
+    assert control.gates["/slow"].counts["shed_pool"] == 1
+
+
+async def test_route_without_deadline_not_gated() -> None:
+    """Test routes without a deadline are always served."""
+    app, control = app_with(limit=0, wait=10.0)
+
+    code, _, _ = await get(app, "/free")
+
+    assert code == status.HTTP_200_OK
+    assert control.gates == {}
+
+
+async def test_subrequest_not_gated_again() -> None:
+    """Test sub-requests of an admitted batch are not charged."""
+    app, control = app_with(limit=0, wait=10.0)
+
+    code, _, _ = await get(app, "/slow", subrequest=True)
+
+    assert code == status.HTTP_200_OK
+    assert control.gates == {}
+    assert control.in_flight == 0
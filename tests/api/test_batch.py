@@ -0,0 +1,197 @@
+import asyncio
+import json
+from typing import Any, Dict, List, Optional
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request
+from starlette import status
+from starlette.types import Message
+
+from src.core.api.v1.routes.batch.route import router as batch_router
+from src.core.api.v1.routes.middlewars.admission import (
+    AdmissionControl,
+    AdmissionMiddleware,
+)
+from src.core.api.v1.routes.utils import subrequests
+from src.core.api.v1.routes.utils.dependencies.api_key import (
+    API_KEY,
+    get_api_key,
+)
+from src.core.api.v1.routes.utils.dependencies.deadline import Deadline
+from src.core.api.v1.routes.utils.subrequests import SUBREQUEST
+from src.core.configs.env import settings
+from src.core.infrastructure.database.core.pool_pressure import PoolPressure
+
+
+@pytest.fixture
+def seen() -> List[Dict[str, Any]]:
+    """Create record of the sub-requests served."""
+    return []
+
+
+@pytest.fixture
+def app(seen: List[Dict[str, Any]]) -> FastAPI:
+    """Create app with the batch route and organization routes.
+
+    Organization routes are admitted one at a time, so sub-requests
+    pass only because admission skips them.
+    """
+    org = APIRouter(
+        prefix="/org",
+        dependencies=[Depends(get_api_key), Depends(Deadline(1.0))],
+    )
+
+    @org.get("/item/{id_}")
+    async def item(id_: int, request: Request) -> Dict[str, int]:
+        seen.append(
+            {
+                "api_key": request.headers.get("x-api-key"),
+                "subrequest": request.scope.get(SUBREQUEST),
+            }
+        )
+        if id_ == 0:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+        return {"id": id_}
+
+    @org.get("/slow")
+    async def slow() -> Dict[str, bool]:
+        await asyncio.Event().wait()
+        return {"ok": True}
+
+    application = FastAPI()
+    application.include_router(batch_router, prefix="/v1")
+    application.include_router(org, prefix="/v1")
+    control = AdmissionControl(
+        limits={"/v1/org/item/{id_}": 0},
+        default_limit=10,
+        pressure=PoolPressure(),
+    )
+    application.add_middleware(AdmissionMiddleware, control=control)  # noqa
+    return application
+
+
+async def post_batch(
+    app: FastAPI, requests: List[Dict[str, Any]], key: Optional[str]
+) -> tuple[int, Any]:
+    """Send a batch request, return status and JSON body."""
+    body = json.dumps({"requests": requests}).encode()
+    headers = [(b"content-type", b"application/json")]
+    if key is not None:
+        headers.append((b"x-api-key", key.encode()))
+    sent: List[Message] = []
+    received = False
+
+    async def receive() -> Message:
+        nonlocal received
+        if received:
+            await asyncio.Event().wait()
+        received = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    await app(
+        {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "POST",
+            "scheme": "http",
+            "path": "/v1/batch",
+            "raw_path": b"/v1/batch",
+            "query_string": b"",
+            "headers": headers,
+            "server": ("test", 80),
+            "client": ("test", 1),
+            "root_path": "",
+        },
+        receive,
+        send,
+    )
+    payload = b"".join(m.get("body", b"") for m in sent[1:])
+    return sent[0]["status"], json.loads(payload)
+
+
+async def test_responses_in_request_order(
+    app: FastAPI, seen: List[Dict[str, Any]]
+) -> None:
+    """Test each sub-response is in place, whatever its status."""
+    code, body = await post_batch(
+        app,
+        [
+            {"path": "/org/item/2"},
+            {"path": "/org/item/0"},
+            {"path": "/org/item/1"},
+            {"path": "/org/missing"},
+        ],
+        key=API_KEY,
+    )
+
+    assert code == status.HTTP_200_OK
+    assert [item["status"] for item in body["responses"]] == [
+        status.HTTP_200_OK,
+        status.HTTP_404_NOT_FOUND,
+        status.HTTP_200_OK,
+        status.HTTP_404_NOT_FOUND,
+    ]
+    assert body["responses"][0]["body"] == {"id": 2}
+    assert body["responses"][2]["body"] == {"id": 1}
+    assert seen == [{"api_key": API_KEY, "subrequest": True}] * 3
+
+
+async def test_unforwarded_key_rejected_per_item(
+    monkeypatch: pytest.MonkeyPatch, app: FastAPI
+) -> None:
+    """Test sub-requests without the API key are refused one by one."""
+    monkeypatch.setattr(subrequests, "FORWARDED_HEADERS", ())
+
+    code, body = await post_batch(
+        app, [{"path": "/org/item/1"}, {"path": "/org/item/2"}], key=API_KEY
+    )
+
+    assert code == status.HTTP_200_OK
+    assert [item["status"] for item in body["responses"]] == [
+        status.HTTP_403_FORBIDDEN
+    ] * 2
+    detail = body["responses"][0]["body"]["detail"]
+    assert detail["error_type"] == "AuthenticationError"
+
+
+async def test_batch_without_key_rejected(app: FastAPI) -> None:
+    """Test a batch without the API key runs no sub-requests."""
+    code, _ = await post_batch(app, [{"path": "/org/item/1"}], key=None)
+
+    assert code == status.HTTP_403_FORBIDDEN
+
+
+async def test_path_outside_org_rejected(
+    app: FastAPI, seen: List[Dict[str, Any]]
+) -> None:
+    """Test only organization routes can be batched."""
+    code, _ = await post_batch(
+        app, [{"path": "/org/item/1"}, {"path": "/batch"}], key=API_KEY
+    )
+
+    assert code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert seen == []
+
+
+async def test_slow_sub_request_answered_504(
+    monkeypatch: pytest.MonkeyPatch, app: FastAPI
+) -> None:
+    """Test a sub-request past the deadline gets 504, not its batch."""
+    monkeypatch.setattr(settings.webconf, "BATCH_TIMEOUT_SECONDS", 0.05)
+
+    code, body = await post_batch(
+        app,
+        [{"path": "/org/item/1"}, {"path": "/org/slow"}],
+        key=API_KEY,
+    )
+
+    assert code == status.HTTP_200_OK
+    assert [item["status"] for item in body["responses"]] == [
+        status.HTTP_200_OK,
+        status.HTTP_504_GATEWAY_TIMEOUT,
+    ]
+    assert body["responses"][1]["body"]["detail"]["error_type"] == "Timeout"
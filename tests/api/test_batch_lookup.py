@@ -0,0 +1,40 @@
+from typing import Any
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.exc import OperationalError
+from starlette import status
+
+from src.core.api.v1.presentation.requests.organization import (
+    OrganizationBatchRequest,
+)
+from src.core.api.v1.routes.organization.endpoints.by_batch import (
+    orgs_batch,
+)
+from src.core.infrastructure.database import db
+
+
+class FailingSession:
+    """Session whose queries fail like a lost database connection."""
+
+    async def execute(self, *args: Any, **kwargs: Any) -> Any:
+        """Fail the query."""
+        raise OperationalError("SELECT", {}, ConnectionError("lost"))
+
+
+async def test_batch_lookup_error_propagates() -> None:
+    """Test a failed lookup is raised, not reported as misses."""
+    with pytest.raises(OperationalError):
+        await db.org.get_documents_by_keys(
+            ids=[1], names=["a"], session=FailingSession()
+        )
+
+
+async def test_batch_lookup_error_answered_503() -> None:
+    """Test the endpoint answers 503 instead of listing misses."""
+    req = OrganizationBatchRequest(ids=[1, 2], names=["a"])
+
+    with pytest.raises(HTTPException) as error:
+        await orgs_batch(req=req, session=FailingSession())
+
+    assert error.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
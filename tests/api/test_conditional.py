@@ -0,0 +1,131 @@
+from typing import Dict, List, Optional
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+from starlette import status
+from starlette.requests import Request
+from starlette.types import Message
+
+from src.core.api.v1.routes.utils.dependencies.conditional import (
+    ConditionalRoute,
+    NotModified,
+    request_etag,
+)
+from src.core.api.v1.routes.utils.resp_ndjson import NDJSON_MEDIA_TYPE
+from src.core.infrastructure.database import db
+
+
+def request(accept: Optional[str] = None, query: bytes = b"") -> Request:
+    """Create GET request of the collection."""
+    headers = [] if accept is None else [(b"accept", accept.encode())]
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/v1/org/tree",
+            "query_string": query,
+            "headers": headers,
+        }
+    )
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    """Create app with a conditional collection route."""
+    router = APIRouter(route_class=ConditionalRoute)
+
+    @router.get(
+        "/v1/org/tree",
+        dependencies=[Depends(NotModified("private, no-cache"))],
+    )
+    async def tree() -> List[int]:
+        return [1]
+
+    application = FastAPI()
+    application.include_router(router)
+    return application
+
+
+async def get(
+    app: FastAPI, headers: Dict[str, str]
+) -> tuple[int, Dict[str, str]]:
+    """Send a GET of the collection, return status and headers."""
+    sent: List[Message] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    await app(
+        {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/v1/org/tree",
+            "raw_path": b"/v1/org/tree",
+            "query_string": b"",
+            "headers": [
+                (k.lower().encode(), v.encode()) for k, v in headers.items()
+            ],
+            "server": ("test", 80),
+            "client": ("test", 1),
+            "root_path": "",
+        },
+        receive,
+        send,
+    )
+    return sent[0]["status"], {
+        k.decode(): v.decode() for k, v in sent[0]["headers"]
+    }
+
+
+def test_etag_ignores_query_order() -> None:
+    """Test reordered query parameters share the ETag."""
+    assert request_etag(1, request(query=b"a=1&b=2")) == request_etag(
+        1, request(query=b"b=2&a=1")
+    )
+
+
+def test_etag_follows_negotiated_media_type() -> None:
+    """Test JSON and NDJSON bodies of a request differ in ETag."""
+    json_etag = request_etag(1, request())
+
+    assert request_etag(1, request("application/json")) == json_etag
+    assert request_etag(1, request(NDJSON_MEDIA_TYPE)) != json_etag
+
+
+async def test_304_only_for_same_media_type(
+    monkeypatch: pytest.MonkeyPatch, app: FastAPI
+) -> None:
+    """Test a JSON ETag does not confirm an NDJSON body."""
+    monkeypatch.setattr(db, "catalog_version", 3)
+    code, headers = await get(app, {})
+    assert code == status.HTTP_200_OK
+    assert headers["vary"] == "Accept"
+
+    code, _ = await get(
+        app, {"If-None-Match": headers["etag"], "Accept": NDJSON_MEDIA_TYPE}
+    )
+    assert code == status.HTTP_200_OK
+
+    code, not_modified = await get(app, {"If-None-Match": headers["etag"]})
+    assert code == status.HTTP_304_NOT_MODIFIED
+    assert not_modified["vary"] == "Accept"
+    assert not_modified["etag"] == headers["etag"]
+
+
+async def test_vary_without_catalog_version(
+    monkeypatch: pytest.MonkeyPatch, app: FastAPI
+) -> None:
+    """Test ``Vary`` is sent when no ETag is known."""
+    monkeypatch.setattr(db, "catalog_version", None)
+
+    code, headers = await get(app, {})
+
+    assert code == status.HTTP_200_OK
+    assert "etag" not in headers
+    assert headers["vary"] == "Accept"
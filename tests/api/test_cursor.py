@@ -0,0 +1,44 @@
+import base64
+
+import pytest
+
+from src.core.api.v1.routes.utils.cursor import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+@pytest.mark.parametrize("last_id", [0, 1, 42, 2**31 - 1, 2**63])
+def test_cursor_round_trip(last_id: int) -> None:
+    """Test decoding returns the encoded organization ID."""
+    cursor = encode_cursor(last_id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == last_id
+
+
+def b64(raw: bytes) -> str:
+    """Encode raw bytes the way cursors are encoded."""
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "not a cursor",
+        "%%%",
+        b64(b"not json"),
+        b64(b"[1]"),
+        b64(b'{"after": 1}'),
+        b64(b'{"id": "1"}'),
+        b64(b'{"id": 1.5}'),
+        b64(b'{"id": true}'),
+        b64(b'{"id": -1}'),
+    ],
+)
+def test_malformed_cursor_rejected(cursor: str) -> None:
+    """Test cursors not issued by the API are rejected."""
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
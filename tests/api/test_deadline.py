@@ -0,0 +1,178 @@
+import asyncio
+import json
+from typing import Any, Dict, List, Optional
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+from starlette import status
+from starlette.types import Message
+
+from src.core.api.v1.routes.utils.dependencies.deadline import (
+    Deadline,
+    DeadlineRoute,
+)
+from src.core.infrastructure.database.core.deadline import (
+    OUTLIVES_REQUEST,
+    REQUEST_DEADLINE,
+    apply_statement_timeout,
+)
+
+
+class StubSession:
+    """Session with set info."""
+
+    def __init__(self, info: Optional[Dict[str, Any]] = None) -> None:
+        """Initialize session."""
+        self.info = info or {}
+
+
+class StubConnection:
+    """Connection recording the statement timeouts set."""
+
+    def __init__(self) -> None:
+        """Initialize connection with no statements."""
+        self.timeouts: List[str] = []
+
+    def execute(self, statement: Any, params: Dict[str, str]) -> None:
+        """Record the statement timeout."""
+        self.timeouts.append(params["timeout"])
+
+
+def begin(session: StubSession, connection: StubConnection) -> None:
+    """Begin a transaction of the request, as the session does."""
+    apply_statement_timeout(session, None, connection)
+
+
+async def query(connection: StubConnection) -> Dict[str, bool]:
+    """Begin a transaction, then run a query past the deadline."""
+    begin(StubSession(), connection)
+    await asyncio.sleep(1)
+    return {"ok": True}
+
+
+async def wait_for_pool() -> Dict[str, bool]:
+    """Wait for a connection past the deadline."""
+    await asyncio.sleep(1)
+    return {"ok": True}
+
+
+async def fast() -> Dict[str, bool]:
+    """Answer before the deadline."""
+    return {"ok": True}
+
+
+@pytest.fixture
+def connection() -> StubConnection:
+    """Create connection of the requests."""
+    return StubConnection()
+
+
+@pytest.fixture
+def app(connection: StubConnection) -> FastAPI:
+    """Create app with routes under a short deadline."""
+    router = APIRouter(
+        route_class=DeadlineRoute, dependencies=[Depends(Deadline(0.05))]
+    )
+
+    async def run_query() -> Dict[str, bool]:
+        return await query(connection)
+
+    router.add_api_route("/query", run_query)
+    router.add_api_route("/pool", wait_for_pool)
+    router.add_api_route("/fast", fast)
+    application = FastAPI()
+    application.include_router(router)
+    return application
+
+
+async def get(app: FastAPI, path: str) -> tuple[int, Dict[str, Any]]:
+    """Send a GET request to the app, return status and JSON body."""
+    sent: List[Message] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    await app(
+        {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": b"",
+            "headers": [],
+            "server": ("test", 80),
+            "client": ("test", 1),
+            "root_path": "",
+        },
+        receive,
+        send,
+    )
+    body = b"".join(m.get("body", b"") for m in sent[1:])
+    return sent[0]["status"], json.loads(body)
+
+
+async def test_deadline_during_query_answered_504(
+    app: FastAPI, connection: StubConnection
+) -> None:
+    """Test a request that began a transaction times out with 504."""
+    code, body = await get(app, "/query")
+
+    assert code == status.HTTP_504_GATEWAY_TIMEOUT
+    assert body["detail"]["error_type"] == "Timeout"
+    assert len(connection.timeouts) == 1
+    assert 0 < int(connection.timeouts[0]) <= 50
+
+
+async def test_deadline_without_connection_answered_503(
+    app: FastAPI,
+) -> None:
+    """Test a request that got no connection in time gets 503."""
+    code, body = await get(app, "/pool")
+
+    assert code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert body["detail"]["error_type"] == "Unavailable"
+
+
+async def test_request_within_deadline_answered(app: FastAPI) -> None:
+    """Test a request done in time is answered as usual."""
+    assert await get(app, "/fast") == (status.HTTP_200_OK, {"ok": True})
+
+
+def test_no_statement_timeout_outside_request() -> None:
+    """Test transactions outside a request are not limited."""
+    connection = StubConnection()
+
+    begin(StubSession(), connection)
+
+    assert REQUEST_DEADLINE.get() is None
+    assert connection.timeouts == []
+
+
+async def test_stream_session_begins_without_statement_timeout(
+    app: FastAPI,
+) -> None:
+    """Test a session outliving the request is counted, not limited."""
+    connection = StubConnection()
+    seen: List[bool] = []
+
+    async def stream() -> Dict[str, bool]:
+        begin(StubSession({OUTLIVES_REQUEST: True}), connection)
+        deadline = REQUEST_DEADLINE.get()
+        seen.append(deadline is not None and deadline.connected)
+        return {"ok": True}
+
+    router = APIRouter(
+        route_class=DeadlineRoute, dependencies=[Depends(Deadline(0.05))]
+    )
+    router.add_api_route("/stream", stream)
+    app.include_router(router)
+
+    assert await get(app, "/stream") == (status.HTTP_200_OK, {"ok": True})
+    assert seen == [True]
+    assert connection.timeouts == []
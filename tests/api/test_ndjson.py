@@ -0,0 +1,167 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List
+
+import pytest
+from fastapi import HTTPException
+from starlette import status
+from starlette.types import Message
+
+from src.core.api.v1.presentation.requests.stream import StreamRequest
+from src.core.api.v1.routes.utils import resp_ndjson as ndjson
+from src.core.api.v1.routes.utils.resp_ndjson import (
+    NDJSON_MEDIA_TYPE,
+    ndjson_chunks,
+    resp_ndjson,
+)
+from src.core.infrastructure.database import db
+
+
+class Sessions:
+    """Catalog sessions opened and closed by the stream."""
+
+    def __init__(self) -> None:
+        """Initialize with no sessions."""
+        self.infos: List[Dict[str, Any]] = []
+        self.closed = 0
+
+    @asynccontextmanager
+    async def catalog_session(self, info: Any = None) -> AsyncIterator[Any]:
+        """Open a stand-in session, counting it closed on exit."""
+        self.infos.append(dict(info or {}))
+        try:
+            yield object()
+        finally:
+            self.closed += 1
+
+
+@pytest.fixture
+def sessions(monkeypatch: pytest.MonkeyPatch) -> Sessions:
+    """Replace the catalog sessions of the database."""
+    opened = Sessions()
+    monkeypatch.setattr(db, "catalog_session", opened.catalog_session)
+    return opened
+
+
+def documents(*items: str) -> ndjson.DocumentStream:
+    """Return stream of the documents."""
+
+    async def stream(session: Any) -> AsyncIterator[str]:
+        for item in items:
+            yield item
+
+    return stream
+
+
+async def exists(session: Any) -> bool:
+    """Find the collection."""
+    return True
+
+
+async def missing(session: Any) -> bool:
+    """Find no collection."""
+    return False
+
+
+async def body_of(response: ndjson.NDJSONResponse) -> bytes:
+    """Send the response, return its body."""
+    sent: List[Message] = []
+
+    async def receive() -> Message:
+        await asyncio.Event().wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    await response({"type": "http"}, receive, send)
+    return b"".join(m.get("body", b"") for m in sent[1:])
+
+
+@pytest.mark.parametrize(
+    "accept, streamed",
+    [
+        (None, False),
+        ("application/json", False),
+        (NDJSON_MEDIA_TYPE, True),
+        (f"application/json, {NDJSON_MEDIA_TYPE};q=0.9", True),
+    ],
+)
+def test_stream_chosen_by_accept(accept: str, streamed: bool) -> None:
+    """Test NDJSON is streamed only when accepted."""
+    assert bool(StreamRequest(accept)) is streamed
+
+
+async def test_documents_joined_into_chunks(
+    monkeypatch: pytest.MonkeyPatch, sessions: Sessions
+) -> None:
+    """Test one document per line, chunked by size."""
+    monkeypatch.setattr(ndjson, "NDJSON_CHUNK_SIZE", 6)
+
+    chunks = [c async for c in ndjson_chunks(documents("{1}", "{2}", "{3}"))]
+
+    assert chunks == ["{1}\n{2}\n", "{3}\n"]
+    assert sessions.closed == 1
+
+
+async def test_stream_answered_ndjson(sessions: Sessions) -> None:
+    """Test the documents are streamed as NDJSON."""
+    response = await resp_ndjson(documents("{1}", "{2}"), exists=missing)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.media_type == NDJSON_MEDIA_TYPE
+    assert await body_of(response) == b"{1}\n{2}\n"
+    assert sessions.closed == 1
+
+
+async def test_empty_stream_of_existing_collection_empty(
+    sessions: Sessions,
+) -> None:
+    """Test an existing collection without documents is an empty 200."""
+    response = await resp_ndjson(documents(), exists=exists)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert await body_of(response) == b""
+
+
+async def test_empty_stream_of_missing_collection_not_found(
+    sessions: Sessions,
+) -> None:
+    """Test a missing collection gets 404."""
+    with pytest.raises(HTTPException) as error:
+        await resp_ndjson(documents(), exists=missing)
+
+    assert error.value.status_code == status.HTTP_404_NOT_FOUND
+    assert sessions.closed == len(sessions.infos) == 2
+
+
+async def test_stream_closed_when_client_disconnects(
+    monkeypatch: pytest.MonkeyPatch, sessions: Sessions
+) -> None:
+    """Test the stream session is closed once the client is gone."""
+    monkeypatch.setattr(ndjson, "NDJSON_CHUNK_SIZE", 1)
+    finished = []
+
+    async def endless(session: Any) -> AsyncIterator[str]:
+        try:
+            while True:
+                await asyncio.sleep(0)
+                yield "{}"
+        finally:
+            finished.append(True)
+
+    response = await resp_ndjson(endless)
+    gone = asyncio.Event()
+
+    async def receive() -> Message:
+        await gone.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        if message["type"] == "http.response.body":
+            gone.set()
+
+    await response({"type": "http"}, receive, send)
+
+    assert finished == [True]
+    assert sessions.closed == 1
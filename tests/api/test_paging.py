@@ -0,0 +1,156 @@
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import pytest
+from fastapi import HTTPException
+from starlette import status
+
+from src.core.api.v1.presentation.requests.biulding import BuildingIDRequest
+from src.core.api.v1.presentation.requests.location import (
+    LocationRadiusRequest,
+    LocationRectangleRequest,
+)
+from src.core.api.v1.presentation.requests.page import PageRequest
+from src.core.api.v1.presentation.requests.stream import StreamRequest
+from src.core.api.v1.routes.organization.endpoints.by_building_id import (
+    org_by_building,
+)
+from src.core.api.v1.routes.organization.endpoints.by_location import (
+    get_orgs_by_location,
+)
+from src.core.api.v1.routes.utils.cursor import encode_cursor
+from src.core.infrastructure.database import db
+from src.core.infrastructure.database.cruds.documents import fetch_page
+
+EMPTY_PAGE = b'{"organizations":[],"next_cursor":null}'
+
+
+class StubResult:
+    """Result of a stub query."""
+
+    def __init__(self, rows: List[tuple[Any, ...]]) -> None:
+        """Initialize result with the rows."""
+        self.rows = rows
+
+    def all(self) -> List[tuple[Any, ...]]:
+        """Return the rows."""
+        return self.rows
+
+    def scalar_one_or_none(self) -> Any:
+        """Return the first column of the only row, if any."""
+        return self.rows[0][0] if self.rows else None
+
+
+class StubSession:
+    """Session serving documents by ID and set building IDs."""
+
+    def __init__(
+        self, documents: Dict[int, str], buildings: List[int]
+    ) -> None:
+        """Initialize session with the rows it serves."""
+        self.documents = documents
+        self.buildings = buildings
+
+    async def execute(
+        self, stmt: Any, params: Optional[Dict[str, Any]] = None
+    ) -> StubResult:
+        """Return a page of documents or the building ID asked for."""
+        params = params or {}
+        if "page_size" not in params:
+            return StubResult(
+                [(params["id"],)] if params["id"] in self.buildings else []
+            )
+        rows = [
+            (document, id_)
+            for id_, document in sorted(self.documents.items())
+            if id_ > params["after_id"]
+        ]
+        return StubResult(rows[: params["page_size"]])
+
+
+@pytest.fixture
+def uncached(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Load every response from the database."""
+    for name in ("cache", "negative", "flight", "catalog_version"):
+        monkeypatch.setattr(db, name, None)
+
+
+def use_session(monkeypatch: pytest.MonkeyPatch, session: Any) -> None:
+    """Open the stub session as the catalog session."""
+
+    @asynccontextmanager
+    async def catalog_session(info: Any = None) -> AsyncIterator[Any]:
+        yield session
+
+    monkeypatch.setattr(db, "catalog_session", catalog_session)
+
+
+async def test_cursor_of_page_followed_to_the_end() -> None:
+    """Test each page points to the next until the last one."""
+    session: Any = StubSession({1: "{}", 2: "{}", 3: "{}"}, buildings=[])
+    stmt = db.org.documents_by_building_stmt
+
+    first = await fetch_page(
+        session, stmt, 2, {"id": 1, "after_id": 0, "page_size": 3}
+    )
+    last = await fetch_page(
+        session, stmt, 2, {"id": 1, "after_id": 2, "page_size": 3}
+    )
+
+    assert (len(first.documents), first.last_id) == (2, 2)
+    assert (len(last.documents), last.last_id) == (1, None)
+
+
+async def test_location_page_past_deleted_rows_empty() -> None:
+    """Test a cursor past the remaining rows gets an empty page."""
+    response = await get_orgs_by_location(
+        radius=LocationRadiusRequest(lon=37.6, lat=55.7, radius=1000.0),
+        rectangle=LocationRectangleRequest(),
+        page=PageRequest(limit=2, cursor=encode_cursor(50)),
+        stream=StreamRequest(),
+        session=StubSession({1: "{}"}, buildings=[]),
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.body == EMPTY_PAGE
+
+
+async def test_location_without_coordinates_not_found() -> None:
+    """Test a request without a radius or rectangle gets 404."""
+    with pytest.raises(HTTPException) as error:
+        await get_orgs_by_location(
+            radius=LocationRadiusRequest(),
+            rectangle=LocationRectangleRequest(),
+            page=PageRequest(limit=2),
+            stream=StreamRequest(),
+            session=StubSession({}, buildings=[]),
+        )
+
+    assert error.value.status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_building_page_past_deleted_rows_empty(
+    monkeypatch: pytest.MonkeyPatch, uncached: None
+) -> None:
+    """Test an existing building past its rows gets an empty page."""
+    use_session(monkeypatch, StubSession({1: "{}"}, buildings=[7]))
+
+    response = await org_by_building(
+        req=BuildingIDRequest(7),
+        page=PageRequest(limit=2, cursor=encode_cursor(50)),
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.body == EMPTY_PAGE
+
+
+async def test_missing_building_not_found(
+    monkeypatch: pytest.MonkeyPatch, uncached: None
+) -> None:
+    """Test a building that doesn't exist gets 404."""
+    use_session(monkeypatch, StubSession({}, buildings=[7]))
+
+    with pytest.raises(HTTPException) as error:
+        await org_by_building(req=BuildingIDRequest(8), page=PageRequest())
+
+    assert error.value.status_code == status.HTTP_404_NOT_FOUND
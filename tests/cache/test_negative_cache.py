@@ -0,0 +1,76 @@
+from typing import List, Optional
+
+import pytest
+
+from src.core.infrastructure.cache import NegativeCache
+from src.core.infrastructure.database import db
+
+
+@pytest.fixture
+def negative(monkeypatch: pytest.MonkeyPatch) -> NegativeCache:
+    """Install a negative cache on ``db`` with other caches disabled."""
+    installed = NegativeCache(ttl=5.0, max_entries=10)
+    monkeypatch.setattr(db, "negative", installed)
+    monkeypatch.setattr(db, "catalog_version", 1)
+    for name in ("cache", "flight", "revalidator"):
+        monkeypatch.setattr(db, name, None)
+    return installed
+
+
+async def test_missing_name_remembered(negative: NegativeCache) -> None:
+    """Test a not found name lookup is answered from memory."""
+    loads: List[int] = []
+
+    async def load() -> Optional[bytes]:
+        loads.append(1)
+        return None
+
+    for _ in range(3):
+        body = await db.cached(
+            "org_by_name", {"name": "Нет"}, load, remember_missing=True
+        )
+        assert body is None
+
+    assert len(loads) == 1
+    assert negative.snapshot()["added"] == 1
+
+
+async def test_other_misses_not_remembered(negative: NegativeCache) -> None:
+    """Test lookups not asking for it keep querying the database."""
+    loads: List[int] = []
+
+    async def load() -> Optional[bytes]:
+        loads.append(1)
+        return None
+
+    for _ in range(3):
+        assert await db.cached("org_by_building", {"id": 1}, load) is None
+
+    assert len(loads) == 3
+    assert negative.snapshot() == {
+        "entries": 0,
+        "hit": 0,
+        "miss": 0,
+        "added": 0,
+    }
+
+
+async def test_miss_forgotten_on_version_change(
+    negative: NegativeCache,
+) -> None:
+    """Test a name missing at one catalog version is looked up again."""
+    loads: List[int] = []
+
+    async def load() -> Optional[bytes]:
+        loads.append(1)
+        return None if len(loads) == 1 else b"{}"
+
+    await db.cached(
+        "org_by_name", {"name": "Новая"}, load, remember_missing=True
+    )
+    db.catalog_version = 2
+
+    assert await db.cached(
+        "org_by_name", {"name": "Новая"}, load, remember_missing=True
+    )
+    assert len(loads) == 2
@@ -0,0 +1,154 @@
+import json
+
+import pytest
+
+from src.core.configs.env import DataBaseClientEnvConf
+from src.core.infrastructure.cache import response
+from src.core.infrastructure.cache.response import ResponseCache, cache_key
+
+
+class Clock:
+    """Stand-in of the ``time`` module moved by hand."""
+
+    def __init__(self) -> None:
+        """Start the clock."""
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        """Return the current time."""
+        return self.now
+
+    def time(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    """Replace the clock of the response cache."""
+    fake = Clock()
+    monkeypatch.setattr(response, "time", fake)
+    return fake
+
+
+def params(id_: int) -> dict[str, int]:
+    """Return arguments of a cached method."""
+    return {"id": id_}
+
+
+def test_cache_key_ignores_order_and_none() -> None:
+    """Test the same request gets the same key."""
+    assert cache_key("m", {"a": 1, "b": 2}) == cache_key("m", {"b": 2, "a": 1})
+    assert cache_key("m", {"a": 1, "b": None}) == cache_key("m", {"a": 1})
+    assert cache_key("m", {"a": 1}) != cache_key("n", {"a": 1})
+
+
+def test_entry_expires_after_ttl(clock: Clock) -> None:
+    """Test an entry is served until its TTL, then dropped."""
+    cache = ResponseCache({"m": 10.0}, max_entries=10, max_bytes=10_000)
+    cache.set("m", params(1), b"body")
+
+    clock.now += 9.9
+    assert cache.get("m", params(1)) == b"body"
+
+    clock.now += 0.1
+    assert cache.get("m", params(1)) is None
+    assert len(cache) == 0
+    assert cache.size == 0
+    assert cache.snapshot()["methods"]["m"] == {
+        "hit": 1,
+        "stale": 0,
+        "miss": 1,
+        "expired": 1,
+        "eviction": 0,
+    }
+
+
+def test_lru_evicts_least_recently_used_entry(clock: Clock) -> None:
+    """Test the entry not read for longest is evicted first."""
+    cache = ResponseCache({"m": 60.0}, max_entries=2, max_bytes=10_000)
+    cache.set("m", params(1), b"one")
+    cache.set("m", params(2), b"two")
+
+    assert cache.get("m", params(1)) == b"one"
+    cache.set("m", params(3), b"three")
+
+    assert cache.get("m", params(2)) is None
+    assert cache.get("m", params(1)) == b"one"
+    assert cache.get("m", params(3)) == b"three"
+    assert cache.counts["m"]["eviction"] == 1
+
+
+def test_lru_evicts_by_total_size(clock: Clock) -> None:
+    """Test entries are evicted to fit ``max_bytes``."""
+    key_size = len(cache_key("m", params(1)).encode())
+    cache = ResponseCache(
+        {"m": 60.0}, max_entries=100, max_bytes=2 * (key_size + 100)
+    )
+    for id_ in range(1, 4):
+        cache.set("m", params(id_), b"x" * 100)
+
+    assert len(cache) == 2
+    assert cache.size == 2 * (key_size + 100)
+    assert cache.get("m", params(1)) is None
+
+    cache.set("m", params(4), b"x" * 1000)
+    assert cache.get("m", params(4)) is None, "larger than the cache"
+    assert len(cache) == 2
+
+
+def test_replacing_entry_keeps_size(clock: Clock) -> None:
+    """Test setting a cached key again replaces its entry."""
+    cache = ResponseCache({"m": 60.0}, max_entries=10, max_bytes=10_000)
+    cache.set("m", params(1), b"old")
+    cache.set("m", params(1), b"new!")
+
+    assert len(cache) == 1
+    assert cache.size == len(cache_key("m", params(1)).encode()) + 4
+    assert cache.get("m", params(1)) == b"new!"
+
+
+def test_ttls_by_method_from_settings(
+    monkeypatch: pytest.MonkeyPatch, clock: Clock
+) -> None:
+    """Test per-method TTLs given as JSON in the environment."""
+    monkeypatch.setenv(
+        "RESPONSE_CACHE_TTL_SECONDS",
+        json.dumps({"short": 5, "long": 120.5, "off": 0}),
+    )
+    ttls = DataBaseClientEnvConf(_env_file=None).RESPONSE_CACHE_TTL_SECONDS
+    assert ttls == {"short": 5.0, "long": 120.5, "off": 0.0}
+
+    cache = ResponseCache(ttls, max_entries=10, max_bytes=10_000)
+    for method in ("short", "long", "off", "missing"):
+        cache.set(method, params(1), b"body")
+
+    assert cache.get("off", params(1)) is None
+    assert cache.get("missing", params(1)) is None
+
+    clock.now += 5
+    assert cache.get("short", params(1)) is None
+    assert cache.get("long", params(1)) == b"body"
+
+    clock.now += 115.5
+    assert cache.get("long", params(1)) is None
+
+
+async def test_get_or_load_caches_found_responses() -> None:
+    """Test a load runs on a miss only, not found is not cached."""
+    cache = ResponseCache({"m": 60.0}, max_entries=10, max_bytes=10_000)
+    loads: list[int] = []
+
+    def loader(id_: int, body: bytes | None):
+        async def load() -> bytes | None:
+            loads.append(id_)
+            return body
+
+        return load
+
+    assert await cache.get_or_load("m", params(1), loader(1, b"a")) == b"a"
+    assert await cache.get_or_load("m", params(1), loader(1, b"b")) == b"a"
+    assert await cache.get_or_load("m", params(2), loader(2, None)) is None
+    assert await cache.get_or_load("m", params(2), loader(2, None)) is None
+
+    assert loads == [1, 2, 2]
@@ -0,0 +1,221 @@
+import asyncio
+from typing import List, Optional
+
+import pytest
+
+from src.core.infrastructure.background import Revalidator
+from src.core.infrastructure.cache import response
+from src.core.infrastructure.cache.response import ResponseCache, cache_key
+from src.core.infrastructure.database import db
+
+
+class Clock:
+    """Stand-in of the ``time`` module moved by hand."""
+
+    def __init__(self) -> None:
+        """Start the clock."""
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        """Return the current time."""
+        return self.now
+
+    def time(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    """Replace the clock of the response cache."""
+    fake = Clock()
+    monkeypatch.setattr(response, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def cache() -> ResponseCache:
+    """Create cache with responses fresh for 4 of their 10 seconds."""
+    return ResponseCache(
+        {"m": 10.0}, max_entries=10, max_bytes=10_000, soft_ttls={"m": 4.0}
+    )
+
+
+@pytest.fixture
+def revalidator() -> Revalidator:
+    """Create revalidator running two refreshes at a time."""
+    return Revalidator(max_pending=3, concurrency=2)
+
+
+class Refresh:
+    """Refresh held until released, tracking refreshes running."""
+
+    running = 0
+    most_running = 0
+
+    def __init__(self, release: asyncio.Event) -> None:
+        """Initialize refresh waiting for the event."""
+        self.release = release
+        self.done = False
+
+    async def __call__(self) -> None:
+        """Run the refresh once released."""
+        Refresh.running += 1
+        Refresh.most_running = max(Refresh.most_running, Refresh.running)
+        try:
+            await self.release.wait()
+        finally:
+            Refresh.running -= 1
+        self.done = True
+
+
+async def settle() -> None:
+    """Let the refresh tasks run until they wait."""
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+def test_stale_entry_served_until_expired(
+    clock: Clock, cache: ResponseCache
+) -> None:
+    """Test an entry past its soft TTL is served as stale."""
+    cache.set("m", {"id": 1}, b"old")
+
+    clock.now += 3.9
+    assert cache.lookup("m", {"id": 1}) == (b"old", False)
+
+    clock.now += 0.1
+    assert cache.lookup("m", {"id": 1}) == (b"old", True)
+
+    clock.now += 6.0
+    assert cache.lookup("m", {"id": 1}) == (None, False)
+    assert cache.snapshot()["methods"]["m"]["stale"] == 1
+
+
+async def test_stale_response_refreshed_in_background(
+    monkeypatch: pytest.MonkeyPatch,
+    clock: Clock,
+    cache: ResponseCache,
+    revalidator: Revalidator,
+) -> None:
+    """Test a stale hit is served while it is reloaded."""
+    revalidator.start()
+    for name, value in {
+        "cache": cache,
+        "revalidator": revalidator,
+        "negative": None,
+        "flight": None,
+        "catalog_version": None,
+    }.items():
+        monkeypatch.setattr(db, name, value)
+    loads: List[int] = []
+
+    async def load() -> Optional[bytes]:
+        loads.append(1)
+        return f"new {len(loads)}".encode()
+
+    cache.set("m", {"id": 1, "catalog_version": None}, b"old")
+    clock.now += 5.0
+
+    assert await db.cached("m", {"id": 1}, load) == b"old"
+    assert await db.cached("m", {"id": 1}, load) == b"old"
+    await settle()
+
+    assert loads == [1]
+    assert await db.cached("m", {"id": 1}, load) == b"new 1"
+    assert revalidator.snapshot() == {
+        "pending": 0,
+        "queued": 1,
+        "dropped": 0,
+        "refreshed": 1,
+        "failed": 0,
+    }
+    await revalidator.stop()
+
+
+async def test_pending_key_queued_once(revalidator: Revalidator) -> None:
+    """Test a key already pending is not queued again."""
+    revalidator.start()
+    release = asyncio.Event()
+    refreshes = [Refresh(release) for _ in range(3)]
+
+    for refresh in refreshes:
+        revalidator.submit(cache_key("m", {"id": 1}), refresh)
+    release.set()
+    await settle()
+
+    assert [refresh.done for refresh in refreshes] == [True, False, False]
+    assert revalidator.snapshot()["queued"] == 1
+    await revalidator.stop()
+
+
+async def test_refreshes_beyond_max_pending_dropped(
+    revalidator: Revalidator,
+) -> None:
+    """Test refreshes are dropped while the queue is full."""
+    revalidator.start()
+    release = asyncio.Event()
+
+    for id_ in range(5):
+        revalidator.submit(cache_key("m", {"id": id_}), Refresh(release))
+    await settle()
+
+    assert revalidator.snapshot()["pending"] == 3
+    assert revalidator.snapshot()["dropped"] == 2
+
+    release.set()
+    await settle()
+    revalidator.submit(cache_key("m", {"id": 9}), Refresh(release))
+    assert revalidator.snapshot()["queued"] == 4
+    await revalidator.stop()
+
+
+async def test_refreshes_run_bounded_concurrently(
+    revalidator: Revalidator,
+) -> None:
+    """Test no more than ``concurrency`` refreshes run at a time."""
+    revalidator.start()
+    Refresh.most_running = 0
+    release = asyncio.Event()
+    refreshes = [Refresh(release) for _ in range(3)]
+
+    for id_, refresh in enumerate(refreshes):
+        revalidator.submit(cache_key("m", {"id": id_}), refresh)
+    await settle()
+
+    assert Refresh.running == 2
+    release.set()
+    await settle()
+    assert all(refresh.done for refresh in refreshes)
+    assert Refresh.most_running == 2
+    await revalidator.stop()
+
+
+async def test_failed_refresh_counted() -> None:
+    """Test a failing refresh is counted and frees its key."""
+    revalidator = Revalidator(max_pending=3, concurrency=1)
+    revalidator.start()
+
+    async def fail() -> None:
+        raise ValueError("failed")
+
+    revalidator.submit("key", fail)
+    await settle()
+
+    assert revalidator.snapshot() == {
+        "pending": 0,
+        "queued": 1,
+        "dropped": 0,
+        "refreshed": 0,
+        "failed": 1,
+    }
+    await revalidator.stop()
+
+
+def test_refresh_dropped_while_stopped() -> None:
+    """Test nothing is queued before the tasks start."""
+    revalidator = Revalidator(max_pending=3, concurrency=1)
+
+    revalidator.submit("key", Refresh(asyncio.Event()))
+
+    assert revalidator.snapshot()["dropped"] == 1
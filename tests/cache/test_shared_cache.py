@@ -0,0 +1,206 @@
+import time
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from src.core.infrastructure.cache import shared
+from src.core.infrastructure.cache.shared import (
+    READ_ATTEMPTS,
+    SEQUENCE,
+    SLOT_HEADER_SIZE,
+    SharedResponseCache,
+    page_slot_bytes,
+)
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> str:
+    """Return path of the cache file."""
+    return str(tmp_path / "responses")
+
+
+@pytest.fixture
+def workers(path: str) -> Iterator[tuple[SharedResponseCache, ...]]:
+    """Map one cache file twice, like two workers of a node."""
+    first = SharedResponseCache.create(path, slots=8, slot_bytes=1024)
+    second = SharedResponseCache(path, slots=8, slot_bytes=1024)
+    yield first, second
+    first.close()
+    second.close()
+
+
+def test_entry_written_by_one_worker_read_by_another(
+    workers: tuple[SharedResponseCache, ...],
+) -> None:
+    """Test an entry is seen through every mapping of the file."""
+    writer, reader = workers
+
+    writer.set("key", b"body", ttl=60)
+    entry = reader.get("key")
+
+    assert entry is not None
+    assert entry.body == b"body"
+    assert entry.expires == pytest.approx(time.time() + 60, abs=5)
+    assert reader.get("other") is None
+    assert writer.counts["write"] == 1
+    assert reader.counts["hit"] == 1
+    assert reader.counts["miss"] == 1
+
+
+def test_key_taking_slot_over_misses_previous_key(path: str) -> None:
+    """Test a slot holds the newest of the keys hashed to it."""
+    cache = SharedResponseCache.create(path, slots=1, slot_bytes=1024)
+
+    cache.set("first", b"one", ttl=60)
+    cache.set("second", b"two", ttl=60)
+
+    assert cache.get("first") is None
+    assert cache.get("second").body == b"two"
+    cache.close()
+
+
+def test_expired_entry_misses(
+    workers: tuple[SharedResponseCache, ...],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test an entry is not served after its TTL."""
+    cache, _ = workers
+    cache.set("key", b"body", ttl=10)
+
+    now = time.time()
+    monkeypatch.setattr(shared.time, "time", lambda: now + 11)
+
+    assert cache.get("key") is None
+
+
+def test_slot_being_written_misses(
+    workers: tuple[SharedResponseCache, ...],
+) -> None:
+    """Test an odd sequence keeps readers off the slot."""
+    writer, reader = workers
+    writer.set("key", b"body", ttl=60)
+    offset, _ = writer.slot_of("key")
+    sequence = SEQUENCE.unpack_from(writer._mm, offset)[0]
+
+    SEQUENCE.pack_into(writer._mm, offset, sequence | 1)
+    assert reader.get("key") is None
+
+    SEQUENCE.pack_into(writer._mm, offset, sequence)
+    assert reader.get("key").body == b"body"
+
+
+def test_read_racing_a_write_is_retried(
+    workers: tuple[SharedResponseCache, ...],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a read torn by a write is retried and sees the new entry."""
+    writer, reader = workers
+    writer.set("key", b"old body", ttl=60)
+    real_time = time.time
+    raced: list[bool] = []
+
+    def time_with_write() -> float:
+        # Called by the reader between its header and body copies.
+        if not raced:
+            raced.append(True)
+            writer.set("key", b"NEW BODY!", ttl=60)
+        return real_time()
+
+    monkeypatch.setattr(shared.time, "time", time_with_write)
+    entry = reader.get("key")
+
+    assert raced
+    assert entry is not None
+    assert entry.body == b"NEW BODY!"
+
+
+def test_read_gives_up_on_slot_written_meanwhile(
+    workers: tuple[SharedResponseCache, ...],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a slot rewritten on every read attempt is deemed missing."""
+    writer, reader = workers
+    writer.set("key", b"body", ttl=60)
+    real_time = time.time
+    writes: list[bool] = []
+    writing = False
+
+    def time_with_write() -> float:
+        nonlocal writing
+        # Called by the reader between its header and body copies, and
+        # by the write itself.
+        if not writing:
+            writing = True
+            writes.append(True)
+            writer.set("key", b"body", ttl=60)
+            writing = False
+        return real_time()
+
+    monkeypatch.setattr(shared.time, "time", time_with_write)
+    entry = reader.get("key")
+
+    assert entry is None
+    assert len(writes) == READ_ATTEMPTS
+
+
+def test_clear_invalidates_entries_of_all_workers(
+    workers: tuple[SharedResponseCache, ...],
+) -> None:
+    """Test entries of an older generation miss."""
+    first, second = workers
+    first.set("key", b"body", ttl=60)
+    generation = first.generation
+
+    second.clear()
+
+    assert first.generation == second.generation == generation + 1
+    assert first.get("key") is None
+    first.set("key", b"new", ttl=60)
+    assert second.get("key").body == b"new"
+
+
+def test_oversize_body_rejected(
+    workers: tuple[SharedResponseCache, ...],
+) -> None:
+    """Test a body larger than a slot is not written."""
+    cache, _ = workers
+    fits = b"x" * (1024 - SLOT_HEADER_SIZE)
+
+    cache.set("fits", fits, ttl=60)
+    cache.set("oversize", fits + b"x", ttl=60)
+
+    assert cache.get("fits").body == fits
+    assert cache.get("oversize") is None
+    assert cache.counts["oversize"] == 1
+    assert cache.counts["write"] == 1
+
+
+def test_default_slot_fits_default_page() -> None:
+    """Test a page of 100 documents of 400 bytes fits a slot."""
+    documents = ",".join(['{"name":"' + "x" * 388 + '"}'] * 100)
+    body = (
+        f'{{"organizations":[{documents}],"next_cursor":"eyJpZCI6MTIzNDV9"}}'
+    ).encode()
+    key = '["org_by_activity_tree",{"after_id":0,"limit":100,"name":"Еда"}]'
+
+    slot_bytes = page_slot_bytes(page_limit=100, document_bytes=512)
+
+    assert len(body) <= slot_bytes - SLOT_HEADER_SIZE
+    assert len(key.encode()) < 256
+
+
+def test_create_drops_entries_of_previous_run(path: str) -> None:
+    """Test the file is recreated, also on a layout change."""
+    cache = SharedResponseCache.create(path, slots=8, slot_bytes=1024)
+    cache.set("key", b"body", ttl=60)
+    cache.close()
+
+    cache = SharedResponseCache.create(path, slots=8, slot_bytes=1024)
+    assert cache.get("key") is None
+    cache.set("key", b"body", ttl=60)
+    cache.close()
+
+    cache = SharedResponseCache(path, slots=16, slot_bytes=1024)
+    assert cache.get("key") is None
+    cache.close()
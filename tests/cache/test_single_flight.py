@@ -0,0 +1,120 @@
+import asyncio
+from typing import List, Optional
+
+import pytest
+
+from src.core.infrastructure.cache import SingleFlight
+
+
+class Load:
+    """Load held until released, counting its runs."""
+
+    def __init__(self, body: Optional[bytes] = b"body") -> None:
+        """Initialize load returning the body."""
+        self.body = body
+        self.error: Optional[Exception] = None
+        self.runs = 0
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> Optional[bytes]:
+        """Run the load once released."""
+        self.runs += 1
+        self.started.set()
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return self.body
+
+
+async def settle() -> None:
+    """Let started tasks reach their first wait."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_leader_result_shared() -> None:
+    """Test concurrent callers share one load and its result."""
+    flight = SingleFlight()
+    load = Load()
+
+    tasks = [
+        asyncio.create_task(flight.do("m", {"id": 1}, load)) for _ in range(3)
+    ]
+    await settle()
+    assert len(flight) == 1
+    load.release.set()
+
+    assert await asyncio.gather(*tasks) == [b"body"] * 3
+    assert load.runs == 1
+    assert len(flight) == 0
+    assert flight.snapshot()["methods"]["m"] == {
+        "executed": 1,
+        "coalesced": 2,
+    }
+
+
+async def test_leader_error_fanned_out() -> None:
+    """Test callers waiting on a failed load get its error."""
+    flight = SingleFlight()
+    load = Load()
+    load.error = ValueError("failed")
+
+    tasks = [
+        asyncio.create_task(flight.do("m", {"id": 1}, load)) for _ in range(3)
+    ]
+    await settle()
+    load.release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert results == [load.error] * 3
+    assert load.runs == 1
+    assert len(flight) == 0
+    assert flight.snapshot()["methods"]["m"] == {
+        "executed": 1,
+        "coalesced": 2,
+    }
+
+
+async def test_waiter_takes_over_cancelled_leader() -> None:
+    """Test a waiter of a cancelled load runs it again, once."""
+    flight = SingleFlight()
+    load = Load()
+
+    leader = asyncio.create_task(flight.do("m", {"id": 1}, load))
+    await load.started.wait()
+    waiters = [
+        asyncio.create_task(flight.do("m", {"id": 1}, load)) for _ in range(2)
+    ]
+    await settle()
+    load.started.clear()
+
+    leader.cancel()
+    await load.started.wait()
+    load.release.set()
+
+    assert await asyncio.gather(*waiters) == [b"body"] * 2
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert load.runs == 2
+    assert len(flight) == 0
+    assert flight.snapshot()["methods"]["m"] == {
+        "executed": 2,
+        "coalesced": 1,
+    }
+
+
+async def test_keys_loaded_separately() -> None:
+    """Test different requests don't share a load."""
+    flight = SingleFlight()
+    loads: List[Load] = [Load(b"1"), Load(b"2")]
+    for load in loads:
+        load.release.set()
+
+    bodies = await asyncio.gather(
+        flight.do("m", {"id": 1}, loads[0]),
+        flight.do("m", {"id": 2}, loads[1]),
+    )
+
+    assert bodies == [b"1", b"2"]
+    assert [load.runs for load in loads] == [1, 1]
@@ -14,6 +14,7 @@ from factory_schemas import (
     OrganizationFakeFactory,
     PhoneNumberFakeFactory,
 )
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     AsyncConnection,
     AsyncSession,
@@ -66,6 +67,7 @@ async def connection() -> AsyncGenerator[AsyncConnection, None]:
     )
 
     async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(BaseModel.metadata.drop_all)
         await conn.run_sync(BaseModel.metadata.create_all)
 
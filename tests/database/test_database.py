@@ -1,13 +1,34 @@
+import json
 from typing import List
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import Text, cast, event, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 from typing_extensions import TypeVar
 
-from src.core.infrastructure.database.schemas.activity import Activity
+from src.core.infrastructure.database.core.statement_cache import (
+    StatementCacheStats,
+)
+from src.core.infrastructure.database.cruds.catalog import (
+    get_catalog_version,
+)
+from src.core.infrastructure.database.cruds.models.activity import ActivityCRUD
+from src.core.infrastructure.database.cruds.models.location import (
+    OrganizationByLocationCRUD,
+)
+from src.core.infrastructure.database.cruds.models.org import OrganizationCRUD
+from src.core.infrastructure.database.schemas.activity import (
+    Activity,
+    OrganizationActivity,
+)
+from src.core.infrastructure.database.schemas.buildings import Building
+from src.core.infrastructure.database.schemas.documents import (
+    OrganizationDocument,
+    organization_json,
+)
 from src.core.infrastructure.database.schemas.organizations import Organization
+from src.core.infrastructure.database.schemas.phones import PhoneNumber
 from tests.database.factory_schemas import PhoneNumberFakeFactory
 
 CallableType = TypeVar("CallableType")
@@ -48,7 +69,10 @@ async def test_organization_creation(
 ) -> None:
     """Test organization creation with relations."""
     # Проверяем создание организаций
-    stmt = select(Organization)
+    stmt = select(Organization).options(
+        joinedload(Organization.building),
+        selectinload(Organization.activities),
+    )
     result = await async_session.execute(stmt)
     organizations = result.scalars().all()
 
@@ -87,3 +111,230 @@ async def test_activity_tree(
     result = await async_session.execute(stmt)
     deep_activities = result.scalars().all()
     assert len(deep_activities) == 0
+
+
+@pytest.mark.asyncio
+async def test_activity_subtree_organization_ids(
+    async_session: AsyncSession,
+) -> None:
+    """Test recursive lookup of organizations of activity subtree."""
+    activities = (await async_session.execute(select(Activity))).scalars()
+    children: dict[int | None, list[int]] = {}
+    root_id = None
+    for activity in activities.all():
+        children.setdefault(activity.parent_id, []).append(activity.id)
+        if activity.name == "Еда":
+            root_id = activity.id
+
+    subtree, stack = set(), [root_id]
+    while stack:
+        activity_id = stack.pop()
+        subtree.add(activity_id)
+        stack.extend(children.get(activity_id, []))
+
+    links = await async_session.execute(select(OrganizationActivity))
+    expected = {
+        link.organization_id
+        for link in links.scalars().all()
+        if link.activity_id in subtree
+    }
+
+    crud = ActivityCRUD(Activity, Organization)
+    ids = list(
+        (
+            await async_session.scalars(crud.subtree_organization_ids("Еда"))
+        ).all()
+    )
+
+    assert len(ids) == len(set(ids)), "Organization IDs should be distinct"
+    assert set(ids) == expected
+
+
+@pytest.mark.asyncio
+async def test_activity_exists_without_organizations(
+    async_session: AsyncSession,
+) -> None:
+    """Test activity lookup tells missing from empty activities."""
+    activity = Activity(name="Без организаций", level=1)
+    async_session.add(activity)
+    await async_session.flush()
+
+    try:
+        crud = ActivityCRUD(Activity, Organization)
+        page = await crud.get_documents_by_activity(
+            activity_name=activity.name,
+            session=async_session,
+            limit=10,
+            with_children=True,
+        )
+        assert page.documents == []
+        assert await crud.activity_exists(activity.name, async_session)
+        assert not await crud.activity_exists("Нет такой", async_session)
+    finally:
+        await async_session.rollback()
+
+
+@pytest.mark.asyncio
+async def test_nearest_organizations_ordered_by_distance(
+    async_session: AsyncSession,
+) -> None:
+    """Test KNN lookup returns closest organizations first."""
+    crud = OrganizationByLocationCRUD(Organization, Building)
+    documents = await crud.get_documents_nearest(
+        point=(0.0, 0.0), k=5, session=async_session
+    )
+
+    distances = [json.loads(document)["distance"] for document in documents]
+    assert 1 <= len(distances) <= 5
+    assert distances == sorted(distances)
+
+    limited = await crud.get_documents_nearest(
+        point=(0.0, 0.0),
+        k=5,
+        session=async_session,
+        max_distance=distances[0] + 1,
+    )
+    assert all(
+        json.loads(document)["distance"] <= distances[0] + 1
+        for document in limited
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_organizations_ignores_case_and_yo(
+    async_session: AsyncSession,
+) -> None:
+    """Test trigram search folds case and ё."""
+    organization = (
+        await async_session.execute(select(Organization).limit(1))
+    ).scalar_one()
+    word = max(organization.name.split(), key=len)
+
+    crud = OrganizationCRUD(Organization)
+    documents = await crud.search_documents(
+        query=word.upper().replace("Е", "Ё"),
+        session=async_session,
+        limit=1000,
+    )
+
+    assert organization.id in {
+        json.loads(document)["id"] for document in documents
+    }
+
+
+@pytest.mark.asyncio
+async def test_prebuilt_statement_hits_compiled_cache(
+    async_session: AsyncSession,
+) -> None:
+    """Test repeated lookups reuse the compiled statement."""
+    ids = (await async_session.scalars(select(Organization.id).limit(3))).all()
+    stats = StatementCacheStats()
+    engine = async_session.bind.engine.sync_engine
+    event.listen(engine, "before_cursor_execute", stats.before_cursor_execute)
+    try:
+        crud = OrganizationCRUD(Organization)
+        for id_ in ids:
+            await crud.get_document_by_id(session=async_session, id_obj=id_)
+    finally:
+        event.remove(
+            engine, "before_cursor_execute", stats.before_cursor_execute
+        )
+
+    counts = stats.snapshot()["document_by_id"]
+    assert counts["hit"] + counts["miss"] == len(ids)
+    assert counts["miss"] <= 1
+
+
+@pytest.mark.asyncio
+async def test_organization_document_follows_changes(
+    async_session: AsyncSession,
+) -> None:
+    """Test triggers keep the precomputed document current."""
+    organization = (
+        await async_session.execute(select(Organization).limit(1))
+    ).scalar_one()
+
+    async def documents() -> tuple[dict, dict]:
+        stored = await async_session.scalar(
+            select(OrganizationDocument.document).where(
+                OrganizationDocument.organization_id == organization.id
+            )
+        )
+        built = await async_session.scalar(
+            select(cast(organization_json(), Text))
+            .select_from(Organization)
+            .join(Building, Organization.building_id == Building.id)
+            .where(Organization.id == organization.id)
+        )
+        return json.loads(stored), json.loads(built)
+
+    stored, built = await documents()
+    assert stored == built
+
+    async_session.add(
+        PhoneNumber(number="+7 000 000-00-00", organization_id=organization.id)
+    )
+    await async_session.flush()
+    try:
+        stored, built = await documents()
+        assert {"phone": "+7 000 000-00-00"} in stored["phones"]
+        assert stored == built
+    finally:
+        await async_session.rollback()
+
+
+@pytest.mark.asyncio
+async def test_catalog_version_bumped_by_writes(
+    async_session: AsyncSession,
+) -> None:
+    """Test writes to catalog tables bump the catalog version."""
+    organization_id = await async_session.scalar(
+        select(Organization.id).limit(1)
+    )
+    before = await get_catalog_version(async_session)
+
+    async_session.add(
+        PhoneNumber(number="+7 000 000-00-01", organization_id=organization_id)
+    )
+    await async_session.flush()
+    try:
+        after = await get_catalog_version(async_session)
+        assert before is not None and after == before + 1
+    finally:
+        await async_session.rollback()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "lat, distance",
+    [
+        # 0.001° of longitude on the WGS 84 equator and 60th parallel.
+        (0.0, 111.32),
+        (60.0, 55.80),
+    ],
+)
+async def test_radius_filter_in_geodesic_meters(
+    async_session: AsyncSession, lat: float, distance: float
+) -> None:
+    """Test the radius bounds buildings by their geodesic distance."""
+    building = Building(
+        address="Радиус", location=f"SRID=4326;POINT(100.001 {lat})"
+    )
+    async_session.add(building)
+    await async_session.flush()
+    crud = OrganizationByLocationCRUD(Organization, Building)
+
+    async def found(radius: float) -> bool:
+        ids = await async_session.scalars(
+            select(Building.id).where(
+                crud.in_radius((100.0, lat), radius),
+                Building.id == building.id,
+            )
+        )
+        return ids.first() is not None
+
+    try:
+        assert await found(distance + 0.3)
+        assert not await found(distance - 0.3)
+    finally:
+        await async_session.rollback()
@@ -0,0 +1,115 @@
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.core.infrastructure.database import db
+from src.core.infrastructure.database.core.replicas import (
+    Replica,
+    ReplicaRouter,
+    RoutingSession,
+)
+
+
+def engine(port: int) -> AsyncEngine:
+    """Create engine that is never connected."""
+    return create_async_engine(f"postgresql+asyncpg://u:p@127.0.0.1:{port}/d")
+
+
+class StubSession:
+    """Session of a replica at a set catalog version."""
+
+    def __init__(self, version: Optional[int], router: ReplicaRouter):
+        """Initialize session reading the version from the replica."""
+        self.version = version
+        self.sync_session = RoutingSession(router=router)
+        self.reads = 0
+        self.rolled_back = False
+
+    async def scalar(self, *args: Any, **kwargs: Any) -> Optional[int]:
+        """Return the catalog version, from the replica of the session."""
+        self.sync_session.get_bind()
+        self.reads += 1
+        return self.version
+
+    async def rollback(self) -> None:
+        """End the transaction."""
+        self.rolled_back = True
+
+
+@pytest.fixture
+def replica() -> Replica:
+    """Create replica within the lag threshold."""
+    fresh = Replica(engine(2))
+    fresh.lag = 0.0
+    return fresh
+
+
+@pytest.fixture
+def router(replica: Replica) -> ReplicaRouter:
+    """Create router reading from the replica."""
+    return ReplicaRouter(engine(1), [replica], "round_robin", 5.0)
+
+
+def use_session(
+    monkeypatch: pytest.MonkeyPatch,
+    session: StubSession,
+    polled: Optional[int],
+) -> None:
+    """Open the stub session as sessions of ``db``."""
+
+    @asynccontextmanager
+    async def open_session(info: Any = None) -> AsyncIterator[StubSession]:
+        yield session
+
+    monkeypatch.setattr(db, "session", open_session)
+    monkeypatch.setattr(db, "catalog_version", polled)
+
+
+@pytest.mark.parametrize("version", [5, 6])
+async def test_replica_at_polled_version_kept(
+    monkeypatch: pytest.MonkeyPatch,
+    replica: Replica,
+    router: ReplicaRouter,
+    version: int,
+) -> None:
+    """Test a replica not behind the poll serves the data."""
+    session = StubSession(version, router)
+    use_session(monkeypatch, session, polled=5)
+
+    async with db.catalog_session() as opened:
+        assert opened is session
+
+    assert not session.rolled_back
+    assert session.sync_session.get_bind() is replica.engine.sync_engine
+
+
+@pytest.mark.parametrize("version", [4, None])
+async def test_replica_behind_poll_left_for_primary(
+    monkeypatch: pytest.MonkeyPatch,
+    router: ReplicaRouter,
+    version: Optional[int],
+) -> None:
+    """Test data behind the ETag version is read from the primary."""
+    session = StubSession(version, router)
+    use_session(monkeypatch, session, polled=5)
+
+    async with db.catalog_session():
+        pass
+
+    assert session.rolled_back
+    assert session.sync_session.get_bind() is router.primary.sync_engine
+
+
+async def test_version_not_read_before_poll(
+    monkeypatch: pytest.MonkeyPatch, router: ReplicaRouter
+) -> None:
+    """Test sessions don't check a version that isn't polled."""
+    session = StubSession(0, router)
+    use_session(monkeypatch, session, polled=None)
+
+    async with db.catalog_session():
+        pass
+
+    assert session.reads == 0
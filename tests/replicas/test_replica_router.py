@@ -0,0 +1,123 @@
+from collections import Counter
+from typing import Optional
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.core.infrastructure.database.core.replicas import (
+    Replica,
+    ReplicaRouter,
+    RoutingPolicy,
+)
+
+
+def engine(port: int) -> AsyncEngine:
+    """Create engine that is never connected."""
+    return create_async_engine(f"postgresql+asyncpg://u:p@127.0.0.1:{port}/d")
+
+
+class StubReplica(Replica):
+    """Replica with set lag and checked out connections."""
+
+    def __init__(self, port: int, lag: Optional[float], connections: int):
+        """Initialize replica on an unconnected engine."""
+        super().__init__(engine(port))
+        self.lag = lag
+        self.busy = connections
+
+    @property
+    def connections(self) -> int:
+        """Return set connections."""
+        return self.busy
+
+
+def router(
+    replicas: list[Replica],
+    policy: RoutingPolicy = "round_robin",
+    max_lag: float = 5.0,
+) -> ReplicaRouter:
+    """Create router over the replicas."""
+    return ReplicaRouter(engine(1), replicas, policy, max_lag)
+
+
+def test_lagging_and_unmeasured_replicas_excluded() -> None:
+    """Test only replicas within the lag threshold are fresh."""
+    fresh = StubReplica(2, lag=0.0, connections=0)
+    at_threshold = StubReplica(3, lag=5.0, connections=0)
+    lagging = StubReplica(4, lag=5.1, connections=0)
+    stalled = StubReplica(5, lag=float("inf"), connections=0)
+    unreachable = StubReplica(6, lag=None, connections=0)
+
+    reads = router([fresh, at_threshold, lagging, stalled, unreachable])
+
+    assert reads.fresh() == [fresh, at_threshold]
+
+
+def test_primary_read_without_fresh_replica() -> None:
+    """Test reads fall back to the primary."""
+    reads = router(
+        [
+            StubReplica(2, lag=60.0, connections=0),
+            StubReplica(3, lag=None, connections=0),
+        ]
+    )
+
+    assert reads.reader() is reads.primary
+
+
+def test_no_replicas_read_from_primary() -> None:
+    """Test a router without replicas reads from the primary."""
+    reads = router([])
+
+    assert reads.reader() is reads.primary
+
+
+def test_round_robin_spreads_reads_over_fresh_replicas() -> None:
+    """Test round robin takes fresh replicas in turn."""
+    first = StubReplica(2, lag=0.0, connections=0)
+    second = StubReplica(3, lag=1.0, connections=0)
+    lagging = StubReplica(4, lag=60.0, connections=0)
+    reads = router([first, lagging, second])
+
+    picked = [reads.reader() for _ in range(6)]
+
+    assert picked == [first.engine, second.engine] * 3
+
+
+def test_round_robin_follows_lag_changes() -> None:
+    """Test a replica leaves and rejoins rotation with its lag."""
+    first = StubReplica(2, lag=0.0, connections=0)
+    second = StubReplica(3, lag=0.0, connections=0)
+    reads = router([first, second])
+
+    second.lag = 60.0
+    assert {reads.reader() for _ in range(4)} == {first.engine}
+
+    second.lag = 0.0
+    counts = Counter(reads.reader() for _ in range(4))
+    assert counts == {first.engine: 2, second.engine: 2}
+
+
+def test_least_connections_picks_least_busy_fresh_replica() -> None:
+    """Test least connections ignores busier and lagging replicas."""
+    busy = StubReplica(2, lag=0.0, connections=5)
+    idle_lagging = StubReplica(3, lag=60.0, connections=0)
+    least = StubReplica(4, lag=1.0, connections=2)
+    reads = router([busy, idle_lagging, least], policy="least_connections")
+
+    assert reads.reader() is least.engine
+
+    least.busy = 6
+    assert reads.reader() is busy.engine
+
+
+@pytest.mark.parametrize("lag", [None, 0.0, 3.0])
+async def test_unreachable_replica_loses_lag(lag: Optional[float]) -> None:
+    """Test a replica that can't be measured gets no reads."""
+    replica = Replica(engine(1))
+    replica.lag = lag
+
+    await replica.check_lag()
+
+    assert replica.lag is None
+    await replica.engine.dispose()
@@ -0,0 +1,113 @@
+import pytest
+
+from src.core.infrastructure.search import AutocompleteIndex, normalize
+from src.core.infrastructure.search.autocomplete import (
+    build_snapshot,
+    name_keys,
+)
+
+ROWS = [
+    (1, "ООО Ромашка"),
+    (2, "Роман и партнеры"),
+    (3, "Дом Домов"),
+    (4, "Ёлка"),
+]
+
+
+def test_name_keyed_from_every_word() -> None:
+    """Test a name is found from the start of any word."""
+    assert name_keys("ООО  Ромашка Плюс") == [
+        "ооо ромашка плюс",
+        "ромашка плюс",
+        "плюс",
+    ]
+
+
+def test_prefix_normalized() -> None:
+    """Test case, ``ё`` and whitespace runs are folded."""
+    assert normalize("  ЁЛКА   Плюс ") == "елка плюс"
+
+
+def test_snapshot_keys_sorted_with_their_ids() -> None:
+    """Test keys are sorted and keep the ID of their name."""
+    snapshot = build_snapshot(ROWS)
+
+    assert snapshot.keys == sorted(snapshot.keys)
+    assert len(snapshot.keys) == len(snapshot.ids) == 8
+    assert dict(zip(snapshot.keys, snapshot.ids))["ромашка"] == 1
+    assert snapshot.names == dict(ROWS)
+    assert snapshot.max_id == 4
+
+
+def test_extension_merged_into_base() -> None:
+    """Test new names are merged into the sorted keys of the base."""
+    base = build_snapshot(ROWS)
+
+    snapshot = build_snapshot([(5, "Ромб"), (6, "Аптека")], base)
+
+    assert snapshot.keys == sorted(snapshot.keys)
+    assert len(snapshot.keys) == len(base.keys) + 2
+    assert snapshot.names == {**dict(ROWS), 5: "Ромб", 6: "Аптека"}
+    assert snapshot.max_id == 6
+    assert base.names == dict(ROWS)
+
+
+async def loaded() -> AutocompleteIndex:
+    """Create index of the rows."""
+    index = AutocompleteIndex(full_refresh_every=2)
+    await index.load(ROWS)
+    return index
+
+
+async def test_suggested_by_word_start() -> None:
+    """Test any word of a name matches by its start only."""
+    index = await loaded()
+
+    assert index.suggest("ром", limit=10) == [
+        (2, "Роман и партнеры"),
+        (1, "ООО Ромашка"),
+    ]
+    assert index.suggest("ООО РОМ", limit=10) == [(1, "ООО Ромашка")]
+    assert index.suggest("машка", limit=10) == []
+    assert index.suggest("елк", limit=10) == [(4, "Ёлка")]
+
+
+async def test_organization_suggested_once() -> None:
+    """Test a name matched by several words is suggested once."""
+    index = await loaded()
+
+    assert index.suggest("дом", limit=10) == [(3, "Дом Домов")]
+
+
+async def test_suggestions_limited() -> None:
+    """Test no more than ``limit`` organizations are suggested."""
+    index = await loaded()
+
+    assert index.suggest("", limit=3) == [
+        (3, "Дом Домов"),
+        (4, "Ёлка"),
+        (2, "Роман и партнеры"),
+    ]
+
+
+async def test_extension_suggested() -> None:
+    """Test organizations added by a refresh are suggested."""
+    index = await loaded()
+
+    await index.extend([(5, "Ромб")])
+
+    assert index.suggest("ромб", limit=10) == [(5, "Ромб")]
+    assert index.max_id == 5
+    assert not index.full_refresh_due
+
+    await index.extend([])
+    assert index.full_refresh_due
+
+
+def test_suggest_before_load_fails() -> None:
+    """Test the index is not searched before it is built."""
+    index = AutocompleteIndex(full_refresh_every=2)
+
+    assert not index.ready
+    with pytest.raises(RuntimeError):
+        index.suggest("ром", limit=10)
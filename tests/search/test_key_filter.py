@@ -0,0 +1,191 @@
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, List, Optional
+
+import pytest
+from fastapi import HTTPException
+from starlette import status
+
+from src.core.api.v1.presentation.requests.organization import (
+    OrganizationByNameRequest,
+)
+from src.core.api.v1.routes.organization.endpoints.by_org_name import (
+    org_by_name,
+)
+from src.core.infrastructure.database import client, db
+from src.core.infrastructure.search import bloom
+from src.core.infrastructure.search.bloom import OrganizationKeyFilter
+
+ROWS = [(id_, f"Организация {id_}") for id_ in range(1, 1001)]
+
+
+class Clock:
+    """Stand-in of the ``time`` module moved by hand."""
+
+    def __init__(self) -> None:
+        """Start the clock."""
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    """Replace the clock of the key filter."""
+    fake = Clock()
+    monkeypatch.setattr(bloom, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def key_filter(
+    monkeypatch: pytest.MonkeyPatch, clock: Clock
+) -> OrganizationKeyFilter:
+    """Install a key filter on ``db`` with caches disabled."""
+    installed = OrganizationKeyFilter(error_rate=0.01, rebuild_seconds=30.0)
+    monkeypatch.setattr(db.org, "key_filter", installed)
+    monkeypatch.setattr(db, "catalog_version", None)
+    for name in ("cache", "negative", "flight", "revalidator"):
+        monkeypatch.setattr(db, name, None)
+    return installed
+
+
+@pytest.fixture
+def lookups(monkeypatch: pytest.MonkeyPatch) -> List[str]:
+    """Answer name lookups not found, recording them."""
+    names: List[str] = []
+
+    @asynccontextmanager
+    async def session() -> AsyncIterator[None]:
+        yield None
+
+    async def get_document_by_name(name: str, session: Any) -> None:
+        names.append(name)
+
+    monkeypatch.setattr(db, "catalog_session", session)
+    monkeypatch.setattr(db.org, "get_document_by_name", get_document_by_name)
+    return names
+
+
+def false_positive(key_filter: OrganizationKeyFilter) -> str:
+    """Return a name the filter passes although it was never added."""
+    for i in range(100_000):
+        name = f"Нет такой {i}"
+        if key_filter.may_exist(name=name):
+            return name
+    raise AssertionError("No false positive found")
+
+
+async def test_added_keys_never_rejected(
+    key_filter: OrganizationKeyFilter,
+) -> None:
+    """Test the filter has no false negatives."""
+    await key_filter.load(ROWS, version=1)
+
+    assert all(key_filter.may_exist(id_=id_) for id_, _ in ROWS)
+    assert all(key_filter.may_exist(name=name) for _, name in ROWS)
+    assert key_filter.snapshot()["rejected"] == 0
+
+
+async def test_false_positive_rate_near_configured(
+    key_filter: OrganizationKeyFilter,
+) -> None:
+    """Test missing keys pass at about the configured rate."""
+    await key_filter.load(ROWS, version=1)
+
+    passed = sum(key_filter.may_exist(id_=id_) for id_ in range(2000, 12000))
+
+    assert passed < 10000 * 0.03
+
+
+async def test_surely_missing_name_answered_without_lookup(
+    key_filter: OrganizationKeyFilter, lookups: List[str]
+) -> None:
+    """Test a rejected name is answered 404 without the database."""
+    await key_filter.load(ROWS, version=1)
+    db.catalog_version = 1
+    name = "Нет такой организации"
+    assert not key_filter.may_exist(name=name)
+
+    with pytest.raises(HTTPException) as error:
+        await org_by_name(OrganizationByNameRequest(name=name))
+
+    assert error.value.status_code == status.HTTP_404_NOT_FOUND
+    assert lookups == []
+
+
+async def test_false_positive_looked_up_in_database(
+    key_filter: OrganizationKeyFilter, lookups: List[str]
+) -> None:
+    """Test a name passed by mistake is still answered by the database."""
+    await key_filter.load(ROWS, version=1)
+    db.catalog_version = 1
+    name = false_positive(key_filter)
+
+    with pytest.raises(HTTPException) as error:
+        await org_by_name(OrganizationByNameRequest(name=name))
+
+    assert error.value.status_code == status.HTTP_404_NOT_FOUND
+    assert lookups == [name]
+
+
+async def test_filter_bypassed_on_version_change(
+    key_filter: OrganizationKeyFilter, lookups: List[str]
+) -> None:
+    """Test a filter behind the catalog rejects nothing."""
+    await key_filter.load(ROWS, version=1)
+    db.catalog_version = 2
+    name = "Новая организация"
+
+    assert db.may_exist(name=name)
+    with pytest.raises(HTTPException):
+        await org_by_name(OrganizationByNameRequest(name=name))
+
+    assert lookups == [name]
+
+
+async def test_rebuild_on_version_change_debounced(
+    monkeypatch: pytest.MonkeyPatch,
+    key_filter: OrganizationKeyFilter,
+    clock: Clock,
+) -> None:
+    """Test version changes rebuild the filter at most once a period."""
+    version: Optional[int] = 1
+    reads: List[int] = []
+
+    @asynccontextmanager
+    async def session() -> AsyncIterator[None]:
+        yield None
+
+    async def get_catalog_version(session: Any) -> Optional[int]:
+        return version
+
+    async def get_names(session: Any) -> List[tuple[int, str]]:
+        reads.append(len(ROWS))
+        return ROWS
+
+    monkeypatch.setattr(db, "session", session)
+    monkeypatch.setattr(client, "get_catalog_version", get_catalog_version)
+    monkeypatch.setattr(db.org, "get_names", get_names)
+
+    await db.refresh_catalog_version()
+    assert key_filter.version == 1
+    assert len(reads) == 1
+
+    version = 2
+    clock.now += 10.0
+    await db.refresh_catalog_version()
+    assert db.catalog_version == 2
+    assert key_filter.version == 1
+    assert len(reads) == 1
+    assert db.may_exist(name="Новая организация")
+
+    clock.now += 20.0
+    await db.refresh_catalog_version()
+    assert key_filter.version == 2
+    assert len(reads) == 2
+
+    clock.now += 60.0
+    await db.refresh_catalog_version()
+    assert len(reads) == 2
@@ -0,0 +1,116 @@
+import math
+import random
+
+import pytest
+
+from src.core.infrastructure.spatial.index import (
+    EARTH_RADIUS,
+    SpatialIndex,
+    radius_boxes,
+)
+
+
+def haversine(a: tuple[float, float], b: tuple[float, float]) -> float:
+    """Return distance in meters between points in degrees."""
+    lon1, lat1, lon2, lat2 = map(math.radians, (*a, *b))
+    h = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * math.asin(math.sqrt(min(h, 1.0)))
+
+
+@pytest.fixture
+async def buildings() -> tuple[SpatialIndex, dict[int, tuple[float, float]]]:
+    """Build index of random buildings, some around the antimeridian."""
+    rng = random.Random(7)
+    points = {
+        id_: (rng.uniform(-180.0, 180.0), rng.uniform(-85.0, 85.0))
+        for id_ in range(1, 2001)
+    }
+    points.update(
+        {
+            id_: (rng.uniform(179.0, 180.0), rng.uniform(-1.0, 1.0))
+            for id_ in range(2001, 2101)
+        }
+    )
+    points.update(
+        {
+            id_: (rng.uniform(-180.0, -179.0), rng.uniform(-1.0, 1.0))
+            for id_ in range(2101, 2201)
+        }
+    )
+    index = SpatialIndex()
+    await index.load(
+        list(points),
+        [lon for lon, _ in points.values()],
+        [lat for _, lat in points.values()],
+    )
+    return index, points
+
+
+async def test_index_not_ready_until_loaded() -> None:
+    """Test queries fail before the first refresh."""
+    index = SpatialIndex()
+
+    assert not index.ready
+    assert len(index) == 0
+    with pytest.raises(RuntimeError):
+        index.in_rectangle((0.0, 1.0, 0.0, 1.0))
+    with pytest.raises(RuntimeError):
+        index.in_radius((0.0, 0.0), 1000.0)
+
+
+async def test_rectangle_matches_brute_force(
+    buildings: tuple[SpatialIndex, dict[int, tuple[float, float]]],
+) -> None:
+    """Test rectangle filter returns exactly the covered buildings."""
+    index, points = buildings
+    bounds = (-30.0, 40.0, -10.0, 50.0)
+
+    expected = {
+        id_
+        for id_, (lon, lat) in points.items()
+        if bounds[0] <= lon <= bounds[1] and bounds[2] <= lat <= bounds[3]
+    }
+
+    assert index.ready
+    assert len(index) == len(points)
+    assert set(index.in_rectangle(bounds)) == expected
+
+
+@pytest.mark.parametrize(
+    "point, radius",
+    [
+        ((37.6, 55.7), 1_500_000.0),
+        ((0.0, 0.0), 300_000.0),
+        ((179.9, 0.0), 100_000.0),
+        ((-179.9, 0.5), 100_000.0),
+        ((10.0, 84.0), 800_000.0),
+    ],
+)
+async def test_radius_matches_brute_force(
+    buildings: tuple[SpatialIndex, dict[int, tuple[float, float]]],
+    point: tuple[float, float],
+    radius: float,
+) -> None:
+    """Test radius filter returns exactly the buildings within it."""
+    index, points = buildings
+
+    expected = {
+        id_ for id_, xy in points.items() if haversine(point, xy) <= radius
+    }
+
+    assert expected
+    assert set(index.in_radius(point, radius)) == expected
+
+
+def test_radius_boxes_split_on_antimeridian() -> None:
+    """Test boxes wrap around the antimeridian and span the poles."""
+    assert len(radius_boxes((179.9, 0.0), 100_000.0)) == 2
+    assert len(radius_boxes((-179.9, 0.0), 100_000.0)) == 2
+    assert len(radius_boxes((0.0, 0.0), 100_000.0)) == 1
+
+    (polar,) = radius_boxes((0.0, 89.9), 100_000.0)
+    min_lon, _, max_lon, max_lat = polar.bounds
+    assert (min_lon, max_lon, max_lat) == (-180.0, 180.0, 90.0)